@@ -5,11 +5,503 @@ Designed to be flexible for future expansion beyond stock selection.
 """
 
 from typing import Dict, List, Optional, Tuple
+import bisect
+import io
+import math
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
 
+# Bucket thresholds for generate_stock_insight, paired with one template per bucket.
+# Templates are stored as bound str.format callables so format specs are parsed once.
+# Optional metrics end with an empty template so a missing value maps to bucket -1.
+# Scores and volume ratios use inclusive lower bounds (bisect_right).
+_SCORE_CUTS = (70.0, 80.0, 90.0)
+_SCORE_TPLS = tuple(template.format for template in (
+    "**⚠️ Moderate Potential**: {symbol} has a score of **{score:.1f}/100**. This suggests the stock may require more careful evaluation or waiting for improved market conditions before considering an investment.",
+    "**📊 Solid Choice**: {symbol} shows promising characteristics with a score of **{score:.1f}/100**. While not exceptional, it demonstrates enough positive signals to warrant monitoring for potential entry points.",
+    "**✅ Strong Candidate**: {symbol} presents a solid investment opportunity with a score of **{score:.1f}/100**. The technical analysis suggests robust fundamentals that align well with quantitative selection criteria.",
+    "**🎯 Excellent Opportunity**: {symbol} demonstrates exceptional quantitative strength with a score of **{score:.1f}/100**. This indicates strong technical fundamentals across multiple indicators, making it a compelling candidate for consideration.",
+))
+
+# RSI neutral band is 40-60 inclusive and the moderate band is (60, 70], so the
+# upper cuts are nudged just above 60/70 to keep bisect_right semantics.
+_RSI_CUTS = (30.0, 40.0, math.nextafter(60.0, math.inf), math.nextafter(70.0, math.inf))
+_RSI_TPLS = tuple(template.format for template in (
+    "• **RSI ({rsi:.1f})**: The stock is significantly oversold, which historically presents buying opportunities. However, ensure this isn't due to fundamental issues. Consider this a potential entry point for contrarian investors.",
+    "• **RSI ({rsi:.1f})**: Approaching oversold territory, suggesting the stock may be undervalued relative to recent momentum. This could indicate a favorable entry opportunity.",
+    "• **RSI ({rsi:.1f})**: In a healthy neutral range, indicating balanced market sentiment. This suggests the stock isn't overextended in either direction, providing a stable foundation for investment.",
+    "• **RSI ({rsi:.1f})**: Showing moderate bullish momentum. While positive, be cautious of potential overbought conditions. Consider waiting for a slight pullback for better entry prices.",
+    "• **RSI ({rsi:.1f})**: The stock appears overbought, suggesting recent gains may be unsustainable short-term. **Recommendation**: Wait for a pullback to more reasonable levels before entering.",
+    "",  # missing metric (bucket -1)
+))
+# Entry-price RSI adjustment per _RSI_CUTS bucket (calculate_suggested_buy_price):
+# oversold and overbought stocks wait for a lower entry, missing RSI adds none
+_RSI_BUY_ADJUSTMENTS = (-0.03, -0.015, 0.0, 0.0, -0.05, 0.0)
+
+# Momentum buckets (as fractions, formatted with :.2%) use strict lower bounds (bisect_left).
+_MOMENTUM_CUTS = (0.0, 0.05, 0.10)
+_MOMENTUM_TPLS = tuple(template.format for template in (
+    "• **Momentum ({momentum:.2%})**: Negative momentum suggests the stock may need time to stabilize. **Recommendation**: Exercise patience and wait for clear reversal signals before considering entry.",
+    "• **Momentum (+{momentum:.2%})**: Modest positive momentum indicates slight upward pressure. While encouraging, the trend may need additional confirmation through volume and price action before committing.",
+    "• **Momentum (+{momentum:.2%})**: Healthy positive momentum suggests the stock is gaining traction. This could signal the early stages of a favorable trend, making it worth monitoring closely.",
+    "• **Momentum (+{momentum:.2%})**: Strong positive momentum over the past 20 days indicates sustained buying interest. This suggests institutional confidence and potential trend continuation, though be mindful of potential exhaustion at these levels.",
+    "",  # missing metric (bucket -1)
+))
+
+_VOLUME_CUTS = (0.8, 1.2, 1.5)
+_VOLUME_TPLS = tuple(template.format for template in (
+    "• **Volume ({volume_ratio:.2f}x average)**: Below-average volume may indicate lack of strong conviction in recent price movements. **Recommendation**: Wait for volume confirmation to validate any potential entry signals.",
+    "• **Volume ({volume_ratio:.2f}x average)**: Normal trading volume indicates steady market participation. While not exceptional, this level of activity provides adequate liquidity for most investors.",
+    "• **Volume ({volume_ratio:.2f}x average)**: Above-average volume suggests increased market attention and confirms recent price action. This is a positive sign that the stock is attracting investor interest.",
+    "• **Volume ({volume_ratio:.2f}x average)**: Exceptional trading volume indicates strong institutional interest and validates recent price movements. This high volume provides confidence that the current trend is supported by real buying pressure.",
+    "",  # missing metric (bucket -1)
+))
+
+
+# Price-band templates indexed by (price > 200) - (price < 50): moderate, premium, accessible.
+_PRICE_TPLS = tuple(template.format for template in (
+    "• **Price (${current_price:.2f})**: Moderate price point providing flexibility for various portfolio sizes.",
+    "• **Price (${current_price:.2f})**: Premium price point typically associated with established companies. May appeal to institutional investors but requires larger capital allocation.",
+    "• **Price (${current_price:.2f})**: Accessible price point suitable for smaller portfolios while maintaining good liquidity.",
+))
+
+
+# Market cap and volatility buckets use strict lower bounds (bisect_left).
+_MARKET_CAP_CUTS = (10_000_000_000, 200_000_000_000)
+_MARKET_CAP_TPLS = tuple(template.format for template in (
+    "• **Market Cap (${market_cap_b:.1f}B)**: Smaller market cap may offer higher growth potential but with increased volatility and risk.",
+    "• **Market Cap (${market_cap_b:.1f}B)**: Mid to large-cap stock offering a balance between growth potential and stability.",
+    "• **Market Cap (${market_cap_b:.1f}B)**: Large-cap stock providing stability and liquidity. Typically less volatile but may have slower growth potential.",
+))
+
+_VOLATILITY_CUTS = (2.5, 4.0)
+_VOLATILITY_TPLS = tuple(template.format for template in (
+    "• **Volatility ({vol_pct:.2f}%)**: Low volatility indicates stable price action, suitable for conservative investors seeking lower-risk opportunities.",
+    "• **Volatility ({vol_pct:.2f}%)**: Moderate volatility suggests reasonable price stability. This level is manageable for most investors with standard risk management practices.",
+    "• **Volatility ({vol_pct:.2f}%)**: High volatility indicates significant price swings. This requires a higher risk tolerance and proper position sizing. Consider using stop-loss orders to manage risk.",
+))
+_VOLATILITY_UNKNOWN = "• **Volatility**: Unable to assess volatility from available data. Consider this in your risk evaluation."
+
+# Closing statement indexed by score bucket >= 2 (score >= 80)
+_BOTTOM_LINE_TPLS = tuple(template.format for template in (
+    "\n**💡 Bottom Line**: While {symbol} shows some positive signals, consider waiting for stronger confirmation or exploring other opportunities. Remember, quantitative analysis is one tool—combine it with fundamental analysis and your investment goals.",
+    "\n**💡 Bottom Line**: {symbol} presents a strong quantitative case with multiple positive technical indicators. However, always complement this analysis with fundamental research, consider your risk tolerance, and ensure it aligns with your overall investment strategy.",
+))
+
+# Whole insight for a stock without price history (no indicators to analyze)
+_NO_DATA_INSIGHT = "**ℹ️ Limited Data**: {symbol} has a score of **{score:.1f}/100**, but no price history is available for a full technical analysis. Revisit this stock once historical data has loaded.".format
+
+# Portfolio insight sentences
+_PORTFOLIO_SUMMARY = "**Portfolio Analysis**: The current selection includes {total_stocks} qualified stocks with an average score of {avg_score:.1f}/100.".format
+# Selection quality indexed by the _SCORE_CUTS bucket of the average score (90+ shares the 80+ text)
+_PORTFOLIO_QUALITY = (
+    "The current selection reflects moderate opportunities. Consider tightening filters or waiting for better market conditions.",
+    "The selection shows solid quality, suggesting favorable market conditions for quantitative strategies.",
+    "The overall quality is exceptional, indicating a strong market environment with numerous high-quality opportunities.",
+)
+# Risk sentence indexed by whether more than 30% of the selection is highly volatile
+_PORTFOLIO_RISK = (
+    "**Risk Assessment**: The selection shows generally moderate volatility levels, suitable for most risk profiles.",
+    "**Risk Note**: A significant portion of selected stocks show elevated volatility. Consider position sizing and risk management strategies.",
+)
+_PORTFOLIO_NO_STOCKS = "No stocks available for analysis."
+_PORTFOLIO_SIGNALS = "**Trading Signals**: {buy_signals} stocks ({buy_share:.1%}) show BUY signals, indicating active opportunities in the current market.".format
+_PORTFOLIO_SECTOR = "**Sector Focus**: The {top_sector} sector dominates the selection with {top_count} stocks, suggesting sector-specific strength or opportunities.".format
+
+# Market sentiment
+# Distinct selections whose sentiment text each AIInsights instance keeps
+_SENTIMENT_CACHE_SIZE = 32
+_SENTIMENT_NO_DATA = "Insufficient data for sentiment analysis."
+
+# Sentiment headline tiers as (minimum average score, BUY share to exceed, headline), checked
+# in order; the last tier always matches
+_SENTIMENT_TIERS = (
+    (80.0, 0.5, "🟢 **Bullish**: Market conditions are highly favorable. Strong quantitative scores and numerous BUY signals suggest a robust market environment with multiple high-quality opportunities."),
+    (70.0, 0.3, "🟡 **Moderately Bullish**: Market shows positive characteristics with solid opportunities. While not exceptional, there are worthwhile investments available."),
+    (60.0, -1.0, "⚪ **Neutral**: Market conditions are mixed. Exercise caution and be selective in stock choices."),
+    (-math.inf, -1.0, "🔴 **Cautious**: Market conditions are challenging. Consider waiting for better opportunities or tightening selection criteria."),
+)
+_SENTIMENT_REPORT = (
+    "**Market Sentiment Analysis**:\n\n"
+    "{headline}\n"
+    "**Key Metrics**:\n"
+    "- {high_scores}/{total} stocks ({high_pct:.1f}%) show exceptional scores (≥80)\n"
+    "- {buy_signals}/{total} stocks ({buy_pct:.1f}%) have BUY signals\n"
+    "- Average score: {avg_score:.1f}/100\n"
+).format
+
+
+# Entry-price multipliers per strategy preset (calculate_suggested_buy_price)
+_BUY_PRICE_MULTIPLIERS = {
+    'Conservative': 0.94,  # Wait for 6% discount - more patient entry
+    'Default': 0.98,  # Slight discount preferred
+    'Aggressive': 1.01,  # Can enter at or slightly above - capture momentum
+    'Momentum': 1.02,  # Momentum strategy, enter quickly
+    'Value': 0.92,  # Value strategy, wait for significant discount
+    'Dividend Focus': 0.96  # Slight discount preferred for dividend stocks
+}
+
+# Support levels considered by calculate_suggested_buy_price, in display order
+_SUPPORT_NAMES = ('SMA 20', 'SMA 50', 'Bollinger Lower', 'Recent Low')
+
+# Sell-target multipliers per strategy preset (calculate_sell_targets)
+_SELL_TARGET_MULTIPLIERS = {
+    'Conservative': 0.75,  # 25% lower targets - take profits earlier
+    'Default': 1.0,  # No adjustment
+    'Aggressive': 1.3,  # 30% higher targets - aim for bigger gains
+    'Momentum': 1.4,  # 40% higher targets - ride the momentum
+    'Value': 0.9,  # Slightly lower - value investing patience
+    'Dividend Focus': 0.85  # Lower targets - focus on dividends
+}
+
+# Hold-time multipliers per strategy preset (calculate_sell_targets)
+_HOLD_TIME_MULTIPLIERS = {
+    'Conservative': 1.5,  # Hold 50% longer - more patient
+    'Default': 1.0,  # No adjustment
+    'Aggressive': 0.7,  # Hold 30% shorter - quick gains
+    'Momentum': 0.6,  # Hold 40% shorter - capture momentum quickly
+    'Value': 2.0,  # Hold 2x longer - value investing patience
+    'Dividend Focus': 1.8  # Hold longer for dividend accumulation
+}
+
+# Sell strategy label per strategy preset
+_SELL_STRATEGY_LABELS = {
+    'Conservative': 'Conservative',
+    'Default': 'Moderate',
+    'Aggressive': 'Aggressive',
+    'Momentum': 'Aggressive',
+    'Value': 'Conservative',
+    'Dividend Focus': 'Conservative'
+}
+
+# Sector context used by generate_stock_insight
+_SECTOR_INSIGHTS = {
+    'Technology': 'Technology stocks are sensitive to innovation cycles and market sentiment. Consider broader tech sector trends and regulatory environment.',
+    'Healthcare': 'Healthcare stocks often provide defensive characteristics but can be volatile around regulatory news and clinical trial results.',
+    'Financial Services': 'Financial stocks are closely tied to interest rates and economic conditions. Monitor macroeconomic indicators.',
+    'Consumer Cyclical': 'Consumer stocks reflect economic health and consumer confidence. Consider economic cycles and spending trends.',
+    'Consumer Defensive': 'Defensive stocks typically provide stability during market uncertainty but may have slower growth.',
+    'Energy': 'Energy stocks are highly correlated with commodity prices and geopolitical factors. Monitor oil prices and supply dynamics.',
+    'Communication Services': 'Communication stocks benefit from digital transformation trends but face regulatory scrutiny.'
+}
+_DEFAULT_SECTOR_INSIGHT = 'The {sector} sector has unique characteristics that should be considered in your investment decision.'
+
+
+@lru_cache(maxsize=128)
+def _sector_line(sector: str) -> str:
+    """Build the market-context sentence for a sector (cached, sectors repeat across a watchlist)."""
+    sector_advice = _SECTOR_INSIGHTS.get(sector) or _DEFAULT_SECTOR_INSIGHT.format(sector=sector)
+    return f"• **Sector ({sector})**: {sector_advice}"
+
+
+# Field extraction in C (map over itemgetter) for the column-building paths
+_get_score = itemgetter('score')
+_get_score_and_signal = itemgetter('score', 'buy_signal')
+
+
+def _as_float(value: Optional[float]) -> float:
+    """Normalize an optional metric to a float, using NaN as the missing sentinel."""
+    return math.nan if value is None else value
+
+
+def _notna(value) -> bool:
+    """Scalar stand-in for pd.notna on the float-or-None values of a latest-row dict."""
+    # NaN is the only float that compares unequal to itself
+    return value is not None and value == value
+
+
+def _classify(value: Optional[float], cuts: Tuple[float, ...], strict: bool = False) -> int:
+    """
+    Bucket index of an optional metric within ascending cut points, or -1 when it is missing.
+    
+    Lower bounds are inclusive (bisect_right) unless strict is set (bisect_left).
+    None and NaN both count as missing.
+    """
+    if value is None or value != value:
+        return -1
+    return (bisect.bisect_left if strict else bisect.bisect_right)(cuts, value)
+
+
+def _latest(stock: Dict) -> Dict:
+    """
+    Latest indicator row of a stock as a plain dict (empty if the stock has no data).
+    
+    StockSelector stores this snapshot under 'latest' at ingest. Stocks built
+    elsewhere get it taken here once and memoized under the same key, so every
+    method (and every AIInsights instance) that looks at the same stock pays for
+    a single iloc[-1].
+    """
+    row = stock.get('latest')
+    if row is None:
+        data = stock.get('data')
+        row = {} if data is None or data.empty else data.iloc[-1].to_dict()
+        stock['latest'] = row
+    return row
+
+
+def _reason_pair(short: str, detailed: str) -> Tuple:
+    """Bind a (short, detailed) pair of reasoning templates to their str.format methods."""
+    return short.format, detailed.format
+
+
+# generate_recommendation reasoning, indexed by the bands from _quantize_recommendation.
+# Entries are (short reason, detailed reason) format callables; None adds no line.
+_RISK_REASONS = (
+    None,
+    "Low volatility ({volatility:.2%}) indicates stable price action, suitable for risk-averse investors.".format,
+    "Moderate volatility ({volatility:.2%}) suggests manageable risk with standard risk management practices.".format,
+    "High volatility ({volatility:.2%}) indicates significant price swings. This requires careful risk management and position sizing.".format,
+)
+_SIGNAL_REASONS = (
+    _reason_pair(
+        "⏸️ HOLD - Waiting for stronger signals",
+        "While the stock shows some positive characteristics, the technical indicators haven't aligned strongly enough to generate a clear BUY signal. Consider monitoring for improved entry conditions."
+    ),
+    _reason_pair(
+        "✅ Strong BUY signal from technical analysis",
+        "Multiple technical indicators align to suggest a favorable entry point. The combination of RSI, moving averages, MACD, and momentum creates a compelling technical case."
+    ),
+)
+_SCORE_REASONS = (
+    _reason_pair(
+        "⚠️ Lower quantitative score ({score:.1f}/100)",
+        "The score of {score:.1f}/100 indicates weaker technical signals. Consider waiting for improved conditions or exploring other opportunities."
+    ),
+    _reason_pair(
+        "📊 Solid quantitative score ({score:.1f}/100)",
+        "The score of {score:.1f}/100 shows decent technical fundamentals, though not exceptional. This suggests moderate opportunity with room for improvement."
+    ),
+    _reason_pair(
+        "⭐ Exceptional quantitative score ({score:.1f}/100)",
+        "The high score of {score:.1f}/100 indicates strong performance across multiple quantitative factors including momentum, RSI, moving averages, MACD, and volume. This suggests a high-quality opportunity."
+    ),
+)
+_RSI_REASONS = (
+    None,
+    _reason_pair(
+        "📈 RSI ({rsi:.1f}) suggests favorable entry",
+        "RSI of {rsi:.1f} is in the optimal range for entry, indicating the stock is not overbought and may have room for upward movement."
+    ),
+    _reason_pair(
+        "⚠️ RSI ({rsi:.1f}) indicates overbought conditions",
+        "RSI of {rsi:.1f} suggests the stock may be overextended. Consider waiting for a pullback to more reasonable levels."
+    ),
+)
+_MOMENTUM_REASONS = (
+    None,
+    _reason_pair(
+        "🚀 Strong momentum ({momentum:.2%})",
+        "Positive momentum of {momentum:.2%} indicates sustained buying interest and potential trend continuation."
+    ),
+    _reason_pair(
+        "📉 Negative momentum ({momentum:.2%})",
+        "Negative momentum suggests the stock may need time to stabilize. Exercise patience and wait for reversal signals."
+    ),
+)
+_VOLUME_REASONS = (
+    None,
+    _reason_pair(
+        "📊 High volume ({volume_ratio:.2f}x) confirms interest",
+        "Above-average volume ({volume_ratio:.2f}x) validates recent price movements and indicates strong market participation."
+    ),
+)
+
+# Time horizon (label, detailed reason) by suggested hold months: <= 2, <= 6, longer (bisect_left)
+_HORIZON_CUTS = (2, 6)
+_HORIZON_TPLS = (
+    _reason_pair(
+        "Short-term ({days} days / ~{months:.1f} months)",
+        "Strong momentum suggests potential for near-term gains. Suggested hold period: {days} days (~{months:.1f} months)."
+    ),
+    _reason_pair(
+        "Medium-term ({days} days / ~{months:.1f} months)",
+        "Moderate momentum indicates steady growth potential. Suggested hold period: {days} days (~{months:.1f} months)."
+    ),
+    _reason_pair(
+        "Long-term ({days} days / ~{months:.1f} months)",
+        "Lower momentum suggests longer holding period for value appreciation. Suggested hold period: {days} days (~{months:.1f} months)."
+    ),
+)
+
+# generate_recommendation summary sections
+_ACTION_EMOJIS = ("⏸️", "✅")  # indexed by buy signal
+_CONFIDENCE_EMOJIS = {'High': "🟢", 'Medium': "🟡", 'Low': "🔴"}
+_SUMMARY_HEADER = (
+    "{action_emoji} **{action}** {symbol} with {confidence_emoji} **{confidence} confidence**"
+    "\n\n**Risk Level**: {risk_level}"
+    "\n**Suggested Hold Time**: {time_horizon}"
+).format
+_SUMMARY_SELL_TARGETS = (
+    "\n\n**💰 Sell Targets:**"
+    "\n- **Target Sell Price**: ${target_sell_price:.2f} (+{potential_gain_pct:.1f}%)"
+    "\n- **Conservative Target**: ${conservative_target:.2f} (+{conservative_gain_pct:.1f}%)"
+    "\n- **Aggressive Target**: ${aggressive_target:.2f} (+{aggressive_gain_pct:.1f}%)"
+    "\n- **Stop Loss**: ${stop_loss_price:.2f} (-{stop_loss_pct:.1f}%)"
+    "\n- **Strategy**: {sell_strategy}"
+    "\n- **Reasoning**: {reasoning}"
+).format_map
+_SUMMARY_WHY = "\n\n**Why this recommendation?**\n"
+_SUMMARY_REMEMBER = "\n**💡 Remember**: This is quantitative analysis based on technical indicators. Always complement with fundamental research, consider your risk tolerance, and ensure alignment with your investment goals."
+
+# Numbered list entry shared by the recommendation summary and the score explanation
+_NUMBERED_LINE = "{i}. {text}\n".format
+
+# Contributing-factor texts for explain_score, in display order.
+# Index 3 is a template filled with the RSI value.
+_SCORE_FACTORS = (
+    "Strong momentum (3-12%) contributes significantly to the score",
+    "Positive momentum provides moderate score contribution",
+    "Optimal RSI range (45-65) indicates balanced market sentiment",
+    "RSI of {rsi:.1f} affects the score based on overbought/oversold conditions",
+    "Strong uptrend (price > SMA20 > SMA50) significantly boosts the score",
+    "Price above short-term moving average supports the score",
+    "Bullish MACD crossover adds to the score",
+    "Above-average volume confirms price movements and enhances score",
+)
+# explain_score bands: momentum of 3-12% is strong, RSI of 45-65 is optimal (both inclusive).
+# Momentum buckets map to an index into _SCORE_FACTORS (None adds no factor).
+_EXPLAIN_MOMENTUM_CUTS = (0.0, 0.03, math.nextafter(0.12, math.inf))
+_EXPLAIN_MOMENTUM_FACTORS = (None, 1, 0, 1, None)
+_EXPLAIN_RSI_CUTS = (45.0, math.nextafter(65.0, math.inf))
+_EXPLANATION_HEADER = "**Score Explanation for {symbol} ({score:.1f}/100)**:\n\n".format
+_NO_FACTORS_TEXT = "Score is based on a composite of technical indicators, momentum, and market factors."
+
+
+def _format_score_explanation(symbol: str, score: float, factors: List[str]) -> str:
+    """Render the score explanation header and numbered factor list."""
+    buf = io.StringIO()
+    w = buf.write
+    w(_EXPLANATION_HEADER(symbol=symbol, score=score))
+    if factors:
+        w("Key contributing factors:\n")
+        for i, factor in enumerate(factors, 1):
+            w(_NUMBERED_LINE(i=i, text=factor))
+    else:
+        w(_NO_FACTORS_TEXT)
+    return buf.getvalue()
+
+
+def _recommendation_summary(recommendation: Dict) -> str:
+    """
+    Build the summary text of a recommendation from its labels, sell targets and detailed reasoning.
+    
+    Args:
+        recommendation: Recommendation dictionary assembled by AIInsights._build_recommendation
+    
+    Returns:
+        Summary text
+    """
+    # Build summary with supportive tone
+    buf = io.StringIO()
+    w = buf.write
+    w(_SUMMARY_HEADER(
+        action_emoji=_ACTION_EMOJIS[recommendation['action'] == 'BUY'],
+        confidence_emoji=_CONFIDENCE_EMOJIS[recommendation['confidence']],
+        **recommendation
+    ))
+    
+    # Add sell targets information (the template fields are the sell_targets keys)
+    w(_SUMMARY_SELL_TARGETS(recommendation['sell_targets']))
+    
+    detailed_reasoning = recommendation['detailed_reasoning']
+    if detailed_reasoning:
+        w(_SUMMARY_WHY)
+        for i, reason in enumerate(detailed_reasoning, 1):
+            w(_NUMBERED_LINE(i=i, text=reason))
+    
+    w(_SUMMARY_REMEMBER)
+    return buf.getvalue()
+
+
+# Record layout for flattening many selections in generate_market_sentiment_batch
+_SENTIMENT_RECORD = np.dtype([('score', np.float64), ('buy_signal', np.bool_)])
+
+
+def _format_market_sentiment(total: int, high_scores: int, buy_signals: int, avg_score: float) -> str:
+    """Render the market sentiment report from a selection's aggregates."""
+    # Overall sentiment: first tier whose score and BUY-share floors are both met
+    buy_ratio = buy_signals / total
+    for min_score, min_buy_ratio, headline in _SENTIMENT_TIERS:
+        if avg_score >= min_score and buy_ratio > min_buy_ratio:
+            break
+    
+    # One division shared by both percentages
+    pct_per_stock = 100.0 / total
+    return _SENTIMENT_REPORT(
+        headline=headline,
+        high_scores=high_scores,
+        buy_signals=buy_signals,
+        total=total,
+        high_pct=high_scores * pct_per_stock,
+        buy_pct=buy_signals * pct_per_stock,
+        avg_score=avg_score
+    )
+
+
+# Recommendation bands, indexed by _classify bucket (the trailing entry covers a missing metric).
+# RSI of 30-50 is a favorable entry and above 70 is overbought; momentum above 3% is strong
+# and at or below zero is negative (strict lower bounds).
+_REC_SCORE_CUTS = (60.0, 80.0)
+_REC_RSI_CUTS = (30.0, math.nextafter(50.0, math.inf), math.nextafter(70.0, math.inf))
+_REC_RSI_BANDS = (0, 1, 0, 2, 0)
+_REC_MOMENTUM_CUTS = (0.0, 0.03)
+_REC_MOMENTUM_BANDS = (2, 0, 1, 0)
+
+
+def _quantize_recommendation(
+    score: float,
+    buy_signal: bool,
+    rsi: Optional[float],
+    momentum: Optional[float],
+    volume_ratio: Optional[float],
+    volatility: Optional[float]
+) -> Tuple[int, bool, int, int, bool, int]:
+    """
+    Reduce a stock's recommendation inputs to the discrete bands the decision depends on.
+    
+    Returns:
+        Tuple of (score band, buy signal, RSI band, momentum band, high volume, risk band)
+    """
+    score_band = _classify(score, _REC_SCORE_CUTS)
+    rsi_band = _REC_RSI_BANDS[_classify(rsi, _REC_RSI_CUTS)]
+    # Zero momentum carries no signal either way
+    momentum_band = _REC_MOMENTUM_BANDS[_classify(momentum or None, _REC_MOMENTUM_CUTS, strict=True)]
+    high_volume = _classify(volume_ratio, _VOLUME_CUTS) >= 2
+    if not volatility:
+        risk_band = 0
+    else:
+        risk_band = 3 if volatility > 0.04 else 2 if volatility > 0.025 else 1
+    return score_band, bool(buy_signal), rsi_band, momentum_band, high_volume, risk_band
+
+
+_CONFIDENCE_LABELS = ('Low', 'Medium', 'High')
+_RISK_LABELS = ('Low', 'Low', 'Medium', 'High')
+
+
+def _confidence_code(score_band, buy_signal, rsi_band, momentum_band, high_volume):
+    """
+    Confidence code (0=Low, 1=Medium, 2=High) from recommendation bands.
+    
+    Pure arithmetic, so it evaluates elementwise on NumPy arrays as well as on scalars.
+    """
+    points = (score_band + 1) + 2 * buy_signal + (rsi_band == 1) + (momentum_band == 1) + high_volume
+    return (points >= 4) * 1 + (points >= 6)
+
+
+@lru_cache(maxsize=512)
+def _recommendation_template(features: Tuple[int, bool, int, int, bool, int]) -> Tuple[str, str, str]:
+    """Map quantized recommendation features to (action, confidence, risk level)."""
+    score_band, buy_signal, rsi_band, momentum_band, high_volume, risk_band = features
+    confidence = _CONFIDENCE_LABELS[_confidence_code(score_band, buy_signal, rsi_band, momentum_band, high_volume)]
+    return ('BUY' if buy_signal else 'HOLD'), confidence, _RISK_LABELS[risk_band]
+
+
 class AIInsights:
     """
     AI-powered insights generator for stock analysis.
@@ -18,7 +510,17 @@ class AIInsights:
     
     def __init__(self):
         """Initialize the AI insights generator."""
-        pass
+        # Threshold arrays for np.digitize in batch methods (scalar paths bisect the tuples)
+        self._score_cuts = np.asarray(_SCORE_CUTS)
+        self._rsi_cuts = np.asarray(_RSI_CUTS)
+        self._momentum_cuts = np.asarray(_MOMENTUM_CUTS)
+        self._volume_cuts = np.asarray(_VOLUME_CUTS)
+        # generate_market_sentiment results keyed by the (score, buy_signal) pairs they depend on
+        self._sentiment_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+    
+    def clear_cache(self):
+        """Drop memoized market sentiment results (e.g. to free memory after a data refresh)."""
+        self._sentiment_cache.clear()
     
     def calculate_suggested_buy_price(
         self, 
@@ -48,66 +550,42 @@ class AIInsights:
                 'reasoning': 'Insufficient data for price calculation'
             }
         
-        latest = data.iloc[-1]
-        
-        # Calculate support levels
-        support_levels = []
-        
-        # 1. Moving averages as support
-        sma_20 = latest.get('SMA_20')
-        sma_50 = latest.get('SMA_50')
-        if pd.notna(sma_20):
-            support_levels.append(('SMA 20', sma_20))
-        if pd.notna(sma_50):
-            support_levels.append(('SMA 50', sma_50))
-        
-        # 2. Bollinger Lower Band as support
-        bb_lower = latest.get('BB_Lower')
-        if pd.notna(bb_lower):
-            support_levels.append(('Bollinger Lower', bb_lower))
-        
-        # 3. Recent low (last 20 days)
-        recent_low = data['Low'].tail(20).min()
-        if pd.notna(recent_low):
-            support_levels.append(('Recent Low', recent_low))
+        latest = _latest(stock)
+        
+        # Recent low (last 20 days)
+        # fmin.reduce skips NaN like Series.min, without the pandas tail/reduction overhead
+        recent_lows = data['Low'].to_numpy(dtype=np.float64, copy=False)[-20:]
+        recent_low = np.fmin.reduce(recent_lows) if recent_lows.size else np.nan
+        
+        # Calculate support levels as a fixed-size array parallel to _SUPPORT_NAMES:
+        # 1. moving averages, 2. Bollinger Lower Band, 3. recent low (NaN when unavailable)
+        support_vals = np.array([
+            _as_float(latest.get('SMA_20')),
+            _as_float(latest.get('SMA_50')),
+            _as_float(latest.get('BB_Lower')),
+            recent_low
+        ], dtype=np.float64)
+        has_support = ~np.isnan(support_vals)
+        support_levels = [
+            (name, value)
+            for name, value, present in zip(_SUPPORT_NAMES, support_vals.tolist(), has_support)
+            if present
+        ]
         
         # 4. RSI-based adjustment
-        rsi = stock.get('rsi')
-        rsi_adjustment = 0
-        if rsi is not None:
-            if rsi < 30:  # Oversold - suggest buying below current
-                rsi_adjustment = -0.03  # 3% below
-            elif rsi < 40:
-                rsi_adjustment = -0.015  # 1.5% below
-            elif rsi > 70:  # Overbought - wait for pullback
-                rsi_adjustment = -0.05  # 5% below
+        rsi_adjustment = _RSI_BUY_ADJUSTMENTS[_classify(stock.get('rsi'), _RSI_CUTS)]
         
         # Strategy-based adjustments for entry price
         # Conservative: Wait for better prices (lower entry, more patient)
         # Aggressive: Enter sooner (higher entry, capture momentum)
-        strategy_multipliers = {
-            'Conservative': 0.94,  # Wait for 6% discount - more patient entry
-            'Default': 0.98,  # Slight discount preferred
-            'Aggressive': 1.01,  # Can enter at or slightly above - capture momentum
-            'Momentum': 1.02,  # Momentum strategy, enter quickly
-            'Value': 0.92,  # Value strategy, wait for significant discount
-            'Dividend Focus': 0.96  # Slight discount preferred for dividend stocks
-        }
-        strategy_mult = strategy_multipliers.get(strategy, 0.98)
+        strategy_mult = _BUY_PRICE_MULTIPLIERS.get(strategy, 0.98)
         
         # Calculate suggested price
-        if support_levels:
-            # Use the highest support level (closest to current price but below)
-            valid_supports = [s[1] for s in support_levels if s[1] < current_price]
-            if valid_supports:
-                base_support = max(valid_supports)
-                suggested_price = base_support * strategy_mult * (1 + rsi_adjustment)
-            else:
-                # All supports above current, use current with adjustment
-                suggested_price = current_price * strategy_mult * (1 + rsi_adjustment)
-        else:
-            # No support levels, use current price with adjustments
-            suggested_price = current_price * strategy_mult * (1 + rsi_adjustment)
+        # Use the highest support level below current price (NaN never compares below);
+        # with no such support, use current price with adjustments
+        below_current = support_vals < current_price
+        base_price = float(support_vals[below_current].max()) if below_current.any() else current_price
+        suggested_price = base_price * strategy_mult * (1 + rsi_adjustment)
         
         # Ensure suggested price is reasonable (within 10% of current)
         suggested_price = max(
@@ -117,7 +595,7 @@ class AIInsights:
         
         # Calculate price range (±2-5% depending on volatility)
         volatility = latest.get('Volatility', 0.02)
-        if pd.notna(volatility):
+        if _notna(volatility):
             range_pct = min(max(volatility * 2, 0.02), 0.05)  # 2-5% range
         else:
             range_pct = 0.03  # Default 3%
@@ -128,20 +606,29 @@ class AIInsights:
         # Build reasoning
         reasoning_parts = []
         if support_levels:
-            closest_support = min(support_levels, key=lambda x: abs(x[1] - suggested_price))
-            reasoning_parts.append(f"Based on {closest_support[0]} support level")
+            closest_idx = int(np.nanargmin(np.abs(support_vals - suggested_price)))
+            reasoning_parts.append(f"Based on {_SUPPORT_NAMES[closest_idx]} support level")
         if rsi_adjustment < 0:
-            reasoning_parts.append(f"RSI suggests waiting for {abs(rsi_adjustment)*100:.1f}% pullback")
+            reasoning_parts.append(f"RSI suggests waiting for {-rsi_adjustment:.1%} pullback")
         reasoning_parts.append(f"{strategy} strategy adjustment applied")
         
         reasoning = ". ".join(reasoning_parts) if reasoning_parts else "Based on technical analysis"
         
+        # Round all reported prices in one vectorized call
+        suggested_price, price_range_low, price_range_high, current_price, discount_pct = np.round([
+            suggested_price,
+            price_range_low,
+            price_range_high,
+            current_price,
+            ((current_price - suggested_price) / current_price) * 100
+        ], 2).tolist()
+        
         return {
-            'suggested_price': round(suggested_price, 2),
-            'price_range_low': round(price_range_low, 2),
-            'price_range_high': round(price_range_high, 2),
-            'current_price': round(current_price, 2),
-            'discount_pct': round(((current_price - suggested_price) / current_price) * 100, 2),
+            'suggested_price': suggested_price,
+            'price_range_low': price_range_low,
+            'price_range_high': price_range_high,
+            'current_price': current_price,
+            'discount_pct': discount_pct,
             'reasoning': reasoning,
             'support_levels': support_levels
         }
@@ -156,125 +643,131 @@ class AIInsights:
         Returns:
             AI-generated insight text with comprehensive analysis
         """
+        data = stock.get('data')
+        if data is None or data.empty:
+            return _NO_DATA_INSIGHT(symbol=stock['symbol'], score=stock['score'])
+        
+        g = stock.get
+        
+        # A zero volume ratio means no volume data
+        return self._render_stock_insight(
+            stock,
+            _classify(stock['score'], _SCORE_CUTS),
+            _classify(g('rsi'), _RSI_CUTS),
+            _classify(g('momentum'), _MOMENTUM_CUTS, strict=True),
+            _classify(g('volume_ratio') or None, _VOLUME_CUTS)
+        )
+    
+    def generate_stock_insights_batch(self, stocks: List[Dict]) -> List[str]:
+        """
+        Generate AI-powered insights for many stocks at once.
+        Metric buckets are classified column-wise with NumPy instead of per-stock comparisons.
+        
+        Args:
+            stocks: List of stock dictionaries
+        
+        Returns:
+            List of insight texts, identical to calling generate_stock_insight on each stock
+        """
+        n = len(stocks)
+        if n == 0:
+            return []
+        
+        def column(key: str) -> np.ndarray:
+            return np.fromiter((_as_float(s.get(key)) for s in stocks), dtype=np.float64, count=n)
+        
+        rsi = column('rsi')
+        momentum = column('momentum')
+        volume_ratio = column('volume_ratio')
+        
+        # Missing metrics (NaN, or a zero volume ratio) map to the empty bucket -1
+        score_buckets = np.digitize(column('score'), self._score_cuts)
+        rsi_buckets = np.where(np.isnan(rsi), -1, np.digitize(rsi, self._rsi_cuts))
+        momentum_buckets = np.where(
+            np.isnan(momentum), -1, np.digitize(momentum, self._momentum_cuts, right=True)
+        )
+        volume_buckets = np.where(
+            np.isnan(volume_ratio) | (volume_ratio == 0), -1, np.digitize(volume_ratio, self._volume_cuts)
+        )
+        
+        return [
+            self._render_stock_insight(stock, int(sb), int(rb), int(mb), int(vb))
+            if _latest(stock) else _NO_DATA_INSIGHT(symbol=stock['symbol'], score=stock['score'])
+            for stock, sb, rb, mb, vb in zip(stocks, score_buckets, rsi_buckets, momentum_buckets, volume_buckets)
+        ]
+    
+    def _render_stock_insight(
+        self,
+        stock: Dict,
+        score_bucket: int,
+        rsi_bucket: int,
+        momentum_bucket: int,
+        volume_bucket: int
+    ) -> str:
+        """
+        Assemble the insight text for a stock from its precomputed metric buckets.
+        
+        Args:
+            stock: Stock data dictionary with all metrics
+            score_bucket: Index into _SCORE_TPLS
+            rsi_bucket: Index into _RSI_TPLS (-1 when RSI is missing)
+            momentum_bucket: Index into _MOMENTUM_TPLS (-1 when momentum is missing)
+            volume_bucket: Index into _VOLUME_TPLS (-1 when volume ratio is missing)
+        
+        Returns:
+            AI-generated insight text with comprehensive analysis
+        """
+        g = stock.get
         symbol = stock['symbol']
         score = stock['score']
-        rsi = stock.get('rsi')
-        momentum = stock.get('momentum')
-        volume_ratio = stock.get('volume_ratio', 0)
-        sector = stock.get('sector', 'Unknown')
+        rsi = _as_float(g('rsi'))
+        momentum = _as_float(g('momentum'))
+        volume_ratio = _as_float(g('volume_ratio'))
+        sector = g('sector', 'Unknown')
         current_price = stock['current_price']
-        market_cap = stock.get('market_cap', 0)
-        volatility = None
-        data = stock.get('data')
-        
-        if data is not None and not data.empty:
-            latest = data.iloc[-1]
-            volatility = latest.get('Volatility', None)
+        market_cap = g('market_cap', 0)
+        volatility = _latest(stock).get('Volatility', None)
         
-        # Build comprehensive insight with supportive tone
-        insights = []
+        # Build comprehensive insight with supportive tone; one slot per section line,
+        # optional metrics leave their slot empty
+        insights = [""] * 12
         
         # Opening statement - supportive and clear
-        if score >= 90:
-            insights.append(f"**🎯 Excellent Opportunity**: {symbol} demonstrates exceptional quantitative strength with a score of **{score:.1f}/100**. This indicates strong technical fundamentals across multiple indicators, making it a compelling candidate for consideration.")
-        elif score >= 80:
-            insights.append(f"**✅ Strong Candidate**: {symbol} presents a solid investment opportunity with a score of **{score:.1f}/100**. The technical analysis suggests robust fundamentals that align well with quantitative selection criteria.")
-        elif score >= 70:
-            insights.append(f"**📊 Solid Choice**: {symbol} shows promising characteristics with a score of **{score:.1f}/100**. While not exceptional, it demonstrates enough positive signals to warrant monitoring for potential entry points.")
-        else:
-            insights.append(f"**⚠️ Moderate Potential**: {symbol} has a score of **{score:.1f}/100**. This suggests the stock may require more careful evaluation or waiting for improved market conditions before considering an investment.")
+        insights[0] = _SCORE_TPLS[score_bucket](symbol=symbol, score=score)
         
         # Technical Analysis Section
-        insights.append("\n**📈 Technical Analysis:**")
-        
-        # RSI analysis with clear explanations
-        if rsi is not None:
-            if rsi < 30:
-                insights.append(f"• **RSI ({rsi:.1f})**: The stock is significantly oversold, which historically presents buying opportunities. However, ensure this isn't due to fundamental issues. Consider this a potential entry point for contrarian investors.")
-            elif rsi < 40:
-                insights.append(f"• **RSI ({rsi:.1f})**: Approaching oversold territory, suggesting the stock may be undervalued relative to recent momentum. This could indicate a favorable entry opportunity.")
-            elif 40 <= rsi <= 60:
-                insights.append(f"• **RSI ({rsi:.1f})**: In a healthy neutral range, indicating balanced market sentiment. This suggests the stock isn't overextended in either direction, providing a stable foundation for investment.")
-            elif 60 < rsi <= 70:
-                insights.append(f"• **RSI ({rsi:.1f})**: Showing moderate bullish momentum. While positive, be cautious of potential overbought conditions. Consider waiting for a slight pullback for better entry prices.")
-            else:
-                insights.append(f"• **RSI ({rsi:.1f})**: The stock appears overbought, suggesting recent gains may be unsustainable short-term. **Recommendation**: Wait for a pullback to more reasonable levels before entering.")
-        
-        # Momentum analysis with context
-        if momentum is not None:
-            momentum_pct = momentum * 100
-            if momentum_pct > 10:
-                insights.append(f"• **Momentum (+{momentum_pct:.2f}%)**: Strong positive momentum over the past 20 days indicates sustained buying interest. This suggests institutional confidence and potential trend continuation, though be mindful of potential exhaustion at these levels.")
-            elif momentum_pct > 5:
-                insights.append(f"• **Momentum (+{momentum_pct:.2f}%)**: Healthy positive momentum suggests the stock is gaining traction. This could signal the early stages of a favorable trend, making it worth monitoring closely.")
-            elif momentum_pct > 0:
-                insights.append(f"• **Momentum (+{momentum_pct:.2f}%)**: Modest positive momentum indicates slight upward pressure. While encouraging, the trend may need additional confirmation through volume and price action before committing.")
-            else:
-                insights.append(f"• **Momentum ({momentum_pct:.2f}%)**: Negative momentum suggests the stock may need time to stabilize. **Recommendation**: Exercise patience and wait for clear reversal signals before considering entry.")
-        
-        # Volume analysis with market context
-        if volume_ratio:
-            if volume_ratio >= 1.5:
-                insights.append(f"• **Volume ({volume_ratio:.2f}x average)**: Exceptional trading volume indicates strong institutional interest and validates recent price movements. This high volume provides confidence that the current trend is supported by real buying pressure.")
-            elif volume_ratio >= 1.2:
-                insights.append(f"• **Volume ({volume_ratio:.2f}x average)**: Above-average volume suggests increased market attention and confirms recent price action. This is a positive sign that the stock is attracting investor interest.")
-            elif volume_ratio >= 0.8:
-                insights.append(f"• **Volume ({volume_ratio:.2f}x average)**: Normal trading volume indicates steady market participation. While not exceptional, this level of activity provides adequate liquidity for most investors.")
-            else:
-                insights.append(f"• **Volume ({volume_ratio:.2f}x average)**: Below-average volume may indicate lack of strong conviction in recent price movements. **Recommendation**: Wait for volume confirmation to validate any potential entry signals.")
+        insights[1] = "\n**📈 Technical Analysis:**"
+        
+        # RSI, momentum and volume analysis; missing metrics render as empty slots
+        insights[2] = _RSI_TPLS[rsi_bucket](rsi=rsi)
+        insights[3] = _MOMENTUM_TPLS[momentum_bucket](momentum=momentum)
+        insights[4] = _VOLUME_TPLS[volume_bucket](volume_ratio=volume_ratio)
         
         # Market Context Section
-        insights.append("\n**🌐 Market Context:**")
+        insights[5] = "\n**🌐 Market Context:**"
         
         # Sector analysis
-        sector_insights = {
-            'Technology': 'Technology stocks are sensitive to innovation cycles and market sentiment. Consider broader tech sector trends and regulatory environment.',
-            'Healthcare': 'Healthcare stocks often provide defensive characteristics but can be volatile around regulatory news and clinical trial results.',
-            'Financial Services': 'Financial stocks are closely tied to interest rates and economic conditions. Monitor macroeconomic indicators.',
-            'Consumer Cyclical': 'Consumer stocks reflect economic health and consumer confidence. Consider economic cycles and spending trends.',
-            'Consumer Defensive': 'Defensive stocks typically provide stability during market uncertainty but may have slower growth.',
-            'Energy': 'Energy stocks are highly correlated with commodity prices and geopolitical factors. Monitor oil prices and supply dynamics.',
-            'Communication Services': 'Communication stocks benefit from digital transformation trends but face regulatory scrutiny.'
-        }
-        sector_advice = sector_insights.get(sector, f'The {sector} sector has unique characteristics that should be considered in your investment decision.')
-        insights.append(f"• **Sector ({sector})**: {sector_advice}")
+        insights[6] = _sector_line(sector)
         
         # Market cap context
-        if market_cap > 200_000_000_000:  # > $200B
-            insights.append(f"• **Market Cap (${market_cap/1e9:.1f}B)**: Large-cap stock providing stability and liquidity. Typically less volatile but may have slower growth potential.")
-        elif market_cap > 10_000_000_000:  # > $10B
-            insights.append(f"• **Market Cap (${market_cap/1e9:.1f}B)**: Mid to large-cap stock offering a balance between growth potential and stability.")
-        else:
-            insights.append(f"• **Market Cap (${market_cap/1e9:.1f}B)**: Smaller market cap may offer higher growth potential but with increased volatility and risk.")
+        insights[7] = _MARKET_CAP_TPLS[bisect.bisect_left(_MARKET_CAP_CUTS, market_cap)](market_cap_b=market_cap / 1e9)
         
         # Risk Assessment
-        insights.append("\n**⚠️ Risk Considerations:**")
+        insights[8] = "\n**⚠️ Risk Considerations:**"
         if volatility:
             vol_pct = volatility * 100
-            if vol_pct > 4:
-                insights.append(f"• **Volatility ({vol_pct:.2f}%)**: High volatility indicates significant price swings. This requires a higher risk tolerance and proper position sizing. Consider using stop-loss orders to manage risk.")
-            elif vol_pct > 2.5:
-                insights.append(f"• **Volatility ({vol_pct:.2f}%)**: Moderate volatility suggests reasonable price stability. This level is manageable for most investors with standard risk management practices.")
-            else:
-                insights.append(f"• **Volatility ({vol_pct:.2f}%)**: Low volatility indicates stable price action, suitable for conservative investors seeking lower-risk opportunities.")
+            insights[9] = _VOLATILITY_TPLS[bisect.bisect_left(_VOLATILITY_CUTS, vol_pct)](vol_pct=vol_pct)
         else:
-            insights.append("• **Volatility**: Unable to assess volatility from available data. Consider this in your risk evaluation.")
+            insights[9] = _VOLATILITY_UNKNOWN
         
         # Price accessibility
-        if current_price < 50:
-            insights.append(f"• **Price (${current_price:.2f})**: Accessible price point suitable for smaller portfolios while maintaining good liquidity.")
-        elif current_price > 200:
-            insights.append(f"• **Price (${current_price:.2f})**: Premium price point typically associated with established companies. May appeal to institutional investors but requires larger capital allocation.")
-        else:
-            insights.append(f"• **Price (${current_price:.2f})**: Moderate price point providing flexibility for various portfolio sizes.")
+        price_band = (current_price > 200) - (current_price < 50)
+        insights[10] = _PRICE_TPLS[price_band](current_price=current_price)
         
         # Closing supportive statement
-        if score >= 80:
-            insights.append(f"\n**💡 Bottom Line**: {symbol} presents a strong quantitative case with multiple positive technical indicators. However, always complement this analysis with fundamental research, consider your risk tolerance, and ensure it aligns with your overall investment strategy.")
-        else:
-            insights.append(f"\n**💡 Bottom Line**: While {symbol} shows some positive signals, consider waiting for stronger confirmation or exploring other opportunities. Remember, quantitative analysis is one tool—combine it with fundamental analysis and your investment goals.")
+        insights[11] = _BOTTOM_LINE_TPLS[score_bucket >= 2](symbol=symbol)
         
-        return "\n".join(insights)
+        return "\n".join(part for part in insights if part)
     
     def generate_portfolio_insight(self, stocks: List[Dict]) -> str:
         """
@@ -287,48 +780,43 @@ class AIInsights:
             AI-generated portfolio insight
         """
         if not stocks:
-            return "No stocks available for analysis."
+            return _PORTFOLIO_NO_STOCKS
         
         total_stocks = len(stocks)
-        avg_score = sum(s['score'] for s in stocks) / total_stocks
-        buy_signals = sum(1 for s in stocks if s.get('buy_signal', False))
         
-        # Sector distribution
-        sectors = {}
-        for stock in stocks:
-            sector = stock.get('sector', 'Unknown')
-            sectors[sector] = sectors.get(sector, 0) + 1
+        # Single fused pass over the selection
+        total_score = 0.0
+        buy_signals = 0
+        high_volatility_count = 0
+        sectors = Counter()
+        for s in stocks:
+            g = s.get
+            total_score += s['score']
+            if g('buy_signal', False):
+                buy_signals += 1
+            if _latest(s).get('Volatility', 0) > 0.04:
+                high_volatility_count += 1
+            sectors[g('sector', 'Unknown')] += 1
+        avg_score = total_score / total_stocks
         
-        top_sector = max(sectors.items(), key=lambda x: x[1])[0] if sectors else "N/A"
+        # Sector distribution
+        top_sector, top_count = sectors.most_common(1)[0]
         
-        insights = []
+        insights = [""] * 5
         
-        insights.append(f"**Portfolio Analysis**: The current selection includes {total_stocks} qualified stocks with an average score of {avg_score:.1f}/100.")
+        insights[0] = _PORTFOLIO_SUMMARY(total_stocks=total_stocks, avg_score=avg_score)
         
-        if avg_score >= 80:
-            insights.append("The overall quality is exceptional, indicating a strong market environment with numerous high-quality opportunities.")
-        elif avg_score >= 70:
-            insights.append("The selection shows solid quality, suggesting favorable market conditions for quantitative strategies.")
-        else:
-            insights.append("The current selection reflects moderate opportunities. Consider tightening filters or waiting for better market conditions.")
+        insights[1] = _PORTFOLIO_QUALITY[min(_classify(avg_score, _SCORE_CUTS), 2)]
         
         if buy_signals > 0:
-            buy_pct = (buy_signals / total_stocks) * 100
-            insights.append(f"**Trading Signals**: {buy_signals} stocks ({buy_pct:.1f}%) show BUY signals, indicating active opportunities in the current market.")
+            insights[2] = _PORTFOLIO_SIGNALS(buy_signals=buy_signals, buy_share=buy_signals / total_stocks)
         
-        insights.append(f"**Sector Focus**: The {top_sector} sector dominates the selection with {sectors.get(top_sector, 0)} stocks, suggesting sector-specific strength or opportunities.")
+        insights[3] = _PORTFOLIO_SECTOR(top_sector=top_sector, top_count=top_count)
         
         # Risk assessment
-        high_volatility_count = sum(1 for s in stocks if s.get('data') is not None and 
-                                   not s['data'].empty and 
-                                   s['data'].iloc[-1].get('Volatility', 0) > 0.04)
+        insights[4] = _PORTFOLIO_RISK[high_volatility_count > total_stocks * 0.3]
         
-        if high_volatility_count > total_stocks * 0.3:
-            insights.append("**Risk Note**: A significant portion of selected stocks show elevated volatility. Consider position sizing and risk management strategies.")
-        else:
-            insights.append("**Risk Assessment**: The selection shows generally moderate volatility levels, suitable for most risk profiles.")
-        
-        return " ".join(insights)
+        return " ".join(part for part in insights if part)
     
     def calculate_sell_targets(
         self, 
@@ -364,7 +852,7 @@ class AIInsights:
                 'sell_strategy': 'Conservative'
             }
         
-        latest = data.iloc[-1]
+        latest = _latest(stock)
         momentum = stock.get('momentum', 0)
         rsi = stock.get('rsi')
         volatility = latest.get('Volatility', 0.02)
@@ -375,20 +863,21 @@ class AIInsights:
         
         # 1. Bollinger Upper Band as resistance
         bb_upper = latest.get('BB_Upper')
-        if pd.notna(bb_upper) and bb_upper > current_price:
+        if _notna(bb_upper) and bb_upper > current_price:
             resistance_levels.append(('Bollinger Upper', bb_upper))
         
         # 2. Moving averages as potential targets
         sma_20 = latest.get('SMA_20')
         sma_50 = latest.get('SMA_50')
-        if pd.notna(sma_20) and sma_20 > current_price:
+        if _notna(sma_20) and sma_20 > current_price:
             resistance_levels.append(('SMA 20', sma_20))
-        if pd.notna(sma_50) and sma_50 > current_price:
+        if _notna(sma_50) and sma_50 > current_price:
             resistance_levels.append(('SMA 50', sma_50))
         
         # 3. Recent high (last 60 days) as resistance
         if len(data) >= 60:
-            recent_high = data['High'].tail(60).max()
+            # fmax.reduce skips NaN like Series.max, without the pandas tail/reduction overhead
+            recent_high = np.fmax.reduce(data['High'].to_numpy(dtype=np.float64, copy=False)[-60:])
             if recent_high > current_price:
                 resistance_levels.append(('Recent High', recent_high))
         
@@ -414,15 +903,7 @@ class AIInsights:
         # Strategy-based target adjustments
         # Conservative: Lower targets (take profits earlier, reduce risk)
         # Aggressive: Higher targets (hold for bigger gains)
-        strategy_target_multipliers = {
-            'Conservative': 0.75,  # 25% lower targets - take profits earlier
-            'Default': 1.0,  # No adjustment
-            'Aggressive': 1.3,  # 30% higher targets - aim for bigger gains
-            'Momentum': 1.4,  # 40% higher targets - ride the momentum
-            'Value': 0.9,  # Slightly lower - value investing patience
-            'Dividend Focus': 0.85  # Lower targets - focus on dividends
-        }
-        target_multiplier = strategy_target_multipliers.get(strategy, 1.0)
+        target_multiplier = _SELL_TARGET_MULTIPLIERS.get(strategy, 1.0)
         base_target_pct *= target_multiplier
         
         # Adjust for volatility (higher volatility = wider targets)
@@ -526,15 +1007,7 @@ class AIInsights:
         # Strategy-based hold time adjustments
         # Conservative: Hold longer (patience, let value compound)
         # Aggressive: Hold shorter (quick gains, capture momentum)
-        strategy_hold_multipliers = {
-            'Conservative': 1.5,  # Hold 50% longer - more patient
-            'Default': 1.0,  # No adjustment
-            'Aggressive': 0.7,  # Hold 30% shorter - quick gains
-            'Momentum': 0.6,  # Hold 40% shorter - capture momentum quickly
-            'Value': 2.0,  # Hold 2x longer - value investing patience
-            'Dividend Focus': 1.8  # Hold longer for dividend accumulation
-        }
-        hold_multiplier = strategy_hold_multipliers.get(strategy, 1.0)
+        hold_multiplier = _HOLD_TIME_MULTIPLIERS.get(strategy, 1.0)
         
         suggested_days = int(base_days * hold_multiplier)
         suggested_months = round(suggested_days / 30, 1)
@@ -548,29 +1021,17 @@ class AIInsights:
             suggested_months = max(suggested_months, 1.0)
         
         # Determine sell strategy based on user selection
-        # Map strategy names to sell strategy labels
-        strategy_mapping = {
-            'Conservative': 'Conservative',
-            'Default': 'Moderate',
-            'Aggressive': 'Aggressive',
-            'Momentum': 'Aggressive',
-            'Value': 'Conservative',
-            'Dividend Focus': 'Conservative'
-        }
-        
         # Use selected strategy from mapping, default to 'Moderate' if not found
-        sell_strategy = strategy_mapping.get(strategy, 'Moderate')
+        sell_strategy = _SELL_STRATEGY_LABELS.get(strategy, 'Moderate')
         
         # Build reasoning
         reasoning_parts = []
         if resistance_levels:
             reasoning_parts.append(f"Target based on {resistance_name} resistance level")
         else:
-            reasoning_parts.append(f"Target calculated from momentum ({momentum*100:.1f}%) and volatility ({volatility*100:.2f}%)")
+            reasoning_parts.append(f"Target calculated from momentum ({momentum:.1%}) and volatility ({volatility:.2%})")
         
         # Add strategy-specific reasoning
-        entry_discount_pct = ((current_price - entry_price) / current_price) * 100 if entry_price < current_price else 0
-        
         if strategy == 'Conservative':
             reasoning_parts.append(f"{strategy} strategy: Lower entry price (waiting for better prices), longer hold ({suggested_days} days) for steady gains")
         elif strategy == 'Aggressive' or strategy == 'Momentum':
@@ -586,21 +1047,26 @@ class AIInsights:
         
         reasoning = ". ".join(reasoning_parts) if reasoning_parts else "Based on technical analysis"
         
+        # Round prices (2 decimals) and percentages (1 decimal) in two vectorized calls
+        prices = np.round([target_sell_price, stop_loss_price, conservative_target, aggressive_target, entry_price], 2)
+        gain_pcts = ((np.array([target_sell_price, conservative_target, aggressive_target]) - entry_price) / entry_price) * 100
+        pcts = np.round(np.append(gain_pcts, [suggested_months, stop_loss_pct * 100]), 1)
+        
         return {
-            'target_sell_price': round(target_sell_price, 2),
-            'stop_loss_price': round(stop_loss_price, 2),
-            'conservative_target': round(conservative_target, 2),
-            'aggressive_target': round(aggressive_target, 2),
+            'target_sell_price': float(prices[0]),
+            'stop_loss_price': float(prices[1]),
+            'conservative_target': float(prices[2]),
+            'aggressive_target': float(prices[3]),
             'suggested_hold_days': int(suggested_days),
-            'suggested_hold_months': round(suggested_months, 1),
+            'suggested_hold_months': float(pcts[3]),
             'suggested_hold_weeks': int(suggested_days / 7),
-            'potential_gain_pct': round(((target_sell_price - entry_price) / entry_price) * 100, 1),
-            'conservative_gain_pct': round(((conservative_target - entry_price) / entry_price) * 100, 1),
-            'aggressive_gain_pct': round(((aggressive_target - entry_price) / entry_price) * 100, 1),
-            'stop_loss_pct': round(stop_loss_pct * 100, 1),
+            'potential_gain_pct': float(pcts[0]),
+            'conservative_gain_pct': float(pcts[1]),
+            'aggressive_gain_pct': float(pcts[2]),
+            'stop_loss_pct': float(pcts[4]),
             'reasoning': reasoning,
             'sell_strategy': sell_strategy,
-            'entry_price': round(entry_price, 2)
+            'entry_price': float(prices[4])
         }
     
     def generate_recommendation(self, stock: Dict) -> Dict:
@@ -613,146 +1079,153 @@ class AIInsights:
         Returns:
             Dictionary with recommendation details and comprehensive reasoning
         """
-        symbol = stock['symbol']
-        score = stock['score']
-        buy_signal = stock.get('buy_signal', False)
-        rsi = stock.get('rsi')
-        momentum = stock.get('momentum')
-        volume_ratio = stock.get('volume_ratio', 0)
-        
-        # Determine confidence level
-        confidence_score = 0
-        if score >= 80:
-            confidence_score += 3
-        elif score >= 60:
-            confidence_score += 2
-        else:
-            confidence_score += 1
+        g = stock.get
+        
+        # Confidence and risk depend only on a handful of bands, so the decision is memoized
+        features = _quantize_recommendation(
+            stock['score'],
+            g('buy_signal', False),
+            g('rsi'),
+            g('momentum'),
+            g('volume_ratio', 0),
+            _latest(stock).get('Volatility', None)
+        )
+        return self._build_recommendation(stock, features, *_recommendation_template(features))
+    
+    def recommend_many(self, stocks: List[Dict]) -> List[Dict]:
+        """
+        Generate AI-powered recommendations for a whole watchlist at once.
+        Bands, confidence and risk are classified column-wise with NumPy instead of per stock.
         
-        if buy_signal:
-            confidence_score += 2
+        Args:
+            stocks: List of stock dictionaries
         
-        if rsi and 30 <= rsi <= 50:
-            confidence_score += 1
+        Returns:
+            List of recommendation dictionaries, identical to calling generate_recommendation on each stock
+        """
+        n = len(stocks)
+        if n == 0:
+            return []
+        
+        def column(values) -> np.ndarray:
+            return np.fromiter(values, dtype=np.float64, count=n)
+        
+        scores = column(map(_get_score, stocks))
+        buy_signals = np.fromiter((bool(s.get('buy_signal', False)) for s in stocks), dtype=np.bool_, count=n)
+        rsi = column(_as_float(s.get('rsi')) for s in stocks)
+        # Zero momentum and zero volume ratio count as missing, like in _quantize_recommendation
+        momentum = column(s.get('momentum') or math.nan for s in stocks)
+        volume_ratio = column(s.get('volume_ratio') or math.nan for s in stocks)
+        # An absent volatility maps to 0 (no risk line) while a NaN one stays NaN (lowest band)
+        volatility = column(_latest(s).get('Volatility') or 0.0 for s in stocks)
+        
+        score_bands = np.digitize(scores, _REC_SCORE_CUTS)
+        rsi_bands = np.asarray(_REC_RSI_BANDS)[
+            np.where(np.isnan(rsi), -1, np.digitize(rsi, _REC_RSI_CUTS))
+        ]
+        momentum_bands = np.asarray(_REC_MOMENTUM_BANDS)[
+            np.where(np.isnan(momentum), -1, np.digitize(momentum, _REC_MOMENTUM_CUTS, right=True))
+        ]
+        high_volume = ~np.isnan(volume_ratio) & (np.digitize(volume_ratio, _VOLUME_CUTS) >= 2)
+        risk_bands = np.where(
+            volatility == 0, 0, np.where(volatility > 0.04, 3, np.where(volatility > 0.025, 2, 1))
+        )
         
-        if momentum and momentum > 0.03:
-            confidence_score += 1
+        confidences = np.asarray(_CONFIDENCE_LABELS)[
+            _confidence_code(score_bands, buy_signals, rsi_bands, momentum_bands, high_volume)
+        ].tolist()
+        risk_levels = np.asarray(_RISK_LABELS)[risk_bands].tolist()
+        
+        features = zip(
+            score_bands.tolist(),
+            buy_signals.tolist(),
+            rsi_bands.tolist(),
+            momentum_bands.tolist(),
+            high_volume.tolist(),
+            risk_bands.tolist()
+        )
+        return [
+            self._build_recommendation(
+                stock, feature, 'BUY' if feature[1] else 'HOLD', confidence, risk_level
+            )
+            for stock, feature, confidence, risk_level in zip(stocks, features, confidences, risk_levels)
+        ]
+    
+    def _build_recommendation(
+        self,
+        stock: Dict,
+        features: Tuple[int, bool, int, int, bool, int],
+        action: str,
+        confidence: str,
+        risk_level: str
+    ) -> Dict:
+        """
+        Assemble the recommendation dictionary for a stock from its decided bands and labels.
         
-        if volume_ratio and volume_ratio >= 1.2:
-            confidence_score += 1
+        Args:
+            stock: Stock data dictionary
+            features: Bands from _quantize_recommendation
+            action: BUY or HOLD
+            confidence: Confidence label
+            risk_level: Risk label
         
-        if confidence_score >= 6:
-            confidence = 'High'
-        elif confidence_score >= 4:
-            confidence = 'Medium'
-        else:
-            confidence = 'Low'
+        Returns:
+            Dictionary with recommendation details and comprehensive reasoning
+        """
+        g = stock.get
+        symbol = stock['symbol']
+        score = stock['score']
+        rsi = g('rsi')
+        momentum = g('momentum')
+        volume_ratio = g('volume_ratio', 0)
+        current_price = stock['current_price']
+        volatility = _latest(stock).get('Volatility', None)
+        score_band, buy_signal, rsi_band, momentum_band, high_volume, risk_band = features
         
         recommendation = {
             'symbol': symbol,
-            'action': 'BUY' if buy_signal else 'HOLD',
+            'action': action,
             'confidence': confidence,
             'reasoning': [],
-            'risk_level': 'Low',
+            'risk_level': risk_level,
             'time_horizon': 'Short-term',
             'detailed_reasoning': []
         }
         
-        # Determine risk level with context
-        volatility = None
-        if stock.get('data') is not None and not stock['data'].empty:
-            volatility = stock['data'].iloc[-1].get('Volatility', None)
+        reasoning = recommendation['reasoning']
+        detailed_reasoning = recommendation['detailed_reasoning']
         
-        if volatility:
-            if volatility > 0.04:
-                recommendation['risk_level'] = 'High'
-                recommendation['detailed_reasoning'].append(f"High volatility ({volatility*100:.2f}%) indicates significant price swings. This requires careful risk management and position sizing.")
-            elif volatility > 0.025:
-                recommendation['risk_level'] = 'Medium'
-                recommendation['detailed_reasoning'].append(f"Moderate volatility ({volatility*100:.2f}%) suggests manageable risk with standard risk management practices.")
-            else:
-                recommendation['risk_level'] = 'Low'
-                recommendation['detailed_reasoning'].append(f"Low volatility ({volatility*100:.2f}%) indicates stable price action, suitable for risk-averse investors.")
+        # Explain risk level with context
+        risk_reason = _RISK_REASONS[risk_band]
+        if risk_reason is not None:
+            detailed_reasoning.append(risk_reason(volatility=volatility))
         
         # Calculate sell targets and hold time
-        sell_targets = self.calculate_sell_targets(stock, stock['current_price'])
+        sell_targets = self.calculate_sell_targets(stock, current_price)
         recommendation['sell_targets'] = sell_targets
         
         # Determine time horizon with explanation (using calculated hold time)
         suggested_months = sell_targets['suggested_hold_months']
         suggested_days = sell_targets['suggested_hold_days']
-        
-        if suggested_months <= 2:
-            recommendation['time_horizon'] = f'Short-term ({suggested_days} days / ~{suggested_months:.1f} months)'
-            recommendation['detailed_reasoning'].append(f"Strong momentum suggests potential for near-term gains. Suggested hold period: {suggested_days} days (~{suggested_months:.1f} months).")
-        elif suggested_months <= 6:
-            recommendation['time_horizon'] = f'Medium-term ({suggested_days} days / ~{suggested_months:.1f} months)'
-            recommendation['detailed_reasoning'].append(f"Moderate momentum indicates steady growth potential. Suggested hold period: {suggested_days} days (~{suggested_months:.1f} months).")
-        else:
-            recommendation['time_horizon'] = f'Long-term ({suggested_days} days / ~{suggested_months:.1f} months)'
-            recommendation['detailed_reasoning'].append(f"Lower momentum suggests longer holding period for value appreciation. Suggested hold period: {suggested_days} days (~{suggested_months:.1f} months).")
+        horizon_label, horizon_reason = _HORIZON_TPLS[bisect.bisect_left(_HORIZON_CUTS, suggested_months)]
+        recommendation['time_horizon'] = horizon_label(days=suggested_days, months=suggested_months)
+        detailed_reasoning.append(horizon_reason(days=suggested_days, months=suggested_months))
         
         # Build comprehensive reasoning
-        if buy_signal:
-            recommendation['reasoning'].append("✅ Strong BUY signal from technical analysis")
-            recommendation['detailed_reasoning'].append("Multiple technical indicators align to suggest a favorable entry point. The combination of RSI, moving averages, MACD, and momentum creates a compelling technical case.")
-        else:
-            recommendation['reasoning'].append("⏸️ HOLD - Waiting for stronger signals")
-            recommendation['detailed_reasoning'].append("While the stock shows some positive characteristics, the technical indicators haven't aligned strongly enough to generate a clear BUY signal. Consider monitoring for improved entry conditions.")
-        
-        if score >= 80:
-            recommendation['reasoning'].append(f"⭐ Exceptional quantitative score ({score:.1f}/100)")
-            recommendation['detailed_reasoning'].append(f"The high score of {score:.1f}/100 indicates strong performance across multiple quantitative factors including momentum, RSI, moving averages, MACD, and volume. This suggests a high-quality opportunity.")
-        elif score >= 60:
-            recommendation['reasoning'].append(f"📊 Solid quantitative score ({score:.1f}/100)")
-            recommendation['detailed_reasoning'].append(f"The score of {score:.1f}/100 shows decent technical fundamentals, though not exceptional. This suggests moderate opportunity with room for improvement.")
-        else:
-            recommendation['reasoning'].append(f"⚠️ Lower quantitative score ({score:.1f}/100)")
-            recommendation['detailed_reasoning'].append(f"The score of {score:.1f}/100 indicates weaker technical signals. Consider waiting for improved conditions or exploring other opportunities.")
-        
-        if rsi and 30 <= rsi <= 50:
-            recommendation['reasoning'].append(f"📈 RSI ({rsi:.1f}) suggests favorable entry")
-            recommendation['detailed_reasoning'].append(f"RSI of {rsi:.1f} is in the optimal range for entry, indicating the stock is not overbought and may have room for upward movement.")
-        elif rsi and rsi > 70:
-            recommendation['reasoning'].append(f"⚠️ RSI ({rsi:.1f}) indicates overbought conditions")
-            recommendation['detailed_reasoning'].append(f"RSI of {rsi:.1f} suggests the stock may be overextended. Consider waiting for a pullback to more reasonable levels.")
-        
-        if momentum and momentum > 0.03:
-            recommendation['reasoning'].append(f"🚀 Strong momentum ({momentum*100:.2f}%)")
-            recommendation['detailed_reasoning'].append(f"Positive momentum of {momentum*100:.2f}% indicates sustained buying interest and potential trend continuation.")
-        elif momentum and momentum <= 0:
-            recommendation['reasoning'].append(f"📉 Negative momentum ({momentum*100:.2f}%)")
-            recommendation['detailed_reasoning'].append(f"Negative momentum suggests the stock may need time to stabilize. Exercise patience and wait for reversal signals.")
-        
-        if volume_ratio and volume_ratio >= 1.2:
-            recommendation['reasoning'].append(f"📊 High volume ({volume_ratio:.2f}x) confirms interest")
-            recommendation['detailed_reasoning'].append(f"Above-average volume ({volume_ratio:.2f}x) validates recent price movements and indicates strong market participation.")
-        
-        # Build summary with supportive tone
-        action_emoji = "✅" if buy_signal else "⏸️"
-        confidence_emoji = "🟢" if confidence == 'High' else "🟡" if confidence == 'Medium' else "🔴"
-        
-        recommendation['summary'] = f"{action_emoji} **{recommendation['action']}** {symbol} with {confidence_emoji} **{confidence} confidence**"
-        recommendation['summary'] += f"\n\n**Risk Level**: {recommendation['risk_level']}"
-        recommendation['summary'] += f"\n**Suggested Hold Time**: {recommendation['time_horizon']}"
-        
-        # Add sell targets information
-        if 'sell_targets' in recommendation:
-            targets = recommendation['sell_targets']
-            recommendation['summary'] += f"\n\n**💰 Sell Targets:**"
-            recommendation['summary'] += f"\n- **Target Sell Price**: ${targets['target_sell_price']:.2f} (+{targets['potential_gain_pct']:.1f}%)"
-            recommendation['summary'] += f"\n- **Conservative Target**: ${targets['conservative_target']:.2f} (+{targets['conservative_gain_pct']:.1f}%)"
-            recommendation['summary'] += f"\n- **Aggressive Target**: ${targets['aggressive_target']:.2f} (+{targets['aggressive_gain_pct']:.1f}%)"
-            recommendation['summary'] += f"\n- **Stop Loss**: ${targets['stop_loss_price']:.2f} (-{targets['stop_loss_pct']:.1f}%)"
-            recommendation['summary'] += f"\n- **Strategy**: {targets['sell_strategy']}"
-            recommendation['summary'] += f"\n- **Reasoning**: {targets['reasoning']}"
-        
-        if recommendation['detailed_reasoning']:
-            recommendation['summary'] += "\n\n**Why this recommendation?**\n"
-            for i, reason in enumerate(recommendation['detailed_reasoning'], 1):
-                recommendation['summary'] += f"{i}. {reason}\n"
-        
-        recommendation['summary'] += "\n**💡 Remember**: This is quantitative analysis based on technical indicators. Always complement with fundamental research, consider your risk tolerance, and ensure alignment with your investment goals."
+        values = {'score': score, 'rsi': rsi, 'momentum': momentum, 'volume_ratio': volume_ratio}
+        for reason in (
+            _SIGNAL_REASONS[buy_signal],
+            _SCORE_REASONS[score_band],
+            _RSI_REASONS[rsi_band],
+            _MOMENTUM_REASONS[momentum_band],
+            _VOLUME_REASONS[high_volume]
+        ):
+            if reason is not None:
+                short, detailed = reason
+                reasoning.append(short(**values))
+                detailed_reasoning.append(detailed(**values))
+        
+        recommendation['summary'] = _recommendation_summary(recommendation)
         
         return recommendation
     
@@ -766,62 +1239,109 @@ class AIInsights:
         Returns:
             Explanation text
         """
-        symbol = stock['symbol']
-        score = stock['score']
-        
-        explanation = f"**Score Explanation for {symbol} ({score:.1f}/100)**:\n\n"
-        
         # Analyze contributing factors
         factors = []
         
-        data = stock.get('data')
-        if data is not None and not data.empty:
-            latest = data.iloc[-1]
+        latest = _latest(stock)
+        if latest:
+            g = latest.get
             
             # Momentum contribution
-            momentum = latest.get('Momentum')
-            if momentum and 0.03 <= momentum <= 0.12:
-                factors.append("Strong momentum (3-12%) contributes significantly to the score")
-            elif momentum and momentum > 0:
-                factors.append("Positive momentum provides moderate score contribution")
+            momentum_factor = _EXPLAIN_MOMENTUM_FACTORS[_classify(g('Momentum') or None, _EXPLAIN_MOMENTUM_CUTS)]
+            if momentum_factor is not None:
+                factors.append(_SCORE_FACTORS[momentum_factor])
             
             # RSI contribution
-            rsi = latest.get('RSI')
-            if rsi and 45 <= rsi <= 65:
-                factors.append("Optimal RSI range (45-65) indicates balanced market sentiment")
+            rsi = g('RSI')
+            if _classify(rsi, _EXPLAIN_RSI_CUTS) == 1:
+                factors.append(_SCORE_FACTORS[2])
             elif rsi:
-                factors.append(f"RSI of {rsi:.1f} affects the score based on overbought/oversold conditions")
+                factors.append(_SCORE_FACTORS[3].format(rsi=rsi))
             
             # Moving average trend
-            sma_20 = latest.get('SMA_20')
-            sma_50 = latest.get('SMA_50')
+            sma_20 = g('SMA_20')
+            sma_50 = g('SMA_50')
             current_price = stock['current_price']
             
-            if pd.notna(sma_20) and pd.notna(sma_50):
+            if _notna(sma_20) and _notna(sma_50):
                 if current_price > sma_20 > sma_50:
-                    factors.append("Strong uptrend (price > SMA20 > SMA50) significantly boosts the score")
+                    factors.append(_SCORE_FACTORS[4])
                 elif current_price > sma_20:
-                    factors.append("Price above short-term moving average supports the score")
+                    factors.append(_SCORE_FACTORS[5])
             
             # MACD
-            macd = latest.get('MACD')
-            macd_signal = latest.get('MACD_Signal')
-            if pd.notna(macd) and pd.notna(macd_signal) and macd > macd_signal:
-                factors.append("Bullish MACD crossover adds to the score")
+            macd = g('MACD')
+            macd_signal = g('MACD_Signal')
+            if _notna(macd) and _notna(macd_signal) and macd > macd_signal:
+                factors.append(_SCORE_FACTORS[6])
             
             # Volume
-            volume_ratio = latest.get('Volume_Ratio')
-            if pd.notna(volume_ratio) and volume_ratio >= 1.0:
-                factors.append("Above-average volume confirms price movements and enhances score")
-        
-        if factors:
-            explanation += "Key contributing factors:\n"
-            for i, factor in enumerate(factors, 1):
-                explanation += f"{i}. {factor}\n"
-        else:
-            explanation += "Score is based on a composite of technical indicators, momentum, and market factors."
+            volume_ratio = g('Volume_Ratio')
+            if _notna(volume_ratio) and volume_ratio >= 1.0:
+                factors.append(_SCORE_FACTORS[7])
         
-        return explanation
+        return _format_score_explanation(stock['symbol'], stock['score'], factors)
+    
+    def explain_score_batch(self, latest: pd.DataFrame) -> List[str]:
+        """
+        AI explanations for many stocks at once, using vectorized column comparisons.
+        
+        Args:
+            latest: DataFrame with one row per stock holding its latest indicator values.
+                Expected columns: symbol, score, Price, Momentum, RSI, SMA_20, SMA_50,
+                MACD, MACD_Signal, Volume_Ratio (missing indicator columns count as NaN)
+        
+        Returns:
+            List of explanation texts in row order, matching explain_score for each stock
+        """
+        n = len(latest)
+        if n == 0:
+            return []
+        
+        def column(name: str) -> np.ndarray:
+            if name not in latest:
+                return np.full(n, np.nan)
+            return latest[name].to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        momentum = column('Momentum')
+        rsi = column('RSI')
+        sma_20 = column('SMA_20')
+        sma_50 = column('SMA_50')
+        price = column('Price')
+        macd = column('MACD')
+        macd_signal = column('MACD_Signal')
+        volume_ratio = column('Volume_Ratio')
+        
+        with np.errstate(invalid='ignore'):
+            strong_momentum = (momentum >= 0.03) & (momentum <= 0.12)
+            optimal_rsi = (rsi >= 45) & (rsi <= 65)
+            has_sma = ~np.isnan(sma_20) & ~np.isnan(sma_50)
+            strong_trend = has_sma & (price > sma_20) & (sma_20 > sma_50)
+            bullish_macd = ~np.isnan(macd) & ~np.isnan(macd_signal) & (macd > macd_signal)
+            
+            # One column per entry in _SCORE_FACTORS; mutually exclusive pairs mirror explain_score
+            factor_mask = np.column_stack((
+                strong_momentum,
+                ~strong_momentum & (momentum > 0),
+                optimal_rsi,
+                ~optimal_rsi & (rsi != 0) & ('RSI' in latest),
+                strong_trend,
+                has_sma & ~strong_trend & (price > sma_20),
+                bullish_macd,
+                volume_ratio >= 1.0,
+            ))
+        
+        symbols = latest['symbol'].tolist()
+        scores = latest['score'].tolist()
+        explanations = []
+        for i in range(n):
+            factors = [
+                _SCORE_FACTORS[k].format(rsi=rsi[i]) if k == 3 else _SCORE_FACTORS[k]
+                for k in np.flatnonzero(factor_mask[i])
+            ]
+            explanations.append(_format_score_explanation(symbols[i], scores[i], factors))
+        
+        return explanations
     
     def generate_market_sentiment(self, stocks: List[Dict]) -> str:
         """
@@ -834,31 +1354,89 @@ class AIInsights:
             Market sentiment analysis
         """
         if not stocks:
-            return "Insufficient data for sentiment analysis."
-        
-        total = len(stocks)
-        high_scores = sum(1 for s in stocks if s['score'] >= 80)
-        buy_signals = sum(1 for s in stocks if s.get('buy_signal', False))
-        avg_score = sum(s['score'] for s in stocks) / total
-        
-        sentiment = []
+            return _SENTIMENT_NO_DATA
+        
+        # The text depends only on each stock's (score, buy signal) pair, so repeated
+        # renders of the same selection are served from a small LRU cache
+        try:
+            rows = tuple(map(_get_score_and_signal, stocks))
+        except KeyError:
+            # Stock dicts built outside StockSelector may not carry buy_signal yet
+            rows = tuple((s['score'], s.get('buy_signal', False)) for s in stocks)
+        cache = self._sentiment_cache
+        sentiment = cache.get(rows)
+        if sentiment is not None:
+            try:
+                cache.move_to_end(rows)
+            except KeyError:
+                # Evicted by another thread sharing this instance; the result is still valid
+                pass
+            return sentiment
+        
+        sentiment = self._render_market_sentiment(rows)
+        cache[rows] = sentiment
+        if len(cache) > _SENTIMENT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return sentiment
+    
+    def _render_market_sentiment(self, rows: Tuple[Tuple[float, bool], ...]) -> str:
+        """
+        Build the market sentiment text for a non-empty stock selection.
         
-        sentiment.append("**Market Sentiment Analysis**:\n\n")
+        Args:
+            rows: (score, buy signal) per stock
         
-        # Overall sentiment
-        if avg_score >= 80 and buy_signals > total * 0.5:
-            sentiment.append("🟢 **Bullish**: Market conditions are highly favorable. Strong quantitative scores and numerous BUY signals suggest a robust market environment with multiple high-quality opportunities.")
-        elif avg_score >= 70 and buy_signals > total * 0.3:
-            sentiment.append("🟡 **Moderately Bullish**: Market shows positive characteristics with solid opportunities. While not exceptional, there are worthwhile investments available.")
-        elif avg_score >= 60:
-            sentiment.append("⚪ **Neutral**: Market conditions are mixed. Exercise caution and be selective in stock choices.")
-        else:
-            sentiment.append("🔴 **Cautious**: Market conditions are challenging. Consider waiting for better opportunities or tightening selection criteria.")
+        Returns:
+            Market sentiment analysis
+        """
+        total = len(rows)
+        
+        # Single fused pass over the selection
+        total_score = 0.0
+        high_scores = 0
+        buy_signals = 0
+        for score, buy_signal in rows:
+            total_score += score
+            if score >= 80:
+                high_scores += 1
+            if buy_signal:
+                buy_signals += 1
+        
+        return _format_market_sentiment(total, high_scores, buy_signals, total_score / total)
+    
+    def generate_market_sentiment_batch(self, baskets: List[List[Dict]]) -> List[str]:
+        """
+        Generate market sentiment for many stock selections (e.g. per sector or per watchlist) at once.
+        Per-basket aggregates are segmented NumPy reductions over one flattened score column.
         
-        sentiment.append(f"\n**Key Metrics**:\n")
-        sentiment.append(f"- {high_scores}/{total} stocks ({high_scores/total*100:.1f}%) show exceptional scores (≥80)\n")
-        sentiment.append(f"- {buy_signals}/{total} stocks ({buy_signals/total*100:.1f}%) have BUY signals\n")
-        sentiment.append(f"- Average score: {avg_score:.1f}/100\n")
+        Args:
+            baskets: List of stock selections, each a list of stock dictionaries (may be empty)
         
-        return " ".join(sentiment)
-
+        Returns:
+            List of sentiment texts, identical to calling generate_market_sentiment on each basket
+        """
+        n_baskets = len(baskets)
+        if n_baskets == 0:
+            return []
+        
+        lengths = np.fromiter(map(len, baskets), dtype=np.intp, count=n_baskets)
+        rows = np.fromiter(
+            ((s['score'], bool(s.get('buy_signal', False))) for s in chain.from_iterable(baskets)),
+            dtype=_SENTIMENT_RECORD,
+            count=int(lengths.sum())
+        )
+        scores = rows['score']
+        
+        # Basket index per stock; bincount sums each segment in order, like the scalar loop
+        basket_ids = np.repeat(np.arange(n_baskets), lengths)
+        score_sums = np.bincount(basket_ids, weights=scores, minlength=n_baskets)
+        high_counts = np.bincount(basket_ids[scores >= 80], minlength=n_baskets)
+        buy_counts = np.bincount(basket_ids[rows['buy_signal']], minlength=n_baskets)
+        
+        return [
+            _format_market_sentiment(total, high_scores, buy_signals, total_score / total)
+            if total else _SENTIMENT_NO_DATA
+            for total, total_score, high_scores, buy_signals in zip(
+                lengths.tolist(), score_sums.tolist(), high_counts.tolist(), buy_counts.tolist()
+            )
+        ]
@@ -8,16 +8,20 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from collections import Counter
 from datetime import datetime
+from operator import itemgetter
+import heapq
 import sys
 import os
+import re
 import time
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from data_fetcher import DataFetcher
-from stock_selector import StockSelector
+from stock_selector import StockSelector, TECHNICAL_COLUMNS, build_stock_arrays, latest_technicals, row_technicals
 from trading_strategy import TradingStrategy
 from ai_insights import AIInsights
 from database import Database
@@ -31,6 +35,16 @@ APP_NAME = "Quantify 701"
 APP_BRAND = "The Studio 701 LLC"
 APP_TAGLINE = "Quantify Your Investment Decisions"
 
+# Summary metric card shell; only the gradient, value and label vary per card
+SUMMARY_CARD_HTML = (
+    '<div style="background: linear-gradient(135deg, {gradient}); '
+    'padding: 1.5rem; border-radius: 12px; text-align: center; '
+    'box-shadow: 0 4px 6px rgba(0,0,0,0.1);">'
+    '<h3 style="color: white; margin: 0; font-size: 2rem;">{value}</h3>'
+    '<p style="color: white; margin: 0.5rem 0 0 0; font-size: 0.9rem;">{label}</p>'
+    '</div>'
+)
+
 st.set_page_config(
     page_title=APP_NAME,
     page_icon="📈",
@@ -43,681 +57,145 @@ st.set_page_config(
     }
 )
 
-# Enhanced CSS for modern, professional styling with animations and improved UX
-st.markdown("""
-    <style>
-    /* Main Header with animation */
-    .main-header {
-        font-size: 3.5rem;
-        font-weight: 700;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        text-align: center;
-        margin-bottom: 1rem;
-        padding: 1rem 0;
-        animation: fadeInDown 0.8s ease-out;
-    }
-    
-    @keyframes fadeInDown {
-        from {
-            opacity: 0;
-            transform: translateY(-20px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    @keyframes fadeIn {
-        from { opacity: 0; }
-        to { opacity: 1; }
-    }
-    
-    @keyframes slideIn {
-        from {
-            opacity: 0;
-            transform: translateX(-20px);
-        }
-        to {
-            opacity: 1;
-            transform: translateX(0);
-        }
-    }
-    
-    @keyframes pulse {
-        0%, 100% { transform: scale(1); }
-        50% { transform: scale(1.05); }
-    }
-    
-    /* Metric Cards with hover effects */
-    .metric-card {
-        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin: 0.5rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        border-left: 4px solid #667eea;
-        transition: all 0.3s ease;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-4px);
-        box-shadow: 0 8px 16px rgba(0, 0, 0, 0.15);
-    }
-    
-    /* Enhanced Buttons with better animations */
-    .stButton>button {
-        width: 100%;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        font-weight: 600;
-        border: none;
-        border-radius: 8px;
-        padding: 0.75rem 1.5rem;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        box-shadow: 0 4px 6px rgba(102, 126, 234, 0.3);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .stButton>button::before {
-        content: '';
-        position: absolute;
-        top: 50%;
-        left: 50%;
-        width: 0;
-        height: 0;
-        border-radius: 50%;
-        background: rgba(255, 255, 255, 0.3);
-        transform: translate(-50%, -50%);
-        transition: width 0.6s, height 0.6s;
-    }
-    
-    .stButton>button:hover::before {
-        width: 300px;
-        height: 300px;
-    }
-    
-    .stButton>button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 16px rgba(102, 126, 234, 0.5);
-    }
-    
-    .stButton>button:active {
-        transform: translateY(0);
-    }
-    
-    /* Sidebar enhancements */
-    .css-1d391kg {
-        background-color: #f8f9fa;
-    }
-    
-    /* Enhanced Dataframe styling */
-    .dataframe {
-        border-radius: 8px;
-        overflow: hidden;
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        animation: fadeIn 0.5s ease-out;
-    }
-    
-    .dataframe thead {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-    }
-    
-    .dataframe tbody tr {
-        transition: background-color 0.2s ease;
-    }
-    
-    .dataframe tbody tr:hover {
-        background-color: #f0f4ff;
-    }
-    
-    /* Enhanced Tabs with better styling and scrollability */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 6px;
-        background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
-        padding: 0.75rem;
-        border-radius: 12px;
-        display: flex;
-        overflow-x: auto;
-        overflow-y: hidden;
-        -webkit-overflow-scrolling: touch;
-        scrollbar-width: thin;
-        scrollbar-color: #667eea #f8f9fa;
-        position: relative;
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
-        border: 1px solid #e5e7eb;
-    }
-    
-    /* Add fade effect at edges to indicate scrollability */
-    .stTabs [data-baseweb="tab-list"]::before,
-    .stTabs [data-baseweb="tab-list"]::after {
-        content: '';
-        position: absolute;
-        top: 0;
-        bottom: 0;
-        width: 30px;
-        pointer-events: none;
-        z-index: 1;
-    }
-    
-    .stTabs [data-baseweb="tab-list"]::before {
-        left: 0;
-        background: linear-gradient(to right, rgba(248, 249, 250, 1), rgba(248, 249, 250, 0));
-    }
-    
-    .stTabs [data-baseweb="tab-list"]::after {
-        right: 0;
-        background: linear-gradient(to left, rgba(248, 249, 250, 1), rgba(248, 249, 250, 0));
-    }
-    
-    /* Custom scrollbar for tabs */
-    .stTabs [data-baseweb="tab-list"]::-webkit-scrollbar {
-        height: 8px;
-    }
-    
-    .stTabs [data-baseweb="tab-list"]::-webkit-scrollbar-track {
-        background: #f1f5f9;
-        border-radius: 4px;
-        margin: 0 10px;
-    }
-    
-    .stTabs [data-baseweb="tab-list"]::-webkit-scrollbar-thumb {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        border-radius: 4px;
-        transition: background 0.3s ease;
-    }
-    
-    .stTabs [data-baseweb="tab-list"]::-webkit-scrollbar-thumb:hover {
-        background: linear-gradient(90deg, #764ba2 0%, #667eea 100%);
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        border-radius: 10px;
-        padding: 12px 18px;
-        font-weight: 600;
-        font-size: 0.95rem;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        border: 2px solid transparent;
-        white-space: nowrap;
-        min-width: fit-content;
-        display: flex;
-        align-items: center;
-        gap: 6px;
-        background: white;
-        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background-color: rgba(102, 126, 234, 0.08);
-        border-color: rgba(102, 126, 234, 0.2);
-        transform: translateY(-1px);
-        box-shadow: 0 2px 6px rgba(102, 126, 234, 0.2);
-    }
-    
-    .stTabs [data-baseweb="tab"][aria-selected="true"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white !important;
-        border-color: #667eea;
-        box-shadow: 0 4px 8px rgba(102, 126, 234, 0.3);
-    }
-    
-    .stTabs [data-baseweb="tab"][aria-selected="true"]:hover {
-        background: linear-gradient(135deg, #764ba2 0%, #667eea 100%);
-        transform: translateY(-1px);
-        box-shadow: 0 6px 12px rgba(102, 126, 234, 0.4);
-    }
-    
-    /* Tab icon alignment */
-    .stTabs [data-baseweb="tab"] > div {
-        display: flex;
-        align-items: center;
-        gap: 6px;
-    }
-    
-    /* Enhanced Success/Info/Warning boxes */
-    .stSuccess {
-        border-left: 4px solid #10b981;
-        border-radius: 8px;
-        padding: 1rem;
-        background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.05) 100%);
-        animation: slideIn 0.4s ease-out;
-    }
-    
-    .stInfo {
-        border-left: 4px solid #3b82f6;
-        border-radius: 8px;
-        padding: 1rem;
-        background: linear-gradient(135deg, rgba(59, 130, 246, 0.1) 0%, rgba(37, 99, 235, 0.05) 100%);
-        animation: slideIn 0.4s ease-out;
-    }
-    
-    .stWarning {
-        border-left: 4px solid #f59e0b;
-        border-radius: 8px;
-        padding: 1rem;
-        background: linear-gradient(135deg, rgba(245, 158, 11, 0.1) 0%, rgba(217, 119, 6, 0.05) 100%);
-        animation: slideIn 0.4s ease-out;
-    }
-    
-    .stError {
-        border-left: 4px solid #ef4444;
-        border-radius: 8px;
-        padding: 1rem;
-        background: linear-gradient(135deg, rgba(239, 68, 68, 0.1) 0%, rgba(220, 38, 38, 0.05) 100%);
-        animation: slideIn 0.4s ease-out;
-    }
-    
-    /* Enhanced Expander styling */
-    .streamlit-expanderHeader {
-        font-weight: 600;
-        color: #667eea;
-        transition: color 0.3s ease;
-    }
-    
-    .streamlit-expanderHeader:hover {
-        color: #764ba2;
-    }
-    
-    /* Hide Streamlit branding but keep sidebar toggle */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    /* Keep header visible for sidebar toggle button */
-    /* header {visibility: hidden;} */
-    
-    /* Make sidebar toggle button more visible and prominent */
-    button[kind="header"] {
-        background-color: #667eea !important;
-        color: white !important;
-        border-radius: 8px !important;
-        padding: 0.5rem !important;
-        transition: all 0.3s ease !important;
-        box-shadow: 0 2px 4px rgba(102, 126, 234, 0.3) !important;
-    }
-    
-    button[kind="header"]:hover {
-        background-color: #764ba2 !important;
-        transform: scale(1.1);
-        box-shadow: 0 4px 8px rgba(102, 126, 234, 0.5) !important;
-    }
-    
-    /* Ensure sidebar is visible and styled */
-    section[data-testid="stSidebar"] {
-        background-color: #f8f9fa;
-        box-shadow: 2px 0 8px rgba(0, 0, 0, 0.1);
-    }
-    
-    /* Make the header visible so sidebar toggle is accessible */
-    header[data-testid="stHeader"] {
-        visibility: visible !important;
-        background-color: white;
-        border-bottom: 1px solid #e0e0e0;
-    }
-    
-    /* Style the sidebar content area */
-    .css-1d391kg {
-        background-color: #f8f9fa;
-        padding: 1rem;
-    }
-    
-    /* Enhanced Custom scrollbar */
-    ::-webkit-scrollbar {
-        width: 10px;
-        height: 10px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: #f1f1f1;
-        border-radius: 5px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 5px;
-        transition: background 0.3s ease;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: linear-gradient(135deg, #764ba2 0%, #667eea 100%);
-    }
-    
-    /* Enhanced Score badges with animations */
-    .score-high {
-        background: linear-gradient(135deg, #10b981 0%, #059669 100%);
-        color: white;
-        padding: 6px 14px;
-        border-radius: 20px;
-        font-weight: 600;
-        display: inline-block;
-        box-shadow: 0 2px 4px rgba(16, 185, 129, 0.3);
-        animation: fadeIn 0.5s ease-out;
-    }
-    
-    .score-medium {
-        background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%);
-        color: white;
-        padding: 6px 14px;
-        border-radius: 20px;
-        font-weight: 600;
-        display: inline-block;
-        box-shadow: 0 2px 4px rgba(245, 158, 11, 0.3);
-        animation: fadeIn 0.5s ease-out;
-    }
-    
-    .score-low {
-        background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
-        color: white;
-        padding: 6px 14px;
-        border-radius: 20px;
-        font-weight: 600;
-        display: inline-block;
-        box-shadow: 0 2px 4px rgba(239, 68, 68, 0.3);
-        animation: fadeIn 0.5s ease-out;
-    }
-    
-    /* Loading spinner enhancement */
-    .stSpinner > div {
-        border-top-color: #667eea !important;
-        border-right-color: #667eea !important;
-    }
-    
-    /* Metric value animations */
-    [data-testid="stMetricValue"] {
-        animation: fadeIn 0.6s ease-out;
-    }
-    
-    /* Selectbox and input enhancements */
-    .stSelectbox > div > div {
-        border-radius: 8px;
-        transition: all 0.3s ease;
-    }
-    
-    .stSelectbox > div > div:hover {
-        box-shadow: 0 2px 8px rgba(102, 126, 234, 0.2);
-    }
-    
-    /* Slider enhancements */
-    .stSlider > div > div {
-        border-radius: 8px;
-    }
-    
-    /* Empty state styling */
-    .empty-state {
-        text-align: center;
-        padding: 3rem 1rem;
-        color: #666;
-    }
-    
-    .empty-state-icon {
-        font-size: 4rem;
-        margin-bottom: 1rem;
-        opacity: 0.5;
-    }
-    
-    /* Card hover effects */
-    .stock-card {
-        transition: all 0.3s ease;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        background: white;
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-    }
-    
-    .stock-card:hover {
-        transform: translateY(-4px);
-        box-shadow: 0 8px 16px rgba(0, 0, 0, 0.15);
-    }
-    
-    /* Progress bar enhancements */
-    .stProgress > div > div > div {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        border-radius: 4px;
-    }
-    
-    /* Tooltip enhancements */
-    [data-testid="stTooltip"] {
-        font-size: 0.85rem;
-    }
-    
-    /* Badge/Tag responsive styling - wraps on smaller screens */
-    .badge-container {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 0.5rem;
-        margin: 0.5rem 0;
-    }
-    
-    .badge-item {
-        display: inline-flex;
-        align-items: center;
-        padding: 0.25rem 0.6rem;
-        border-radius: 12px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        white-space: nowrap;
-        margin: 0.2rem 0.2rem 0.2rem 0;
-        line-height: 1.4;
-    }
-    
-    /* Responsive improvements for mobile and tablets */
-    @media (max-width: 768px) {
-        .main-header {
-            font-size: 2rem;
-            padding: 0.5rem 0;
-        }
-        
-        /* Make tabs scrollable on mobile - already handled in main CSS */
-        .stTabs [data-baseweb="tab"] {
-            padding: 10px 14px;
-            font-size: 0.85rem;
-            white-space: nowrap;
-            min-width: fit-content;
-        }
-        
-        /* Quick filter buttons on mobile */
-        .stButton > button {
-            min-height: 60px;
-            font-size: 0.8rem;
-            padding: 0.6rem 0.4rem;
-        }
-        
-        /* Improve button sizes for touch */
-        .stButton>button {
-            padding: 0.9rem 1.2rem;
-            font-size: 0.95rem;
-            min-height: 44px; /* Minimum touch target size */
-        }
-        
-        /* Make quick filter buttons stack on mobile */
-        .quick-filter-container {
-            display: flex;
-            flex-direction: column;
-            gap: 0.5rem;
-        }
-        
-        /* Badge wrapping on mobile */
-        .badge-container {
-            gap: 0.4rem;
-        }
-        
-        .badge-item {
-            font-size: 0.7rem;
-            padding: 0.3rem 0.5rem;
-            margin: 0.15rem;
-        }
-        
-        /* Improve metric cards on mobile */
-        .metric-card {
-            padding: 1rem;
-            margin: 0.3rem 0;
-        }
-        
-        /* Better spacing for columns on mobile */
-        [data-testid="column"] {
-            padding: 0.5rem;
-        }
-        
-        /* Improve expander headers on mobile */
-        .streamlit-expanderHeader {
-            font-size: 0.9rem;
-            padding: 0.75rem;
-        }
-        
-        /* Make copy buttons more accessible */
-        .copy-button {
-            min-width: 60px;
-            min-height: 36px;
-            padding: 0.5rem 0.75rem;
-            font-size: 0.85rem;
-        }
-        
-        /* Improve sidebar on mobile */
-        section[data-testid="stSidebar"] {
-            padding: 0.5rem;
-        }
-        
-        /* Better table display on mobile */
-        .dataframe {
-            font-size: 0.85rem;
-        }
-        
-        /* Improve empty state on mobile */
-        .empty-state {
-            padding: 2rem 1rem;
-        }
-        
-        .empty-state-icon {
-            font-size: 3rem;
-        }
-    }
-    
-    /* Extra small screens (phones in portrait) */
-    @media (max-width: 480px) {
-        .main-header {
-            font-size: 1.75rem;
-        }
-        
-        .stTabs [data-baseweb="tab"] {
-            padding: 6px 10px;
-            font-size: 0.8rem;
-        }
-        
-        .badge-item {
-            font-size: 0.65rem;
-            padding: 0.25rem 0.4rem;
-        }
-        
-        /* Stack columns on very small screens */
-        [data-testid="column"] {
-            width: 100% !important;
-            margin-bottom: 1rem;
-        }
-    }
-    
-    /* Improve touch targets for all interactive elements */
-    button, .stButton>button, [role="button"] {
-        min-height: 44px;
-        min-width: 44px;
-    }
-    
-    /* Better spacing for form elements */
-    .stSelectbox, .stTextInput, .stSlider {
-        margin-bottom: 1rem;
-    }
-    
-    /* Improve readability on all screen sizes */
-    body {
-        font-size: 16px; /* Prevent zoom on iOS */
-    }
-    
-    input, select, textarea {
-        font-size: 16px !important; /* Prevent zoom on iOS */
-    }
+
+@st.cache_resource
+def load_app_css() -> str:
+    """
+    Read and minify the app stylesheet once per server process.
     
-    /* Smooth transitions for all interactive elements */
-    * {
-        transition: background-color 0.2s ease, color 0.2s ease, border-color 0.2s ease;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    The stylesheet is re-sent to the browser on every rerun, so comments and
+    formatting whitespace are stripped to keep that message small.
+    """
+    css_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'app.css')
+    with open(css_path, encoding='utf-8') as f:
+        css = f.read()
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    return re.sub(r':\s+', ':', css).strip()
 
 
-@st.cache_data(ttl=86400)  # Cache for 24 hours (strategy presets don't change)
-def get_strategy_presets():
-    """Define strategy presets with different filter configurations."""
-    return {
-        "Default": {
-            'min_market_cap': 5_000_000_000,  # Lowered from 10B to 5B for more stocks
-            'min_volume': 500_000,  # Lowered from 1M to 500K for more stocks
-            'min_price': 5.0,
-            'max_price': 1000.0,
-            'min_rsi': 20,  # Lowered from 25 to 20 (allow more oversold)
-            'max_rsi': 80,  # Raised from 75 to 80 (allow more overbought)
-            'min_volume_ratio': 0.3,  # Lowered from 0.5 to 0.3 for more stocks
-            'min_data_points': 200,  # Will be overridden by adaptive calculation
-            'max_volatility': 0.08  # Raised from 0.05 to 0.08 (allow more volatility)
-        },
-        "Conservative": {
-            'min_market_cap': 50_000_000_000,  # Larger companies
-            'min_volume': 2_000_000,  # Higher liquidity
-            'min_price': 10.0,
-            'max_price': 500.0,
-            'min_rsi': 30,
-            'max_rsi': 70,  # Avoid extremes
-            'min_volume_ratio': 0.8,  # Higher volume requirement
-            'min_data_points': 200,
-            'max_volatility': 0.03  # Lower volatility
-        },
-        "Aggressive": {
-            'min_market_cap': 5_000_000_000,  # Smaller companies OK
-            'min_volume': 500_000,  # Lower volume requirement
-            'min_price': 5.0,
-            'max_price': 1000.0,
-            'min_rsi': 20,  # Allow more oversold
-            'max_rsi': 80,  # Allow more overbought
-            'min_volume_ratio': 0.3,  # Lower volume ratio
-            'min_data_points': 200,
-            'max_volatility': 0.08  # Higher volatility allowed
-        },
-        "Momentum": {
-            'min_market_cap': 10_000_000_000,
-            'min_volume': 1_500_000,  # Higher volume for momentum
-            'min_price': 5.0,
-            'max_price': 1000.0,
-            'min_rsi': 40,  # Prefer not oversold
-            'max_rsi': 70,
-            'min_volume_ratio': 1.0,  # Above average volume
-            'min_data_points': 200,
-            'max_volatility': 0.06
-        },
-        "Value": {
-            'min_market_cap': 20_000_000_000,  # Established companies
-            'min_volume': 1_000_000,
-            'min_price': 5.0,
-            'max_price': 200.0,  # Lower price range
-            'min_rsi': 25,  # Allow oversold (value opportunities)
-            'max_rsi': 65,  # Avoid overbought
-            'min_volume_ratio': 0.5,
-            'min_data_points': 200,
-            'max_volatility': 0.04  # Lower volatility
-        },
-        "Dividend Focus": {
-            'min_market_cap': 30_000_000_000,  # Large, stable companies
-            'min_volume': 1_000_000,
-            'min_price': 10.0,
-            'max_price': 300.0,
-            'min_rsi': 30,
-            'max_rsi': 70,
-            'min_volume_ratio': 0.6,
-            'min_data_points': 200,
-            'max_volatility': 0.035  # Low volatility for income
-        }
-    }
+@st.cache_resource
+def get_data_fetcher() -> DataFetcher:
+    """Process-wide DataFetcher, so its price cache is shared by every session and filter change."""
+    return DataFetcher()
+
+
+@st.cache_resource
+def get_ai_insights() -> AIInsights:
+    """Process-wide AIInsights engine shared by every view, rerun and session."""
+    return AIInsights()
+
+
+# Sidebar options, built once per process; reruns only read them
+STRATEGY_PRESETS = {
+    "Default": {
+        'min_market_cap': 5_000_000_000,  # Lowered from 10B to 5B for more stocks
+        'min_volume': 500_000,  # Lowered from 1M to 500K for more stocks
+        'min_price': 5.0,
+        'max_price': 1000.0,
+        'min_rsi': 20,  # Lowered from 25 to 20 (allow more oversold)
+        'max_rsi': 80,  # Raised from 75 to 80 (allow more overbought)
+        'min_volume_ratio': 0.3,  # Lowered from 0.5 to 0.3 for more stocks
+        'min_data_points': 200,  # Will be overridden by adaptive calculation
+        'max_volatility': 0.08  # Raised from 0.05 to 0.08 (allow more volatility)
+    },
+    "Conservative": {
+        'min_market_cap': 50_000_000_000,  # Larger companies
+        'min_volume': 2_000_000,  # Higher liquidity
+        'min_price': 10.0,
+        'max_price': 500.0,
+        'min_rsi': 30,
+        'max_rsi': 70,  # Avoid extremes
+        'min_volume_ratio': 0.8,  # Higher volume requirement
+        'min_data_points': 200,
+        'max_volatility': 0.03  # Lower volatility
+    },
+    "Aggressive": {
+        'min_market_cap': 5_000_000_000,  # Smaller companies OK
+        'min_volume': 500_000,  # Lower volume requirement
+        'min_price': 5.0,
+        'max_price': 1000.0,
+        'min_rsi': 20,  # Allow more oversold
+        'max_rsi': 80,  # Allow more overbought
+        'min_volume_ratio': 0.3,  # Lower volume ratio
+        'min_data_points': 200,
+        'max_volatility': 0.08  # Higher volatility allowed
+    },
+    "Momentum": {
+        'min_market_cap': 10_000_000_000,
+        'min_volume': 1_500_000,  # Higher volume for momentum
+        'min_price': 5.0,
+        'max_price': 1000.0,
+        'min_rsi': 40,  # Prefer not oversold
+        'max_rsi': 70,
+        'min_volume_ratio': 1.0,  # Above average volume
+        'min_data_points': 200,
+        'max_volatility': 0.06
+    },
+    "Value": {
+        'min_market_cap': 20_000_000_000,  # Established companies
+        'min_volume': 1_000_000,
+        'min_price': 5.0,
+        'max_price': 200.0,  # Lower price range
+        'min_rsi': 25,  # Allow oversold (value opportunities)
+        'max_rsi': 65,  # Avoid overbought
+        'min_volume_ratio': 0.5,
+        'min_data_points': 200,
+        'max_volatility': 0.04  # Lower volatility
+    },
+    "Dividend Focus": {
+        'min_market_cap': 30_000_000_000,  # Large, stable companies
+        'min_volume': 1_000_000,
+        'min_price': 10.0,
+        'max_price': 300.0,
+        'min_rsi': 30,
+        'max_rsi': 70,
+        'min_volume_ratio': 0.6,
+        'min_data_points': 200,
+        'max_volatility': 0.035  # Low volatility for income
+    }
+}
+
+STRATEGY_DESCRIPTIONS = {
+    "Default": "Balanced approach with standard filter settings suitable for most investors.",
+    "Conservative": "Focus on large-cap, low-volatility stocks. Lower risk, stable returns.",
+    "Aggressive": "Includes smaller companies and higher volatility. Higher risk, potential for higher returns.",
+    "Momentum": "Emphasizes stocks with strong price momentum and high volume. Trend-following strategy.",
+    "Value": "Targets established companies at reasonable prices. Value investing approach.",
+    "Dividend Focus": "Prioritizes large, stable companies suitable for income investing."
+}
+
+PERIOD_OPTIONS = {
+    "1 Month": "1mo",
+    "3 Months": "3mo",
+    "6 Months": "6mo",
+    "1 Year": "1y",
+    "2 Years": "2y",
+    "5 Years": "5y",
+    "10 Years": "10y",
+    "Year to Date": "ytd",
+    "Maximum Available": "max"
+}
+
+INTERVAL_OPTIONS = {
+    "1 Minute": "1m",
+    "2 Minutes": "2m",
+    "5 Minutes": "5m",
+    "15 Minutes": "15m",
+    "30 Minutes": "30m",
+    "60 Minutes": "60m",
+    "90 Minutes": "90m",
+    "Hourly": "1h",
+    "Daily": "1d",
+    "Weekly": "1wk",
+    "Monthly": "1mo",
+    "Quarterly": "3mo"
+}
+
+# Intraday intervals are only served for periods up to 60 days
+INTRADAY_INTERVALS = ("1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h")
+LONG_PERIODS = ("6mo", "1y", "2y", "5y", "10y", "ytd", "max")
 
 
 def calculate_adaptive_min_data_points(period: str, interval: str) -> int:
@@ -799,28 +277,36 @@ def calculate_adaptive_min_data_points(period: str, interval: str) -> int:
     return adaptive_min
 
 
+def filters_key(custom_filters: dict) -> tuple:
+    """
+    Canonical, hashable form of a filter dict: sorted (name, value) pairs.
+    
+    Floats are rounded to 6 decimals so slider values that differ only in
+    float noise compare (and cache) as equal.
+    """
+    return tuple(sorted(
+        (name, round(value, 6) if isinstance(value, float) else value)
+        for name, value in custom_filters.items()
+    ))
+
+
 @st.cache_data(ttl=3600, show_spinner=False)  # Cache for 1 hour
-def get_stock_data(custom_filters=None, period="1y", interval="1d"):
+def get_stock_data(custom_filters=(), period="1y", interval="1d"):
     """
     Fetch and analyze stocks with caching.
     
     Args:
-        custom_filters: Custom filter parameters
+        custom_filters: Custom filter parameters as a filters_key() tuple
         period: Time period for data ("1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max")
         interval: Data interval ("1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo")
     """
-    data_fetcher = DataFetcher()
-    stock_selector = StockSelector(data_fetcher)
+    stock_selector = StockSelector(get_data_fetcher())
     
     # Calculate adaptive minimum data points based on period and interval
     adaptive_min_data_points = calculate_adaptive_min_data_points(period, interval)
     
     # Merge adaptive min_data_points into custom_filters
-    if custom_filters is None:
-        custom_filters = {}
-    
-    # Update min_data_points with adaptive value
-    custom_filters = custom_filters.copy()  # Don't modify the original
+    custom_filters = dict(custom_filters)
     custom_filters['min_data_points'] = adaptive_min_data_points
     
     # Fetch and analyze stocks with specified time range
@@ -831,40 +317,74 @@ def get_stock_data(custom_filters=None, period="1y", interval="1d"):
         interval=interval
     )
     
-    return qualified_stocks, data_fetcher
+    # Buy signals depend only on the fetched data, so compute them once per fetch
+    strategy = TradingStrategy()
+    for stock in qualified_stocks:
+        stock['buy_signal'], stock['buy_reason'] = strategy.generate_buy_signal(stock)
+    
+    return qualified_stocks, build_stock_arrays(qualified_stocks)
 
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+@st.cache_data(ttl=1800, show_spinner=False)  # Cache for 30 minutes
+def get_symbol_history(symbol, period="1y", interval="1d"):
+    """
+    Fetch one symbol's price history with technical indicators, cached across reruns.
+    
+    Returns None if no data could be fetched.
+    """
+    data_fetcher = get_data_fetcher()
+    data = data_fetcher.get_stock_data(symbol, period=period, interval=interval)
+    if data is None or data.empty:
+        return None
+    return data_fetcher.calculate_technical_indicators(data)
+
+
+# Last-row indicators read by the search view, on top of the ones stored on every ranked stock
+SEARCH_TECHNICAL_COLUMNS = TECHNICAL_COLUMNS + (
+    'SMA_200', 'MACD_Histogram', 'BB_Middle', 'RSI', 'Momentum', 'Volume_Ratio'
+)
+
+
+# Score color badges, indexed by how many score cuts a score reaches
+SCORE_BADGES = np.array(["🔴", "🟡", "🟢"])
+
+
+def score_badges(scores, cuts=(60, 80)) -> list:
+    """Color badge for each score: red below cuts[0], yellow below cuts[1], green otherwise."""
+    return SCORE_BADGES[np.searchsorted(cuts, scores, side='right')].tolist()
+
+
+def price_history_key(data: pd.DataFrame) -> tuple:
+    """Cheap cache key for a price history: its last bar, length and last close."""
+    if data.empty:
+        return ()
+    return (data.index[-1], len(data), float(data['Close'].iloc[-1]))
+
+
+# Only the display fields matter here, so each stock's price history is hashed by its cheap key
+@st.cache_data(ttl=3600, show_spinner=False, hash_funcs={pd.DataFrame: price_history_key})  # Cache for 1 hour
 def create_stocks_dataframe(stocks):
     """Convert stock list to DataFrame for display with enhanced formatting."""
-    data = []
-    for idx, stock in enumerate(stocks):
-        # Determine score color category
-        score = stock['score']
-        if score >= 80:
-            score_display = f"🟢 {score:.1f}"
-        elif score >= 60:
-            score_display = f"🟡 {score:.1f}"
-        else:
-            score_display = f"🔴 {score:.1f}"
-        
-        # Format buy signal
-        buy_signal = "✅ BUY" if stock.get('buy_signal') else "⏸️ HOLD"
-        
-        data.append({
-            'Rank': idx + 1,
-            'Symbol': stock['symbol'],
-            'Score': score_display,
-            'Signal': buy_signal,
-            'Price': f"${stock['current_price']:.2f}",
-            'RSI': f"{stock['rsi']:.1f}" if stock['rsi'] else "N/A",
-            'Momentum': f"{stock['momentum']*100:+.2f}%" if stock['momentum'] else "N/A",
-            'Volume': f"{stock.get('volume_ratio', 0):.2f}x" if stock.get('volume_ratio') else "N/A",
-            'Market Cap': f"${stock['market_cap']/1e9:.1f}B",
-            'Sector': stock['sector']
-        })
-    
-    return pd.DataFrame(data)
+    # Build each display column in one pass rather than one dict per row
+    scores = np.fromiter((stock['score'] for stock in stocks), dtype=float, count=len(stocks))
+
+    # Determine score color category
+    score_emojis = score_badges(scores)
+
+    return pd.DataFrame({
+        'Rank': np.arange(1, len(stocks) + 1),
+        'Symbol': [stock['symbol'] for stock in stocks],
+        'Score': [f"{emoji} {score:.1f}" for emoji, score in zip(score_emojis, scores.tolist())],
+        'Signal': ["✅ BUY" if stock.get('buy_signal') else "⏸️ HOLD" for stock in stocks],
+        'Price': [f"${stock['current_price']:.2f}" for stock in stocks],
+        'RSI': [f"{rsi:.1f}" if rsi else "N/A" for rsi in (stock['rsi'] for stock in stocks)],
+        'Momentum': [f"{momentum*100:+.2f}%" if momentum else "N/A"
+                     for momentum in (stock['momentum'] for stock in stocks)],
+        'Volume': [f"{volume_ratio:.2f}x" if volume_ratio else "N/A"
+                   for volume_ratio in (stock.get('volume_ratio') for stock in stocks)],
+        'Market Cap': [f"${stock['market_cap']/1e9:.1f}B" for stock in stocks],
+        'Sector': [stock['sector'] for stock in stocks]
+    })
 
 
 # Helper functions for new features
@@ -886,6 +406,27 @@ def initialize_session_state():
         st.session_state.show_premium = False
 
 
+def restore_widget_state(key: str, options=None):
+    """
+    Put back a view widget's value after Streamlit dropped it.
+    
+    Only the active view is rendered, and Streamlit deletes the state of widgets it
+    does not render, so leaving a view would reset its pickers. remember_widget_state
+    mirrors each value under a non-widget key; this seeds the widget from that copy
+    before it is created again, skipping selections no longer among its options.
+    """
+    saved_key = f"saved_{key}"
+    if key not in st.session_state and saved_key in st.session_state:
+        saved = st.session_state[saved_key]
+        if options is None or saved in options:
+            st.session_state[key] = saved
+
+
+def remember_widget_state(key: str):
+    """Mirror a widget's current value under a non-widget key for restore_widget_state."""
+    st.session_state[f"saved_{key}"] = st.session_state[key]
+
+
 def add_to_watchlist(symbol: str):
     """Add a stock symbol to the watchlist."""
     if symbol and symbol not in st.session_state.watchlist:
@@ -963,6 +504,182 @@ def create_copy_button_html(symbol: str, button_id: str) -> str:
     """
 
 
+def indicator_panel_html(title: str, rows, note=None) -> str:
+    """
+    Render a column of indicator readings as one HTML block instead of an st.metric each.
+    
+    Args:
+        title: Panel heading
+        rows: (label, value, delta) tuples; delta is a signed string or None
+        note: Optional (text, kind) status line; kind is positive, negative, info or warning
+    """
+    parts = [f'<div class="indicator-panel"><div class="indicator-title">{title}</div>']
+    for label, value, delta in rows:
+        delta_html = ''
+        if delta:
+            trend = 'negative' if delta.startswith('-') else 'positive'
+            delta_html = f'<div class="indicator-delta {trend}">{delta}</div>'
+        parts.append(
+            f'<div class="indicator-row"><div class="indicator-label">{label}</div>'
+            f'<div class="indicator-value">{value}</div>{delta_html}</div>'
+        )
+    if note:
+        parts.append(f'<div class="indicator-note {note[1]}">{note[0]}</div>')
+    parts.append('</div>')
+    return ''.join(parts)
+
+
+# Upper bound on points per chart trace; longer histories are bucketed down
+CHART_MAX_POINTS = 2000
+# Bars merge into single pixels well before line points do, so the MACD histogram gets fewer
+CHART_MAX_BARS = 1000
+# Candlesticks are drawn as SVG shapes rather than WebGL, so candle charts use a smaller budget
+CHART_MAX_CANDLES = 1000
+# Grid and line styling shared by every chart axis
+CHART_AXIS_STYLE = dict(
+    showgrid=True,
+    gridwidth=1,
+    gridcolor='rgba(0,0,0,0.08)',
+    zeroline=False,
+    showline=True,
+    linewidth=1,
+    linecolor='rgba(0,0,0,0.1)'
+)
+
+
+def bucket_starts(n: int, max_buckets: int) -> np.ndarray:
+    """Start positions of max_buckets near-equal buckets covering n rows."""
+    return np.linspace(0, n, max_buckets, endpoint=False).astype(np.intp)
+
+
+def bucket_extremes(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Per bucket, the value furthest from zero (NaN only if the whole bucket is NaN)."""
+    highs = np.fmax.reduceat(values, starts)
+    lows = np.fmin.reduceat(values, starts)
+    return np.where(np.abs(lows) > np.abs(highs), lows, highs)
+
+
+def lttb_indices(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: pick the row in each bucket that best keeps the line's shape.
+    
+    Buckets are given by their start positions and x is the row position. The first
+    and last buckets keep their first and last rows so the line spans the full range.
+    """
+    n = len(values)
+    ends = np.append(starts[1:], n)
+    # The average point of the following bucket is the third corner of each triangle
+    next_x = (starts + ends - 1) / 2
+    next_y = np.add.reduceat(values, starts) / (ends - starts)
+
+    picked = np.empty(len(starts), dtype=np.intp)
+    picked[0], picked[-1] = 0, n - 1
+    prev = 0
+    for b in range(1, len(starts) - 1):
+        xs = np.arange(starts[b], ends[b])
+        area = np.abs((prev - next_x[b + 1]) * (values[xs] - values[prev])
+                      - (prev - xs) * (next_y[b + 1] - values[prev]))
+        prev = picked[b] = starts[b] + np.argmax(np.nan_to_num(area, nan=-1.0))
+    return picked
+
+
+def downsample_chart_data(data: pd.DataFrame, max_points: int = CHART_MAX_POINTS,
+                          keep_ohlc: bool = True) -> pd.DataFrame:
+    """
+    Bucket a price history down to at most max_points rows for plotting.
+    
+    With keep_ohlc each bucket keeps the first Open, highest High, lowest Low and
+    last Close; otherwise LTTB picks one row per bucket for Close and the moving
+    averages. RSI and MACD lines are averaged, the MACD histogram keeps the bar
+    furthest from zero, and Volume is summed.
+    """
+    n = len(data)
+    if n <= max_points:
+        return data
+
+    starts = bucket_starts(n, max_points)
+    counts = np.diff(np.append(starts, n))
+    columns = data.columns
+
+    if keep_ohlc:
+        reduced = data.iloc[starts + counts - 1].copy()
+        if 'Open' in columns:
+            reduced['Open'] = data['Open'].to_numpy()[starts]
+        if 'High' in columns:
+            reduced['High'] = np.fmax.reduceat(data['High'].to_numpy(dtype=float), starts)
+        if 'Low' in columns:
+            reduced['Low'] = np.fmin.reduceat(data['Low'].to_numpy(dtype=float), starts)
+    else:
+        reduced = data.iloc[lttb_indices(data['Close'].to_numpy(dtype=float), starts)].copy()
+
+    if 'Volume' in columns:
+        reduced['Volume'] = np.add.reduceat(data['Volume'].to_numpy(dtype=float), starts)
+
+    for column in ('RSI', 'MACD', 'MACD_Signal'):
+        if column in columns:
+            values = data[column].to_numpy(dtype=float)
+            valid = ~np.isnan(values)
+            totals = np.add.reduceat(np.where(valid, values, 0.0), starts)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                reduced[column] = totals / np.add.reduceat(valid.astype(np.intp), starts)
+
+    if 'MACD_Histogram' in columns:
+        reduced['MACD_Histogram'] = bucket_extremes(data['MACD_Histogram'].to_numpy(dtype=float), starts)
+
+    return reduced
+
+
+@st.cache_data(ttl=3600, show_spinner=False, hash_funcs={pd.DataFrame: price_history_key})
+def generate_ai_analysis(_ai: AIInsights, stock: dict):
+    """Cached AI insight text and full recommendation for a stock."""
+    return _ai.generate_stock_insight(stock), _ai.generate_recommendation(stock)
+
+
+@st.cache_data(ttl=3600, show_spinner=False, hash_funcs={pd.DataFrame: price_history_key})
+def explain_stock_score(_ai: AIInsights, stock: dict) -> str:
+    """Cached score explanation for a stock."""
+    return _ai.explain_score(stock)
+
+
+def selection_key(stocks) -> tuple:
+    """Cheap cache key for a stock selection: its symbols, scores and buy signals in order."""
+    return tuple((s['symbol'], s['score'], bool(s.get('buy_signal'))) for s in stocks)
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def generate_market_sentiment(_ai: AIInsights, _stocks: list, stocks_key: tuple) -> str:
+    """Cached market sentiment for a selection, keyed by selection_key(_stocks)."""
+    return _ai.generate_market_sentiment(_stocks)
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def generate_portfolio_insight(_ai: AIInsights, _stocks: list, stocks_key: tuple) -> str:
+    """Cached portfolio insight for a selection, keyed by selection_key(_stocks)."""
+    return _ai.generate_portfolio_insight(_stocks)
+
+
+def render_ai_analysis(ai: AIInsights, stock: dict, heading: str, insight_title: str):
+    """
+    AI insight, recommendation and score explanation for a stock.
+    
+    Shared by the stock detail and AI Insights panels; both read the same cached
+    results, so opening a stock in the second view costs only the rendering.
+    """
+    insight, recommendation = generate_ai_analysis(ai, stock)
+    score_explanation = explain_stock_score(ai, stock)
+    
+    st.markdown(f"{heading} {insight_title}")
+    st.markdown(insight)
+    
+    st.markdown("---")
+    st.markdown(f"{heading} 🎯 AI Recommendation")
+    st.markdown(recommendation['summary'])
+    
+    st.markdown("---")
+    st.markdown(f"{heading} 📊 Score Explanation")
+    st.markdown(score_explanation)
+
+
 def create_price_chart(stock_data, symbol, chart_type='candlestick'):
     """
     Create interactive price chart with technical indicators.
@@ -975,7 +692,25 @@ def create_price_chart(stock_data, symbol, chart_type='candlestick'):
     data = stock_data['data']
     if data is None or data.empty:
         return None
-    
+
+    return build_price_chart(data, symbol, chart_type)
+
+
+# Reruns that don't touch the price history reuse the figure instead of rebuilding it;
+# figures are large, so only the most recent ones are kept
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False, hash_funcs={pd.DataFrame: price_history_key})
+def build_price_chart(data, symbol, chart_type='candlestick'):
+    """Build the price/RSI/MACD figure for a non-empty price history."""
+    # Column availability, checked once per chart instead of probing data.columns per trace
+    cols = frozenset(data.columns)
+    show_candles = chart_type == 'candlestick' and cols.issuperset(('Open', 'High', 'Low', 'Close'))
+    
+    # Keep each trace at most CHART_MAX_POINTS (CHART_MAX_CANDLES for candle charts) long so
+    # long histories render quickly; candles are merged per bucket, never cut off
+    data = downsample_chart_data(
+        data, CHART_MAX_CANDLES if show_candles else CHART_MAX_POINTS, keep_ohlc=show_candles
+    )
+
     # Create subplots
     fig = make_subplots(
         rows=3, cols=1,
@@ -986,7 +721,7 @@ def create_price_chart(stock_data, symbol, chart_type='candlestick'):
     )
     
     # Price chart - Candlestick or Line
-    if chart_type == 'candlestick' and all(col in data.columns for col in ['Open', 'High', 'Low', 'Close']):
+    if show_candles:
         # Add candlestick chart
         fig.add_trace(
             go.Candlestick(
@@ -1012,7 +747,7 @@ def create_price_chart(stock_data, symbol, chart_type='candlestick'):
     else:
         # Fallback to line chart if candlestick data not available or chart_type is 'line'
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=data.index, 
                 y=data['Close'], 
                 name='Price', 
@@ -1022,9 +757,9 @@ def create_price_chart(stock_data, symbol, chart_type='candlestick'):
             row=1, col=1
         )
     
-    if 'SMA_20' in data.columns:
+    if 'SMA_20' in cols:
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=data.index, 
                 y=data['SMA_20'], 
                 name='SMA 20', 
@@ -1034,9 +769,9 @@ def create_price_chart(stock_data, symbol, chart_type='candlestick'):
             row=1, col=1
         )
     
-    if 'SMA_50' in data.columns:
+    if 'SMA_50' in cols:
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=data.index, 
                 y=data['SMA_50'], 
                 name='SMA 50', 
@@ -1047,9 +782,9 @@ def create_price_chart(stock_data, symbol, chart_type='candlestick'):
         )
     
     # RSI with enhanced styling
-    if 'RSI' in data.columns:
+    if 'RSI' in cols:
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=data.index, 
                 y=data['RSI'], 
                 name='RSI', 
@@ -1091,9 +826,9 @@ def create_price_chart(stock_data, symbol, chart_type='candlestick'):
         )
     
     # MACD with enhanced styling
-    if 'MACD' in data.columns and 'MACD_Signal' in data.columns:
+    if 'MACD' in cols and 'MACD_Signal' in cols:
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=data.index, 
                 y=data['MACD'], 
                 name='MACD', 
@@ -1103,7 +838,7 @@ def create_price_chart(stock_data, symbol, chart_type='candlestick'):
             row=3, col=1
         )
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=data.index, 
                 y=data['MACD_Signal'], 
                 name='Signal', 
@@ -1113,12 +848,19 @@ def create_price_chart(stock_data, symbol, chart_type='candlestick'):
             row=3, col=1
         )
         # MACD Histogram with better colors
-        if 'MACD_Histogram' in data.columns:
-            colors = ['#10b981' if x >= 0 else '#ef4444' for x in data['MACD_Histogram']]
+        if 'MACD_Histogram' in cols:
+            hist = data['MACD_Histogram'].to_numpy(dtype=float)
+            hist_x = data.index
+            if len(hist) > CHART_MAX_BARS:
+                # Keep each bucket's most extreme bar so the envelope survives
+                edges = bucket_starts(len(hist), CHART_MAX_BARS)
+                hist = bucket_extremes(hist, edges)
+                hist_x = data.index[edges]
+            colors = np.where(hist >= 0, '#10b981', '#ef4444')
             fig.add_trace(
                 go.Bar(
-                    x=data.index, 
-                    y=data['MACD_Histogram'], 
+                    x=hist_x, 
+                    y=hist, 
                     name='Histogram', 
                     marker_color=colors,
                     hovertemplate='<b>Histogram</b><br>%{y:.3f}<extra></extra>'
@@ -1126,6 +868,13 @@ def create_price_chart(stock_data, symbol, chart_type='candlestick'):
                 row=3, col=1
             )
     
+    # Axis styling with better grid, set for all three subplots in the same layout update
+    x_axis = dict(CHART_AXIS_STYLE, rangeslider=dict(visible=False))  # Hide range slider for cleaner look
+    y_axes = [CHART_AXIS_STYLE] * 3
+    if show_candles:
+        # For candlestick charts, title the first subplot y-axis
+        y_axes[0] = dict(CHART_AXIS_STYLE, title=dict(text="Price ($)"))
+    
     # Enhanced chart styling with modern design
     fig.update_layout(
         height=800,
@@ -1137,9 +886,8 @@ def create_price_chart(stock_data, symbol, chart_type='candlestick'):
         },
         showlegend=True,
         hovermode='x unified',
-        template='plotly_white',
-        plot_bgcolor='rgba(248, 249, 250, 0.5)',
-        paper_bgcolor='rgba(255, 255, 255, 0.9)',
+        plot_bgcolor='white',
+        paper_bgcolor='white',
         font=dict(family="Arial, sans-serif", size=12, color='#333'),
         legend=dict(
             orientation="h",
@@ -1156,39 +904,364 @@ def create_price_chart(stock_data, symbol, chart_type='candlestick'):
             bordercolor='#667eea',
             font_size=12,
             font_family="Arial, sans-serif"
-        )
+        ),
+        xaxis=x_axis, xaxis2=x_axis, xaxis3=x_axis,
+        yaxis=y_axes[0], yaxis2=y_axes[1], yaxis3=y_axes[2]
+    )
+    
+    return fig
+
+
+# Read-only view of config shown in the How It Works view; config is not changed at runtime
+CONFIG_SUMMARY = f"""
+# Current Filter Settings
+MIN_MARKET_CAP = ${config.MIN_MARKET_CAP:,}
+MIN_VOLUME = {config.MIN_VOLUME:,}
+MIN_PRICE = ${config.MIN_PRICE}
+MAX_PRICE = ${config.MAX_PRICE}
+MIN_RSI = {config.MIN_RSI}
+MAX_RSI = {config.MAX_RSI}
+MIN_DATA_POINTS = {config.MIN_DATA_POINTS}
+MAX_VOLATILITY = {config.MAX_VOLATILITY*100}%
+MIN_VOLUME_RATIO = {config.MIN_VOLUME_RATIO}x
+
+# Stock Universe Size
+TOTAL_STOCKS = {len(config.STOCK_UNIVERSE)}
+"""
+
+# Static tables for the How It Works view, built once at import instead of on every rerun
+SCORING_FACTORS_DF = pd.DataFrame([
+    {
+        "Factor": "Momentum (20-day)",
+        "Weight": "0-25 points",
+        "Description": "Measures price momentum over 20 days. Optimal range: 3-12% gain.",
+        "Best Case": "3-12% positive momentum = 25 points"
+    },
+    {
+        "Factor": "RSI (Relative Strength Index)",
+        "Weight": "0-20 points",
+        "Description": "Measures overbought/oversold conditions. Optimal range: 45-65.",
+        "Best Case": "RSI between 45-65 = 20 points"
+    },
+    {
+        "Factor": "Moving Average Trend",
+        "Weight": "0-20 points",
+        "Description": "Evaluates price position relative to moving averages. Prefers uptrends.",
+        "Best Case": "Price > SMA20 > SMA50 (strong uptrend) = 20 points"
+    },
+    {
+        "Factor": "MACD Signal",
+        "Weight": "0-15 points",
+        "Description": "Measures momentum and trend changes. Prefers bullish crossovers.",
+        "Best Case": "MACD > Signal and MACD > 0 = 15 points"
+    },
+    {
+        "Factor": "Volume Confirmation",
+        "Weight": "0-12 points",
+        "Description": "Confirms price movements with trading volume. Higher volume = stronger signal.",
+        "Best Case": "Volume ratio ≥ 1.5x = 12 points"
+    },
+    {
+        "Factor": "Volatility",
+        "Weight": "0-8 points",
+        "Description": "Measures price stability. Prefers moderate volatility (1.5-2.5% daily).",
+        "Best Case": "1.5-2.5% daily volatility = 8 points"
+    },
+    {
+        "Factor": "Momentum Consistency",
+        "Weight": "0-8 points",
+        "Description": "Checks if momentum is consistent across different time periods.",
+        "Best Case": "Consistent positive momentum = 8 points"
+    },
+    {
+        "Factor": "Bollinger Bands Position",
+        "Weight": "0-7 points",
+        "Description": "Evaluates price position within Bollinger Bands. Prefers middle-upper range.",
+        "Best Case": "Price in 30-70% of band range = 7 points"
+    }
+])
+
+SCORING_FACTORS_COLUMNS = {
+    "Factor": st.column_config.TextColumn("Factor", width="medium"),
+    "Weight": st.column_config.TextColumn("Max Points", width="small"),
+    "Description": st.column_config.TextColumn("Description", width="large"),
+    "Best Case": st.column_config.TextColumn("Best Case", width="medium")
+}
+
+STRATEGY_PRESETS_DF = pd.DataFrame([
+    {
+        "Strategy": "Conservative",
+        "Market Cap": "≥ $50B",
+        "Volatility": "≤ 3%",
+        "Volume Ratio": "≥ 0.8x",
+        "Best For": "Risk-averse investors seeking stability"
+    },
+    {
+        "Strategy": "Aggressive",
+        "Market Cap": "≥ $5B",
+        "Volatility": "≤ 8%",
+        "Volume Ratio": "≥ 0.3x",
+        "Best For": "Risk-tolerant investors seeking growth"
+    },
+    {
+        "Strategy": "Momentum",
+        "Market Cap": "≥ $10B",
+        "Volatility": "≤ 6%",
+        "Volume Ratio": "≥ 1.0x",
+        "Best For": "Trend-following traders"
+    },
+    {
+        "Strategy": "Value",
+        "Market Cap": "≥ $20B",
+        "Volatility": "≤ 4%",
+        "Volume Ratio": "≥ 0.5x",
+        "Best For": "Value investors seeking undervalued stocks"
+    },
+    {
+        "Strategy": "Dividend Focus",
+        "Market Cap": "≥ $30B",
+        "Volatility": "≤ 3.5%",
+        "Volume Ratio": "≥ 0.6x",
+        "Best For": "Income-focused investors"
+    }
+])
+
+
+@st.fragment
+def render_stock_details(stocks_by_symbol, symbols, selected_strategy, selected_period):
+    """Stock picker and detail panel; picking another symbol reruns only this fragment."""
+    restore_widget_state("detail_symbol", symbols)
+    selected_symbol = st.selectbox(
+        "🔎 Select a stock to analyze", 
+        symbols,
+        help="Choose a stock from the filtered list to see detailed analysis",
+        key="detail_symbol"
+    )
+    remember_widget_state("detail_symbol")
+    selected_stock = stocks_by_symbol.get(selected_symbol)
+    if not selected_stock:
+        return
+    
+    # Header with copy button and watchlist
+    header_col1, header_col2, header_col3 = st.columns([3, 1, 1])
+    with header_col1:
+        st.markdown(f"#### 📊 {selected_stock['symbol']} - Overview")
+    with header_col2:
+        st.markdown(create_copy_button_html(selected_stock['symbol'], "copy_detail"), unsafe_allow_html=True)
+    with header_col3:
+        is_in_watchlist = selected_stock['symbol'] in st.session_state.watchlist
+        if is_in_watchlist:
+            if st.button("⭐ Remove from Watchlist", key="remove_watchlist_detail"):
+                remove_from_watchlist(selected_stock['symbol'])
+                st.rerun()
+        else:
+            if st.button("➕ Add to Watchlist", key="add_watchlist_detail"):
+                add_to_watchlist(selected_stock['symbol'])
+                st.success(f"Added {selected_stock['symbol']} to watchlist")
+                st.rerun()
+    
+    # Badges
+    badges = get_performance_badges(selected_stock)
+    if badges:
+        badge_html = '<div class="badge-container">' + "".join([f'<span class="badge-item" style="background: {badge[2]}; color: white;">{badge[0]} {badge[1]}</span>' for badge in badges]) + '</div>'
+        st.markdown(badge_html, unsafe_allow_html=True)
+    
+    # Score visualization
+    score = selected_stock['score']
+    score_col1, score_col2 = st.columns([2, 1])
+    with score_col1:
+        st.markdown(f"**Overall Score: {score:.1f}/100**")
+        st.progress(score / 100)
+    with score_col2:
+        if score >= 80:
+            st.success("🟢 High Score")
+        elif score >= 60:
+            st.warning("🟡 Medium Score")
+        else:
+            st.error("🔴 Low Score")
+    
+    # Metrics in grid
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown("**💰 Price & Value**")
+        st.metric("Current Price", f"${selected_stock['current_price']:.2f}")
+        st.metric("Market Cap", f"${selected_stock['market_cap']/1e9:.1f}B")
+    
+    with col2:
+        st.markdown("**📈 Technical Indicators**")
+        st.metric("RSI", f"{selected_stock['rsi']:.1f}" if selected_stock['rsi'] else "N/A")
+        st.metric("Momentum", f"{selected_stock['momentum']*100:+.2f}%" if selected_stock['momentum'] else "N/A")
+    
+    with col3:
+        st.markdown("**📊 Market Data**")
+        st.metric("Sector", selected_stock['sector'])
+        st.metric("Volume Ratio", f"{selected_stock.get('volume_ratio', 0):.2f}x" if selected_stock.get('volume_ratio') else "N/A")
+    
+    with col4:
+        st.markdown("**🎯 Signal**")
+        signal_status = "✅ BUY" if selected_stock.get('buy_signal') else "⏸️ HOLD"
+        if selected_stock.get('buy_signal'):
+            st.success(f"**{signal_status}**")
+        else:
+            st.info(f"**{signal_status}**")
+        st.caption("Based on technical analysis")
+    
+    # Technical indicators with better formatting
+    st.markdown("---")
+    st.markdown("#### 🔬 Technical Indicators")
+    
+    # Last indicator row snapshotted at ingest, read as plain floats (None if missing or NaN)
+    snapshot = selected_stock.get('latest')
+    if snapshot:
+        latest = row_technicals(snapshot)
+        current_price = selected_stock['current_price']
+        
+        # Each column goes out as a single HTML block rather than one metric/alert element per value
+        tech_col1, tech_col2, tech_col3 = st.columns(3)
+        
+        with tech_col1:
+            rows = []
+            for label, sma in (("SMA 20", latest['SMA_20']), ("SMA 50", latest['SMA_50'])):
+                if sma is not None:
+                    price_vs_sma = ((current_price - sma) / sma) * 100
+                    rows.append((label, f"${sma:.2f}", f"{price_vs_sma:+.1f}%"))
+                else:
+                    rows.append((label, "N/A", None))
+            st.markdown(indicator_panel_html("📈 Moving Averages", rows), unsafe_allow_html=True)
+        
+        with tech_col2:
+            macd = latest['MACD']
+            macd_signal = latest['MACD_Signal']
+            
+            if macd is None:
+                rows = [("MACD", "N/A", None)]
+            elif macd_signal is None:
+                rows = [("MACD", f"{macd:.2f}", None)]
+            else:
+                macd_diff = macd - macd_signal
+                rows = [("MACD", f"{macd:.2f}", f"{macd_diff:+.2f}" if macd_diff != 0 else None)]
+            rows.append(("Signal", f"{macd_signal:.2f}" if macd_signal is not None else "N/A", None))
+            
+            # MACD trend
+            note = None
+            if macd is not None and macd_signal is not None:
+                note = ("🟢 Bullish", "positive") if macd > macd_signal else ("🔴 Bearish", "negative")
+            st.markdown(indicator_panel_html("📊 MACD", rows, note), unsafe_allow_html=True)
+        
+        with tech_col3:
+            volatility = latest['Volatility']
+            rows = [("Volatility", f"{volatility*100:.2f}%" if volatility is not None else "N/A", None)]
+            
+            note = None
+            bb_upper = latest['BB_Upper']
+            bb_lower = latest['BB_Lower']
+            if bb_upper is not None and bb_lower is not None:
+                bb_position = (current_price - bb_lower) / (bb_upper - bb_lower)
+                rows.append(("BB Position", f"{bb_position*100:.1f}%", None))
+                if bb_position < 0.2:
+                    note = ("Near lower band (potentially oversold)", "info")
+                elif bb_position > 0.8:
+                    note = ("Near upper band (potentially overbought)", "warning")
+            else:
+                rows.append(("BB Position", "N/A", None))
+            st.markdown(indicator_panel_html("📉 Volatility & Bands", rows, note), unsafe_allow_html=True)
+    
+    # Price chart with enhanced styling
+    st.markdown("---")
+    st.markdown("#### 📈 Price Chart & Technical Analysis")
+    # Get chart type from session state or use default
+    current_chart_type = st.session_state.get('chart_type', 'candlestick')
+    chart = create_price_chart(selected_stock, selected_symbol, chart_type=current_chart_type)
+    if chart:
+        st.plotly_chart(chart, use_container_width=True, key=f"chart_detail_{selected_symbol}")
+    
+    # Buy signal info with better formatting
+    st.markdown("---")
+    if selected_stock.get('buy_signal'):
+        st.success(f"✅ **BUY Signal Detected**\n\n{selected_stock['buy_reason']}")
+    else:
+        st.info(f"ℹ️ **Analysis:** {selected_stock['buy_reason']}")
+    
+    # Suggested Buy Price
+    st.markdown("---")
+    st.markdown("#### 💰 Suggested Buy Price & Range")
+    ai = get_ai_insights()
+    buy_price_info = ai.calculate_suggested_buy_price(
+        selected_stock, 
+        strategy=selected_strategy,
+        period=selected_period
     )
     
-    # Update axes styling with better grid
-    fig.update_xaxes(
-        showgrid=True, 
-        gridwidth=1, 
-        gridcolor='rgba(0,0,0,0.08)',
-        zeroline=False,
-        showline=True,
-        linewidth=1,
-        linecolor='rgba(0,0,0,0.1)',
-        rangeslider=dict(visible=False)  # Hide range slider for cleaner look
+    price_col1, price_col2, price_col3, price_col4 = st.columns(4)
+    with price_col1:
+        st.metric("Current Price", f"${buy_price_info['current_price']:.2f}")
+    with price_col2:
+        st.metric(
+            "Suggested Price",
+            f"${buy_price_info['suggested_price']:.2f}",
+            delta=f"{buy_price_info['discount_pct']:.1f}% discount" if buy_price_info['discount_pct'] > 0 else f"{abs(buy_price_info['discount_pct']):.1f}% premium"
+        )
+    with price_col3:
+        st.metric("Range Low", f"${buy_price_info['price_range_low']:.2f}")
+    with price_col4:
+        st.metric("Range High", f"${buy_price_info['price_range_high']:.2f}")
+    
+    st.info(f"💡 **Calculation Basis**: {buy_price_info['reasoning']}")
+    
+    if buy_price_info['support_levels']:
+        st.caption("**Support Levels Considered**: " + ", ".join([f"{s[0]} (${s[1]:.2f})" for s in buy_price_info['support_levels'][:3]]))
+    
+    # AI Insight, Recommendation and Score Explanation for selected stock
+    st.markdown("---")
+    render_ai_analysis(ai, selected_stock, "####", "🤖 AI Insight")
+
+
+@st.fragment
+def render_ai_stock_analysis(stocks_by_symbol, symbols, selected_strategy, selected_period):
+    """AI stock picker and analysis; picking another symbol reruns only this fragment."""
+    ai = get_ai_insights()
+    restore_widget_state("ai_symbol", symbols)
+    selected_ai_stock = st.selectbox(
+        "Select a stock for AI analysis",
+        symbols,
+        help="Choose a stock to see detailed AI insights",
+        key="ai_symbol"
     )
-    fig.update_yaxes(
-        showgrid=True, 
-        gridwidth=1, 
-        gridcolor='rgba(0,0,0,0.08)',
-        zeroline=False,
-        showline=True,
-        linewidth=1,
-        linecolor='rgba(0,0,0,0.1)'
+    remember_widget_state("ai_symbol")
+    selected_ai_stock_data = stocks_by_symbol.get(selected_ai_stock)
+    if not selected_ai_stock_data:
+        return
+    
+    # Suggested Buy Price
+    st.markdown(f"##### 💰 Suggested Buy Price for {selected_ai_stock}")
+    buy_price_info = ai.calculate_suggested_buy_price(
+        selected_ai_stock_data, 
+        strategy=selected_strategy,
+        period=selected_period
     )
     
-    # For candlestick charts, update the first subplot y-axis title
-    if chart_type == 'candlestick' and all(col in data.columns for col in ['Open', 'High', 'Low', 'Close']):
-        fig.update_yaxes(title_text="Price ($)", row=1, col=1)
+    ai_price_col1, ai_price_col2, ai_price_col3 = st.columns(3)
+    with ai_price_col1:
+        st.metric("Suggested Price", f"${buy_price_info['suggested_price']:.2f}")
+    with ai_price_col2:
+        st.metric("Range Low", f"${buy_price_info['price_range_low']:.2f}")
+    with ai_price_col3:
+        st.metric("Range High", f"${buy_price_info['price_range_high']:.2f}")
     
-    return fig
+    st.caption(f"💡 **Basis**: {buy_price_info['reasoning']} | Current: ${buy_price_info['current_price']:.2f}")
+    
+    st.markdown("---")
+    
+    # AI Insight, Recommendation and Score Explanation
+    render_ai_analysis(ai, selected_ai_stock_data, "#####", f"📈 AI Insight for {selected_ai_stock}")
 
 
 def main():
     """Main application function."""
+    # Enhanced CSS for modern, professional styling with animations and improved UX
+    st.markdown(f"<style>{load_app_css()}</style>", unsafe_allow_html=True)
+    
     # Initialize session state
     initialize_session_state()
     
@@ -1403,26 +1476,17 @@ def main():
         
         # Strategy Presets with better organization
         st.markdown("### 📋 Strategy Presets")
-        strategy_presets = get_strategy_presets()
         selected_strategy = st.selectbox(
             "Select a strategy preset",
-            options=list(strategy_presets.keys()),
+            options=list(STRATEGY_PRESETS),
             index=0,
             help="Choose a pre-configured strategy. Each strategy has optimized filter settings for different investment styles.",
             key="strategy_select"
         )
         
         # Show strategy description immediately
-        strategy_descriptions = {
-            "Default": "Balanced approach with standard filter settings suitable for most investors.",
-            "Conservative": "Focus on large-cap, low-volatility stocks. Lower risk, stable returns.",
-            "Aggressive": "Includes smaller companies and higher volatility. Higher risk, potential for higher returns.",
-            "Momentum": "Emphasizes stocks with strong price momentum and high volume. Trend-following strategy.",
-            "Value": "Targets established companies at reasonable prices. Value investing approach.",
-            "Dividend Focus": "Prioritizes large, stable companies suitable for income investing."
-        }
-        if selected_strategy in strategy_descriptions:
-            st.caption(f"💡 {strategy_descriptions[selected_strategy]}")
+        if selected_strategy in STRATEGY_DESCRIPTIONS:
+            st.caption(f"💡 {STRATEGY_DESCRIPTIONS[selected_strategy]}")
         
         st.markdown("---")
         
@@ -1430,56 +1494,26 @@ def main():
         st.markdown("### ⏱️ Time Range Settings")
         
         # Period selector (time range)
-        period_options = {
-            "1 Month": "1mo",
-            "3 Months": "3mo",
-            "6 Months": "6mo",
-            "1 Year": "1y",
-            "2 Years": "2y",
-            "5 Years": "5y",
-            "10 Years": "10y",
-            "Year to Date": "ytd",
-            "Maximum Available": "max"
-        }
-        
         selected_period_label = st.selectbox(
             "Time Period",
-            options=list(period_options.keys()),
+            options=list(PERIOD_OPTIONS),
             index=3,  # Default to "1 Year"
             help="Select the historical time period for analysis. Longer periods provide more data but may include outdated trends."
         )
-        selected_period = period_options[selected_period_label]
+        selected_period = PERIOD_OPTIONS[selected_period_label]
         
         # Interval selector (data frequency)
         # Note: Intraday intervals (1m-1h) are only available for periods up to 60 days
-        interval_options = {
-            "1 Minute": "1m",
-            "2 Minutes": "2m",
-            "5 Minutes": "5m",
-            "15 Minutes": "15m",
-            "30 Minutes": "30m",
-            "60 Minutes": "60m",
-            "90 Minutes": "90m",
-            "Hourly": "1h",
-            "Daily": "1d",
-            "Weekly": "1wk",
-            "Monthly": "1mo",
-            "Quarterly": "3mo"
-        }
-        
         selected_interval_label = st.selectbox(
             "Data Interval",
-            options=list(interval_options.keys()),
+            options=list(INTERVAL_OPTIONS),
             index=8,  # Default to "Daily"
             help="Select the data frequency. Intraday intervals (1m-1h) are only available for periods up to 60 days. Daily provides most detail for longer periods."
         )
-        selected_interval = interval_options[selected_interval_label]
+        selected_interval = INTERVAL_OPTIONS[selected_interval_label]
         
         # Validate period/interval combination
-        intraday_intervals = ["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"]
-        long_periods = ["6mo", "1y", "2y", "5y", "10y", "ytd", "max"]
-        
-        if selected_interval in intraday_intervals and selected_period in long_periods:
+        if selected_interval in INTRADAY_INTERVALS and selected_period in LONG_PERIODS:
             st.warning(f"⚠️ **Note:** {selected_interval_label} data is typically only available for periods up to 60 days. Consider using '1 Month' or '3 Months' period, or switch to Daily/Weekly intervals for longer periods.")
         
         st.caption(f"📊 Analyzing data: {selected_period_label} period with {selected_interval_label.lower()} intervals")
@@ -1502,7 +1536,7 @@ def main():
                     "Min Market Cap (B)", 
                     min_value=1.0, 
                     max_value=1000.0, 
-                    value=float(strategy_presets[selected_strategy]['min_market_cap']/1e9),
+                    value=float(STRATEGY_PRESETS[selected_strategy]['min_market_cap']/1e9),
                     step=1.0,
                     help="Minimum market capitalization in billions"
                 )
@@ -1510,7 +1544,7 @@ def main():
                     "Min Daily Volume", 
                     min_value=100_000, 
                     max_value=10_000_000, 
-                    value=int(strategy_presets[selected_strategy]['min_volume']),
+                    value=int(STRATEGY_PRESETS[selected_strategy]['min_volume']),
                     step=100_000,
                     format="%d",
                     help="Minimum daily trading volume"
@@ -1521,14 +1555,14 @@ def main():
                     "Min Price ($)", 
                     min_value=1.0, 
                     max_value=100.0, 
-                    value=float(strategy_presets[selected_strategy]['min_price']),
+                    value=float(STRATEGY_PRESETS[selected_strategy]['min_price']),
                     step=1.0
                 )
                 max_price = st.number_input(
                     "Max Price ($)", 
                     min_value=10.0, 
                     max_value=2000.0, 
-                    value=float(strategy_presets[selected_strategy]['max_price']),
+                    value=float(STRATEGY_PRESETS[selected_strategy]['max_price']),
                     step=10.0
                 )
             
@@ -1537,38 +1571,31 @@ def main():
                     "Min RSI", 
                     min_value=0, 
                     max_value=50, 
-                    value=int(strategy_presets[selected_strategy]['min_rsi'])
+                    value=int(STRATEGY_PRESETS[selected_strategy]['min_rsi'])
                 )
                 max_rsi = st.slider(
                     "Max RSI", 
                     min_value=50, 
                     max_value=100, 
-                    value=int(strategy_presets[selected_strategy]['max_rsi'])
+                    value=int(STRATEGY_PRESETS[selected_strategy]['max_rsi'])
                 )
                 max_volatility = st.slider(
                     "Max Volatility (%)", 
                     min_value=1, 
                     max_value=10, 
-                    value=int(strategy_presets[selected_strategy]['max_volatility']*100)
+                    value=int(STRATEGY_PRESETS[selected_strategy]['max_volatility']*100)
                 )
                 min_volume_ratio = st.slider(
                     "Min Volume Ratio", 
                     min_value=0.0, 
                     max_value=2.0, 
-                    value=float(strategy_presets[selected_strategy]['min_volume_ratio']),
+                    value=float(STRATEGY_PRESETS[selected_strategy]['min_volume_ratio']),
                     step=0.1
                 )
         else:
             # Show strategy description
-            strategy_descriptions = {
-                "Conservative": "Focus on large-cap, low-volatility stocks. Lower risk, stable returns.",
-                "Aggressive": "Includes smaller companies and higher volatility. Higher risk, potential for higher returns.",
-                "Momentum": "Emphasizes stocks with strong price momentum and high volume. Trend-following strategy.",
-                "Value": "Targets established companies at reasonable prices. Value investing approach.",
-                "Dividend Focus": "Prioritizes large, stable companies suitable for income investing."
-            }
-            if selected_strategy in strategy_descriptions:
-                st.info(f"**{selected_strategy} Strategy:**\n{strategy_descriptions[selected_strategy]}")
+            if selected_strategy != "Default":
+                st.info(f"**{selected_strategy} Strategy:**\n{STRATEGY_DESCRIPTIONS[selected_strategy]}")
         
         st.markdown("---")
         
@@ -1632,7 +1659,7 @@ def main():
                 'max_volatility': max_volatility / 100
             }
         else:
-            custom_filters = strategy_presets[selected_strategy].copy()
+            custom_filters = STRATEGY_PRESETS[selected_strategy].copy()
             # Remove min_data_points from strategy preset so adaptive calculation applies
             if 'min_data_points' in custom_filters:
                 del custom_filters['min_data_points']
@@ -1651,6 +1678,7 @@ def main():
         
         if refresh_data:
             st.cache_data.clear()
+            get_data_fetcher().clear_cache()
             st.session_state.last_updated = datetime.now()
             st.rerun()
         
@@ -1689,11 +1717,11 @@ def main():
     
     # Initialize system with enhanced loading state
     # Check if we need to refresh (new filters, period, interval, or strategy)
+    current_filters_key = filters_key(custom_filters)
     needs_refresh = (
         'qualified_stocks' not in st.session_state or 
         refresh_data or 
-        'custom_filters' not in st.session_state or 
-        st.session_state.get('custom_filters') != custom_filters or
+        st.session_state.get('filters_key') != current_filters_key or
         st.session_state.get('period') != selected_period or
         st.session_state.get('interval') != selected_interval or
         st.session_state.get('selected_strategy') != selected_strategy
@@ -1719,8 +1747,8 @@ def main():
         
         # Fetch data (now with parallel processing for better performance)
         try:
-            qualified_stocks, data_fetcher = get_stock_data(
-                custom_filters=custom_filters,
+            qualified_stocks, stock_arrays = get_stock_data(
+                custom_filters=current_filters_key,
                 period=selected_period,
                 interval=selected_interval
             )
@@ -1755,18 +1783,20 @@ def main():
             with st.expander("🔍 Technical Details"):
                 st.code(traceback.format_exc())
             qualified_stocks = []
-            data_fetcher = DataFetcher()
+            stock_arrays = build_stock_arrays(qualified_stocks)
         
         st.session_state.qualified_stocks = qualified_stocks
-        st.session_state.data_fetcher = data_fetcher
+        st.session_state.stock_arrays = stock_arrays
+        st.session_state.data_version = st.session_state.get('data_version', 0) + 1
         st.session_state.custom_filters = custom_filters
+        st.session_state.filters_key = current_filters_key
         st.session_state.selected_strategy = selected_strategy
         st.session_state.period = selected_period
         st.session_state.interval = selected_interval
         st.session_state.chart_type = chart_type_lower
     else:
         qualified_stocks = st.session_state.qualified_stocks
-        data_fetcher = st.session_state.data_fetcher
+        stock_arrays = st.session_state.stock_arrays
         # Update chart type if changed
         if 'chart_type' not in st.session_state or st.session_state.get('chart_type') != chart_type_lower:
             st.session_state.chart_type = chart_type_lower
@@ -1851,27 +1881,16 @@ def main():
         
         return
     
-    # Generate buy signals
-    strategy = TradingStrategy()
-    buy_signals = []
-    for stock in qualified_stocks:
-        should_buy, reason = strategy.generate_buy_signal(stock)
-        stock['buy_signal'] = should_buy
-        stock['buy_reason'] = reason
-        if should_buy:
-            buy_signals.append(stock)
-    
-    # Apply filters
-    filtered_stocks = qualified_stocks[:top_n]
-    
-    if min_score > 0:
-        filtered_stocks = [s for s in filtered_stocks if s['score'] >= min_score]
+    # Buy signals are attached by get_stock_data
+    buy_signals = [qualified_stocks[i] for i in np.flatnonzero(stock_arrays.buy_signals)]
     
+    # Apply filters as one boolean mask over the top N stocks
+    keep = stock_arrays.scores[:top_n] >= min_score
     if sectors:
-        filtered_stocks = [s for s in filtered_stocks if s['sector'] in sectors]
-    
+        keep &= np.isin(stock_arrays.sectors[:top_n], sectors)
     if show_buy_signals_only:
-        filtered_stocks = [s for s in filtered_stocks if s.get('buy_signal', False)]
+        keep &= stock_arrays.buy_signals[:top_n]
+    filtered_idx = np.flatnonzero(keep)
     
     # Enhanced Summary metrics with visual cards
     st.markdown("### 📊 Analysis Summary")
@@ -1964,13 +1983,25 @@ def main():
     
     # Apply quick filter if active
     if st.session_state.active_quick_filter == 'top10':
-        filtered_stocks = filtered_stocks[:10]
+        filtered_idx = filtered_idx[:10]
     elif st.session_state.active_quick_filter == 'buy':
-        filtered_stocks = [s for s in filtered_stocks if s.get('buy_signal', False)]
+        filtered_idx = filtered_idx[stock_arrays.buy_signals[filtered_idx]]
     elif st.session_state.active_quick_filter == 'highscore':
-        filtered_stocks = [s for s in filtered_stocks if s['score'] >= 80]
+        filtered_idx = filtered_idx[stock_arrays.scores[filtered_idx] >= 80]
     elif st.session_state.active_quick_filter == 'momentum':
-        filtered_stocks = [s for s in filtered_stocks if s.get('momentum', 0) > 0.03]
+        filtered_idx = filtered_idx[stock_arrays.momentum[filtered_idx] > 0.03]
+    
+    filtered_stocks = [qualified_stocks[i] for i in filtered_idx]
+    
+    # Symbol index and symbol list of the filtered list, rebuilt only when the data or the
+    # filtered positions change
+    filtered_version = (st.session_state.data_version, filtered_idx.tobytes())
+    if st.session_state.get('filtered_version') != filtered_version:
+        st.session_state.stocks_by_symbol = {s['symbol']: s for s in filtered_stocks}
+        st.session_state.filtered_symbols = list(st.session_state.stocks_by_symbol)
+        st.session_state.filtered_version = filtered_version
+    stocks_by_symbol = st.session_state.stocks_by_symbol
+    filtered_symbols = st.session_state.filtered_symbols
     
     # Last updated timestamp
     last_updated_time = st.session_state.get('last_updated', datetime.now())
@@ -1978,77 +2009,40 @@ def main():
     
     st.markdown("---")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(
-            f"""
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                        padding: 1.5rem; border-radius: 12px; text-align: center; 
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <h3 style="color: white; margin: 0; font-size: 2rem;">{len(config.STOCK_UNIVERSE)}</h3>
-                <p style="color: white; margin: 0.5rem 0 0 0; font-size: 0.9rem;">Total Analyzed</p>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-    
-    with col2:
-        st.markdown(
-            f"""
-            <div style="background: linear-gradient(135deg, #10b981 0%, #059669 100%); 
-                        padding: 1.5rem; border-radius: 12px; text-align: center; 
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <h3 style="color: white; margin: 0; font-size: 2rem;">{len(qualified_stocks)}</h3>
-                <p style="color: white; margin: 0.5rem 0 0 0; font-size: 0.9rem;">Qualified Stocks</p>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-    
-    with col3:
-        st.markdown(
-            f"""
-            <div style="background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%); 
-                        padding: 1.5rem; border-radius: 12px; text-align: center; 
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <h3 style="color: white; margin: 0; font-size: 2rem;">{len(buy_signals)}</h3>
-                <p style="color: white; margin: 0.5rem 0 0 0; font-size: 0.9rem;">BUY Signals</p>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-    
-    with col4:
-        qualification_rate = (len(qualified_stocks) / len(config.STOCK_UNIVERSE)) * 100
-        st.markdown(
-            f"""
-            <div style="background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%); 
-                        padding: 1.5rem; border-radius: 12px; text-align: center; 
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <h3 style="color: white; margin: 0; font-size: 2rem;">{qualification_rate:.1f}%</h3>
-                <p style="color: white; margin: 0.5rem 0 0 0; font-size: 0.9rem;">Qualification Rate</p>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+    qualification_rate = (len(qualified_stocks) / len(config.STOCK_UNIVERSE)) * 100
+    summary_cards = (
+        ('#667eea 0%, #764ba2 100%', len(config.STOCK_UNIVERSE), "Total Analyzed"),
+        ('#10b981 0%, #059669 100%', len(qualified_stocks), "Qualified Stocks"),
+        ('#f59e0b 0%, #d97706 100%', len(buy_signals), "BUY Signals"),
+        ('#3b82f6 0%, #2563eb 100%', f"{qualification_rate:.1f}%", "Qualification Rate"),
+    )
+    for col, (gradient, value, label) in zip(st.columns(4), summary_cards):
+        with col:
+            st.markdown(SUMMARY_CARD_HTML.format(gradient=gradient, value=value, label=label), unsafe_allow_html=True)
     
     st.markdown("---")
     
-    # Main content area
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9 = st.tabs([
-        "📊 Stock Rankings", 
-        "📈 Top Recommendations", 
-        "🔍 Stock Details", 
-        "🔎 Stock Search",
-        "⚖️ Compare Stocks",
-        "🤖 AI Insights",
-        "💼 My Portfolio",
-        "📚 How It Works",
-        "⚖️ Legal"
-    ])
-    
-    with tab1:
+    # Main content area: st.tabs would run every tab body on each rerun, so only
+    # the selected view is built (charts and AI analysis stay idle elsewhere)
+    active_view = st.radio(
+        "View",
+        [
+            "📊 Stock Rankings", 
+            "📈 Top Recommendations", 
+            "🔍 Stock Details", 
+            "🔎 Stock Search",
+            "⚖️ Compare Stocks",
+            "🤖 AI Insights",
+            "💼 My Portfolio",
+            "📚 How It Works",
+            "⚖️ Legal"
+        ],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="active_view"
+    )
+    
+    if active_view == "📊 Stock Rankings":
         st.markdown("### 📊 Stock Rankings")
         st.markdown("Ranked by quantitative score (0-100). Higher scores indicate better opportunities.")
         
@@ -2082,8 +2076,9 @@ def main():
             
             # Statistics row
             if filtered_stocks:
-                avg_score = sum(s['score'] for s in filtered_stocks) / len(filtered_stocks)
-                high_scores = sum(1 for s in filtered_stocks if s['score'] >= 80)
+                filtered_scores = stock_arrays.scores[filtered_idx]
+                avg_score = filtered_scores.mean()
+                high_scores = int(np.count_nonzero(filtered_scores >= 80))
                 
                 stat_col1, stat_col2, stat_col3 = st.columns(3)
                 with stat_col1:
@@ -2091,7 +2086,7 @@ def main():
                 with stat_col2:
                     st.metric("High Scores (≥80)", high_scores)
                 with stat_col3:
-                    st.metric("BUY Signals", sum(1 for s in filtered_stocks if s.get('buy_signal', False)))
+                    st.metric("BUY Signals", int(np.count_nonzero(stock_arrays.buy_signals[filtered_idx])))
             
             # Download button with better styling
             csv = df.to_csv(index=False)
@@ -2105,13 +2100,13 @@ def main():
                     use_container_width=True
                 )
     
-    with tab2:
+    if active_view == "📈 Top Recommendations":
         st.markdown("### 📈 Top BUY Recommendations")
         st.markdown("Stocks with strong BUY signals based on technical analysis.")
         
         if buy_signals:
             # Sort by score
-            top_buy = sorted(buy_signals, key=lambda x: x['score'], reverse=True)[:10]
+            top_buy = heapq.nlargest(10, buy_signals, key=itemgetter('score'))
             
             # Summary cards at top
             st.markdown("#### 🎯 Quick Overview")
@@ -2122,21 +2117,19 @@ def main():
             with quick_col2:
                 st.metric("Top Recommendations", len(top_buy))
             with quick_col3:
-                top_sector = max(set(s['sector'] for s in top_buy), key=list(s['sector'] for s in top_buy).count)
+                top_sector = Counter(s['sector'] for s in top_buy).most_common(1)[0][0]
                 st.metric("Top Sector", top_sector)
             
             st.markdown("---")
             
+            ai = get_ai_insights()
+            
+            # Score badge colors for every card at once
+            badge_colors = score_badges([s['score'] for s in top_buy], cuts=(80, 90))
+            
             # Individual stock cards
-            for i, stock in enumerate(top_buy, 1):
-                # Score badge color
+            for i, (stock, badge_color) in enumerate(zip(top_buy, badge_colors), 1):
                 score = stock['score']
-                if score >= 90:
-                    badge_color = "🟢"
-                elif score >= 80:
-                    badge_color = "🟡"
-                else:
-                    badge_color = "🔴"
                 
                 # Get badges for this stock
                 badges = get_performance_badges(stock)
@@ -2181,9 +2174,6 @@ def main():
                     # BUY signal reason in highlighted box
                     st.success(f"✅ **BUY Signal:** {stock['buy_reason']}")
                     
-                    # Initialize AI insights
-                    ai = AIInsights()
-                    
                     # Suggested Buy Price
                     st.markdown("#### 💰 Suggested Buy Price")
                     buy_price_info = ai.calculate_suggested_buy_price(
@@ -2292,11 +2282,10 @@ def main():
                     
                     # AI Insight for each recommendation
                     st.markdown("#### 🤖 AI Insight")
-                    ai_insight = ai.generate_stock_insight(stock)
+                    ai_insight, recommendation = generate_ai_analysis(ai, stock)
                     st.markdown(ai_insight)
                     
                     # AI Recommendation
-                    recommendation = ai.generate_recommendation(stock)
                     st.markdown("#### 🎯 Full AI Recommendation")
                     st.markdown(recommendation['summary'])
                     
@@ -2319,7 +2308,7 @@ def main():
             st.warning("⚠️ **No BUY signals found** in the current analysis. Try adjusting your filters or strategy.")
             st.info("💡 **Tips to find more BUY signals:**\n- Try the 'Momentum' or 'Aggressive' strategy presets\n- Lower the minimum score filter\n- Adjust RSI range to allow more oversold conditions\n- Check different sectors")
     
-    with tab3:
+    if active_view == "🔍 Stock Details":
         st.markdown("### 🔍 Detailed Stock Analysis")
         st.markdown("Select a stock to view comprehensive technical analysis and indicators.")
         
@@ -2333,217 +2322,9 @@ def main():
             """, unsafe_allow_html=True)
             st.warning("No stocks available. Please adjust your filters.")
         else:
-            # Stock selector with search
-            stock_symbols = [s['symbol'] for s in filtered_stocks]
-            selected_symbol = st.selectbox(
-                "🔎 Select a stock to analyze", 
-                stock_symbols,
-                help="Choose a stock from the filtered list to see detailed analysis"
-            )
-        
-        if selected_symbol:
-            selected_stock = next((s for s in filtered_stocks if s['symbol'] == selected_symbol), None)
-            
-            if selected_stock:
-                # Header with copy button and watchlist
-                header_col1, header_col2, header_col3 = st.columns([3, 1, 1])
-                with header_col1:
-                    st.markdown(f"#### 📊 {selected_stock['symbol']} - Overview")
-                with header_col2:
-                    st.markdown(create_copy_button_html(selected_stock['symbol'], "copy_detail"), unsafe_allow_html=True)
-                with header_col3:
-                    is_in_watchlist = selected_stock['symbol'] in st.session_state.watchlist
-                    if is_in_watchlist:
-                        if st.button("⭐ Remove from Watchlist", key="remove_watchlist_detail"):
-                            remove_from_watchlist(selected_stock['symbol'])
-                            st.rerun()
-                    else:
-                        if st.button("➕ Add to Watchlist", key="add_watchlist_detail"):
-                            add_to_watchlist(selected_stock['symbol'])
-                            st.success(f"Added {selected_stock['symbol']} to watchlist")
-                            st.rerun()
-                
-                # Badges
-                badges = get_performance_badges(selected_stock)
-                if badges:
-                    badge_html = '<div class="badge-container">' + "".join([f'<span class="badge-item" style="background: {badge[2]}; color: white;">{badge[0]} {badge[1]}</span>' for badge in badges]) + '</div>'
-                    st.markdown(badge_html, unsafe_allow_html=True)
-                
-                # Score visualization
-                score = selected_stock['score']
-                score_col1, score_col2 = st.columns([2, 1])
-                with score_col1:
-                    st.markdown(f"**Overall Score: {score:.1f}/100**")
-                    st.progress(score / 100)
-                with score_col2:
-                    if score >= 80:
-                        st.success("🟢 High Score")
-                    elif score >= 60:
-                        st.warning("🟡 Medium Score")
-                    else:
-                        st.error("🔴 Low Score")
-                
-                # Metrics in grid
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.markdown("**💰 Price & Value**")
-                    st.metric("Current Price", f"${selected_stock['current_price']:.2f}")
-                    st.metric("Market Cap", f"${selected_stock['market_cap']/1e9:.1f}B")
-                
-                with col2:
-                    st.markdown("**📈 Technical Indicators**")
-                    st.metric("RSI", f"{selected_stock['rsi']:.1f}" if selected_stock['rsi'] else "N/A")
-                    st.metric("Momentum", f"{selected_stock['momentum']*100:+.2f}%" if selected_stock['momentum'] else "N/A")
-                
-                with col3:
-                    st.markdown("**📊 Market Data**")
-                    st.metric("Sector", selected_stock['sector'])
-                    st.metric("Volume Ratio", f"{selected_stock.get('volume_ratio', 0):.2f}x" if selected_stock.get('volume_ratio') else "N/A")
-                
-                with col4:
-                    st.markdown("**🎯 Signal**")
-                    signal_status = "✅ BUY" if selected_stock.get('buy_signal') else "⏸️ HOLD"
-                    if selected_stock.get('buy_signal'):
-                        st.success(f"**{signal_status}**")
-                    else:
-                        st.info(f"**{signal_status}**")
-                    st.caption("Based on technical analysis")
-                
-                # Technical indicators with better formatting
-                st.markdown("---")
-                st.markdown("#### 🔬 Technical Indicators")
-                
-                data = selected_stock.get('data')
-                if data is not None and not data.empty:
-                    latest = data.iloc[-1]
-                    
-                    tech_col1, tech_col2, tech_col3 = st.columns(3)
-                    
-                    with tech_col1:
-                        st.markdown("**📈 Moving Averages**")
-                        sma20 = latest.get('SMA_20', None)
-                        sma50 = latest.get('SMA_50', None)
-                        current_price = selected_stock['current_price']
-                        
-                        if pd.notna(sma20):
-                            price_vs_sma20 = ((current_price - sma20) / sma20) * 100
-                            st.metric("SMA 20", f"${sma20:.2f}", f"{price_vs_sma20:+.1f}%")
-                        else:
-                            st.metric("SMA 20", "N/A")
-                        
-                        if pd.notna(sma50):
-                            price_vs_sma50 = ((current_price - sma50) / sma50) * 100
-                            st.metric("SMA 50", f"${sma50:.2f}", f"{price_vs_sma50:+.1f}%")
-                        else:
-                            st.metric("SMA 50", "N/A")
-                    
-                    with tech_col2:
-                        st.markdown("**📊 MACD**")
-                        macd = latest.get('MACD', None)
-                        macd_signal = latest.get('MACD_Signal', None)
-                        
-                        if pd.notna(macd):
-                            macd_diff = macd - macd_signal if pd.notna(macd_signal) else 0
-                            st.metric("MACD", f"{macd:.2f}", f"{macd_diff:+.2f}" if macd_diff != 0 else "")
-                        else:
-                            st.metric("MACD", "N/A")
-                        
-                        if pd.notna(macd_signal):
-                            st.metric("Signal", f"{macd_signal:.2f}")
-                        else:
-                            st.metric("Signal", "N/A")
-                        
-                        # MACD trend
-                        if pd.notna(macd) and pd.notna(macd_signal):
-                            if macd > macd_signal:
-                                st.success("🟢 Bullish")
-                            else:
-                                st.error("🔴 Bearish")
-                    
-                    with tech_col3:
-                        st.markdown("**📉 Volatility & Bands**")
-                        volatility = latest.get('Volatility', None)
-                        if pd.notna(volatility):
-                            st.metric("Volatility", f"{volatility*100:.2f}%")
-                        else:
-                            st.metric("Volatility", "N/A")
-                        
-                        bb_upper = latest.get('BB_Upper', None)
-                        bb_lower = latest.get('BB_Lower', None)
-                        if pd.notna(bb_upper) and pd.notna(bb_lower):
-                            bb_position = (current_price - bb_lower) / (bb_upper - bb_lower)
-                            st.metric("BB Position", f"{bb_position*100:.1f}%")
-                            if bb_position < 0.2:
-                                st.info("Near lower band (potentially oversold)")
-                            elif bb_position > 0.8:
-                                st.warning("Near upper band (potentially overbought)")
-                        else:
-                            st.metric("BB Position", "N/A")
-                
-                # Price chart with enhanced styling
-                st.markdown("---")
-                st.markdown("#### 📈 Price Chart & Technical Analysis")
-                # Get chart type from session state or use default
-                current_chart_type = st.session_state.get('chart_type', 'candlestick')
-                chart = create_price_chart(selected_stock, selected_symbol, chart_type=current_chart_type)
-                if chart:
-                    st.plotly_chart(chart, use_container_width=True, key=f"chart_detail_{selected_symbol}")
-                
-                # Buy signal info with better formatting
-                st.markdown("---")
-                if selected_stock.get('buy_signal'):
-                    st.success(f"✅ **BUY Signal Detected**\n\n{selected_stock['buy_reason']}")
-                else:
-                    st.info(f"ℹ️ **Analysis:** {selected_stock['buy_reason']}")
-                
-                # Suggested Buy Price
-                st.markdown("---")
-                st.markdown("#### 💰 Suggested Buy Price & Range")
-                ai = AIInsights()
-                buy_price_info = ai.calculate_suggested_buy_price(
-                    selected_stock, 
-                    strategy=selected_strategy,
-                    period=selected_period
-                )
-                
-                price_col1, price_col2, price_col3, price_col4 = st.columns(4)
-                with price_col1:
-                    st.metric("Current Price", f"${buy_price_info['current_price']:.2f}")
-                with price_col2:
-                    st.metric(
-                        "Suggested Price",
-                        f"${buy_price_info['suggested_price']:.2f}",
-                        delta=f"{buy_price_info['discount_pct']:.1f}% discount" if buy_price_info['discount_pct'] > 0 else f"{abs(buy_price_info['discount_pct']):.1f}% premium"
-                    )
-                with price_col3:
-                    st.metric("Range Low", f"${buy_price_info['price_range_low']:.2f}")
-                with price_col4:
-                    st.metric("Range High", f"${buy_price_info['price_range_high']:.2f}")
-                
-                st.info(f"💡 **Calculation Basis**: {buy_price_info['reasoning']}")
-                
-                if buy_price_info['support_levels']:
-                    st.caption("**Support Levels Considered**: " + ", ".join([f"{s[0]} (${s[1]:.2f})" for s in buy_price_info['support_levels'][:3]]))
-                
-                # AI Insight for selected stock
-                st.markdown("---")
-                st.markdown("#### 🤖 AI Insight")
-                ai_insight = ai.generate_stock_insight(selected_stock)
-                st.markdown(ai_insight)
-                
-                # AI Recommendation
-                st.markdown("---")
-                st.markdown("#### 🎯 AI Recommendation")
-                recommendation = ai.generate_recommendation(selected_stock)
-                st.markdown(recommendation['summary'])
-                
-                # Score Explanation
-                st.markdown("#### 📊 Score Explanation")
-                score_explanation = ai.explain_score(selected_stock)
-                st.markdown(score_explanation)
+            render_stock_details(stocks_by_symbol, filtered_symbols, selected_strategy, selected_period)
     
-    with tab4:
+    if active_view == "🔎 Stock Search":
         st.markdown("### 🔎 Stock Search")
         st.markdown("Search for any stock by symbol to get comprehensive analysis and insights.")
         
@@ -2582,23 +2363,19 @@ def main():
             else:
                 with st.spinner(f"🔍 **Analyzing {search_symbol}...** Fetching data and calculating indicators..."):
                     try:
-                        # Initialize data fetcher
-                        search_data_fetcher = DataFetcher()
+                        search_data_fetcher = get_data_fetcher()
                         
-                        # Fetch stock data
-                        stock_data = search_data_fetcher.get_stock_data(
+                        # Fetch stock data with technical indicators
+                        stock_data = get_symbol_history(
                             search_symbol, 
                             period=search_period, 
                             interval=search_interval
                         )
                         
-                        if stock_data is None or stock_data.empty:
+                        if stock_data is None:
                             st.error(f"❌ **Error**: Could not fetch data for {search_symbol}. Please check the symbol and try again.")
                             st.info("💡 **Tip**: Make sure you're using the correct ticker symbol (e.g., AAPL for Apple, not APPL).")
                         else:
-                            # Calculate technical indicators
-                            stock_data = search_data_fetcher.calculate_technical_indicators(stock_data)
-                            
                             # Get stock info
                             stock_info = search_data_fetcher.get_stock_info(search_symbol)
                             
@@ -2617,15 +2394,15 @@ def main():
                                 }
                             
                             # Create stock data structure for analysis
-                            latest = stock_data.iloc[-1]
-                            current_price = float(latest['Close'])
+                            current_price = float(stock_data['Close'].iloc[-1])
+                            technicals = latest_technicals(stock_data, SEARCH_TECHNICAL_COLUMNS)
                             
                             searched_stock = {
                                 'symbol': search_symbol,
                                 'current_price': current_price,
-                                'rsi': float(latest['RSI']) if not pd.isna(latest['RSI']) else None,
-                                'momentum': float(latest['Momentum']) if not pd.isna(latest['Momentum']) else None,
-                                'volume_ratio': float(latest['Volume_Ratio']) if not pd.isna(latest['Volume_Ratio']) else None,
+                                'rsi': technicals['RSI'],
+                                'momentum': technicals['Momentum'],
+                                'volume_ratio': technicals['Volume_Ratio'],
                                 'market_cap': stock_info.get('market_cap', 0),
                                 'sector': stock_info.get('sector', 'Unknown'),
                                 'industry': stock_info.get('industry', 'Unknown'),
@@ -2672,12 +2449,7 @@ def main():
                                 
                                 # Score with color coding
                                 score = searched_stock['score']
-                                if score >= 80:
-                                    score_display = f"🟢 {score:.1f}"
-                                elif score >= 60:
-                                    score_display = f"🟡 {score:.1f}"
-                                else:
-                                    score_display = f"🔴 {score:.1f}"
+                                score_display = f"{score_badges([score])[0]} {score:.1f}"
                                 st.metric("Quantitative Score", score_display)
                             
                             with overview_col2:
@@ -2730,23 +2502,23 @@ def main():
                             
                             with tech_detail_col1:
                                 st.markdown("**📈 Moving Averages**")
-                                sma20 = latest.get('SMA_20', None)
-                                sma50 = latest.get('SMA_50', None)
-                                sma200 = latest.get('SMA_200', None)
+                                sma20 = technicals['SMA_20']
+                                sma50 = technicals['SMA_50']
+                                sma200 = technicals['SMA_200']
                                 
-                                if pd.notna(sma20):
+                                if sma20 is not None:
                                     price_vs_sma20 = ((current_price - sma20) / sma20) * 100
                                     st.metric("SMA 20", f"${sma20:.2f}", f"{price_vs_sma20:+.1f}%")
                                 else:
                                     st.metric("SMA 20", "N/A")
                                 
-                                if pd.notna(sma50):
+                                if sma50 is not None:
                                     price_vs_sma50 = ((current_price - sma50) / sma50) * 100
                                     st.metric("SMA 50", f"${sma50:.2f}", f"{price_vs_sma50:+.1f}%")
                                 else:
                                     st.metric("SMA 50", "N/A")
                                 
-                                if pd.notna(sma200):
+                                if sma200 is not None:
                                     price_vs_sma200 = ((current_price - sma200) / sma200) * 100
                                     st.metric("SMA 200", f"${sma200:.2f}", f"{price_vs_sma200:+.1f}%")
                                 else:
@@ -2754,26 +2526,26 @@ def main():
                             
                             with tech_detail_col2:
                                 st.markdown("**📊 MACD Analysis**")
-                                macd = latest.get('MACD', None)
-                                macd_signal = latest.get('MACD_Signal', None)
-                                macd_hist = latest.get('MACD_Histogram', None)
+                                macd = technicals['MACD']
+                                macd_signal = technicals['MACD_Signal']
+                                macd_hist = technicals['MACD_Histogram']
                                 
-                                if pd.notna(macd):
+                                if macd is not None:
                                     st.metric("MACD", f"{macd:.2f}")
                                 else:
                                     st.metric("MACD", "N/A")
                                 
-                                if pd.notna(macd_signal):
+                                if macd_signal is not None:
                                     st.metric("Signal Line", f"{macd_signal:.2f}")
                                 else:
                                     st.metric("Signal Line", "N/A")
                                 
-                                if pd.notna(macd_hist):
+                                if macd_hist is not None:
                                     hist_color = "🟢" if macd_hist > 0 else "🔴"
                                     st.metric("Histogram", f"{hist_color} {macd_hist:.2f}")
                                 
                                 # MACD trend
-                                if pd.notna(macd) and pd.notna(macd_signal):
+                                if macd is not None and macd_signal is not None:
                                     if macd > macd_signal:
                                         st.success("🟢 Bullish Trend")
                                     else:
@@ -2781,17 +2553,17 @@ def main():
                             
                             with tech_detail_col3:
                                 st.markdown("**📉 Volatility & Bands**")
-                                volatility = latest.get('Volatility', None)
-                                if pd.notna(volatility):
+                                volatility = technicals['Volatility']
+                                if volatility is not None:
                                     st.metric("Daily Volatility", f"{volatility*100:.2f}%")
                                 else:
                                     st.metric("Daily Volatility", "N/A")
                                 
-                                bb_upper = latest.get('BB_Upper', None)
-                                bb_lower = latest.get('BB_Lower', None)
-                                bb_middle = latest.get('BB_Middle', None)
+                                bb_upper = technicals['BB_Upper']
+                                bb_lower = technicals['BB_Lower']
+                                bb_middle = technicals['BB_Middle']
                                 
-                                if pd.notna(bb_upper) and pd.notna(bb_lower) and pd.notna(bb_middle):
+                                if bb_upper is not None and bb_lower is not None and bb_middle is not None:
                                     bb_position = (current_price - bb_lower) / (bb_upper - bb_lower)
                                     st.metric("BB Position", f"{bb_position*100:.1f}%")
                                     st.metric("BB Upper", f"${bb_upper:.2f}")
@@ -2818,7 +2590,7 @@ def main():
                             
                             # Suggested Buy Price
                             st.markdown("#### 💰 Suggested Buy Price & Range")
-                            ai = AIInsights()
+                            ai = get_ai_insights()
                             buy_price_info = ai.calculate_suggested_buy_price(
                                 searched_stock, 
                                 strategy=selected_strategy,
@@ -2849,14 +2621,13 @@ def main():
                             
                             # AI Insight
                             st.markdown("#### 🤖 AI Insight")
-                            ai_insight = ai.generate_stock_insight(searched_stock)
+                            ai_insight, recommendation = generate_ai_analysis(ai, searched_stock)
                             st.markdown(ai_insight)
                             
                             st.markdown("---")
                             
                             # AI Recommendation
                             st.markdown("#### 🎯 AI Recommendation")
-                            recommendation = ai.generate_recommendation(searched_stock)
                             
                             rec_col1, rec_col2, rec_col3 = st.columns(3)
                             with rec_col1:
@@ -2879,7 +2650,7 @@ def main():
                             
                             # Score Explanation
                             st.markdown("#### 📊 Score Explanation")
-                            score_explanation = ai.explain_score(searched_stock)
+                            score_explanation = explain_stock_score(ai, searched_stock)
                             st.markdown(score_explanation)
                             
                             # Additional Company Info
@@ -2927,23 +2698,24 @@ def main():
             **💡 Tip**: You can search for any stock listed on major exchanges (NYSE, NASDAQ, etc.)
             """)
     
-    with tab6:
+    if active_view == "🤖 AI Insights":
         st.markdown("### 🤖 AI Insights & Analysis")
         st.markdown("AI-powered insights, recommendations, and market sentiment analysis.")
         
         # Initialize AI Insights
-        ai = AIInsights()
+        ai = get_ai_insights()
         
         # Market Sentiment Section
         st.markdown("#### 📊 Market Sentiment Analysis")
-        market_sentiment = ai.generate_market_sentiment(qualified_stocks)
+        market_sentiment = generate_market_sentiment(ai, qualified_stocks, selection_key(qualified_stocks))
         st.markdown(market_sentiment)
         
         st.markdown("---")
         
         # Portfolio Insight
         st.markdown("#### 💡 Portfolio Overview Insight")
-        portfolio_insight = ai.generate_portfolio_insight(filtered_stocks if filtered_stocks else qualified_stocks)
+        portfolio_stocks = filtered_stocks if filtered_stocks else qualified_stocks
+        portfolio_insight = generate_portfolio_insight(ai, portfolio_stocks, selection_key(portfolio_stocks))
         st.info(portfolio_insight)
         
         st.markdown("---")
@@ -2953,58 +2725,7 @@ def main():
         st.markdown("Select stocks to view AI-powered insights and recommendations.")
         
         if filtered_stocks:
-            # Stock selector for AI insights
-            insight_stocks = [s['symbol'] for s in filtered_stocks]
-            selected_ai_stock = st.selectbox(
-                "Select a stock for AI analysis",
-                insight_stocks,
-                help="Choose a stock to see detailed AI insights"
-            )
-            
-            if selected_ai_stock:
-                selected_ai_stock_data = next((s for s in filtered_stocks if s['symbol'] == selected_ai_stock), None)
-                
-                if selected_ai_stock_data:
-                    # Suggested Buy Price
-                    st.markdown(f"##### 💰 Suggested Buy Price for {selected_ai_stock}")
-                    buy_price_info = ai.calculate_suggested_buy_price(
-                        selected_ai_stock_data, 
-                        strategy=selected_strategy,
-                        period=selected_period
-                    )
-                    
-                    ai_price_col1, ai_price_col2, ai_price_col3 = st.columns(3)
-                    with ai_price_col1:
-                        st.metric("Suggested Price", f"${buy_price_info['suggested_price']:.2f}")
-                    with ai_price_col2:
-                        st.metric("Range Low", f"${buy_price_info['price_range_low']:.2f}")
-                    with ai_price_col3:
-                        st.metric("Range High", f"${buy_price_info['price_range_high']:.2f}")
-                    
-                    st.caption(f"💡 **Basis**: {buy_price_info['reasoning']} | Current: ${buy_price_info['current_price']:.2f}")
-                    
-                    st.markdown("---")
-                    
-                    # AI Insight
-                    st.markdown(f"##### 📈 AI Insight for {selected_ai_stock}")
-                    insight = ai.generate_stock_insight(selected_ai_stock_data)
-                    st.markdown(insight)
-                    
-                    st.markdown("---")
-                    
-                    # AI Recommendation
-                    st.markdown("##### 🎯 AI Recommendation")
-                    recommendation = ai.generate_recommendation(selected_ai_stock_data)
-                    
-                    # Display enhanced recommendation
-                    st.markdown(recommendation['summary'])
-                    
-                    st.markdown("---")
-                    
-                    # Score Explanation
-                    st.markdown("##### 📊 Score Explanation")
-                    score_explanation = ai.explain_score(selected_ai_stock_data)
-                    st.markdown(score_explanation)
+            render_ai_stock_analysis(stocks_by_symbol, filtered_symbols, selected_strategy, selected_period)
         else:
             st.markdown("""
             <div class="empty-state">
@@ -3036,13 +2757,13 @@ def main():
             - Automated strategy suggestions
             """)
     
-    with tab5:
+    if active_view == "⚖️ Compare Stocks":
         st.markdown("### ⚖️ Compare Stocks")
         st.markdown("Compare up to 3 stocks side-by-side to make informed investment decisions.")
         
         # Stock selection for comparison
         comparison_stocks = []
-        available_symbols = [s['symbol'] for s in filtered_stocks] if filtered_stocks else []
+        available_symbols = filtered_symbols
         
         if not available_symbols:
             st.warning("⚠️ No stocks available for comparison. Please adjust your filters first.")
@@ -3050,38 +2771,51 @@ def main():
             # Allow selection from filtered stocks or manual entry
             st.markdown("#### Select Stocks to Compare")
             
+            compare_options = [""] + available_symbols
             compare_col1, compare_col2, compare_col3 = st.columns(3)
             
             with compare_col1:
+                restore_widget_state("compare_stock1", compare_options)
                 stock1 = st.selectbox(
                     "Stock 1",
-                    options=[""] + available_symbols,
+                    options=compare_options,
                     key="compare_stock1"
                 )
+                remember_widget_state("compare_stock1")
                 if stock1:
-                    stock1_manual = st.text_input("Or enter symbol", key="compare_stock1_manual", value="").upper().strip()
+                    restore_widget_state("compare_stock1_manual")
+                    stock1_manual = st.text_input("Or enter symbol", key="compare_stock1_manual").upper().strip()
+                    remember_widget_state("compare_stock1_manual")
                     if stock1_manual:
                         stock1 = stock1_manual
             
             with compare_col2:
+                restore_widget_state("compare_stock2", compare_options)
                 stock2 = st.selectbox(
                     "Stock 2",
-                    options=[""] + available_symbols,
+                    options=compare_options,
                     key="compare_stock2"
                 )
+                remember_widget_state("compare_stock2")
                 if stock2:
-                    stock2_manual = st.text_input("Or enter symbol", key="compare_stock2_manual", value="").upper().strip()
+                    restore_widget_state("compare_stock2_manual")
+                    stock2_manual = st.text_input("Or enter symbol", key="compare_stock2_manual").upper().strip()
+                    remember_widget_state("compare_stock2_manual")
                     if stock2_manual:
                         stock2 = stock2_manual
             
             with compare_col3:
+                restore_widget_state("compare_stock3", compare_options)
                 stock3 = st.selectbox(
                     "Stock 3 (Optional)",
-                    options=[""] + available_symbols,
+                    options=compare_options,
                     key="compare_stock3"
                 )
+                remember_widget_state("compare_stock3")
                 if stock3:
-                    stock3_manual = st.text_input("Or enter symbol", key="compare_stock3_manual", value="").upper().strip()
+                    restore_widget_state("compare_stock3_manual")
+                    stock3_manual = st.text_input("Or enter symbol", key="compare_stock3_manual").upper().strip()
+                    remember_widget_state("compare_stock3_manual")
                     if stock3_manual:
                         stock3 = stock3_manual
             
@@ -3097,21 +2831,18 @@ def main():
                         comparison_data = []
                         search_period = st.session_state.get('period', selected_period)
                         search_interval = st.session_state.get('interval', selected_interval)
-                        compare_data_fetcher = DataFetcher()
+                        compare_data_fetcher = get_data_fetcher()
                         
                         for symbol in comparison_symbols:
                             try:
-                                # Fetch stock data
-                                stock_data = compare_data_fetcher.get_stock_data(
+                                # Fetch stock data with technical indicators
+                                stock_data = get_symbol_history(
                                     symbol, 
                                     period=search_period, 
                                     interval=search_interval
                                 )
                                 
-                                if stock_data is not None and not stock_data.empty:
-                                    # Calculate technical indicators
-                                    stock_data = compare_data_fetcher.calculate_technical_indicators(stock_data)
-                                    
+                                if stock_data is not None:
                                     # Get stock info
                                     stock_info = compare_data_fetcher.get_stock_info(symbol)
                                     
@@ -3129,15 +2860,15 @@ def main():
                                         }
                                     
                                     # Create stock data structure
-                                    latest = stock_data.iloc[-1]
-                                    current_price = float(latest['Close'])
+                                    current_price = float(stock_data['Close'].iloc[-1])
+                                    technicals = latest_technicals(stock_data, SEARCH_TECHNICAL_COLUMNS)
                                     
                                     compare_stock = {
                                         'symbol': symbol,
                                         'current_price': current_price,
-                                        'rsi': float(latest['RSI']) if not pd.isna(latest['RSI']) else None,
-                                        'momentum': float(latest['Momentum']) if not pd.isna(latest['Momentum']) else None,
-                                        'volume_ratio': float(latest['Volume_Ratio']) if not pd.isna(latest['Volume_Ratio']) else None,
+                                        'rsi': technicals['RSI'],
+                                        'momentum': technicals['Momentum'],
+                                        'volume_ratio': technicals['Volume_Ratio'],
                                         'market_cap': stock_info.get('market_cap', 0),
                                         'sector': stock_info.get('sector', 'Unknown'),
                                         'industry': stock_info.get('industry', 'Unknown'),
@@ -3227,7 +2958,7 @@ def main():
                             st.markdown("---")
                             st.markdown("#### 🤖 AI Insights Comparison")
                             
-                            ai = AIInsights()
+                            ai = get_ai_insights()
                             insight_cols = st.columns(num_stocks)
                             
                             for idx, stock in enumerate(comparison_data):
@@ -3236,7 +2967,7 @@ def main():
                                     insight = ai.generate_stock_insight(stock)
                                     st.markdown(insight)
     
-    with tab7:
+    if active_view == "💼 My Portfolio":
         st.markdown("### 💼 My Portfolio")
         
         auth = st.session_state.auth
@@ -3381,7 +3112,7 @@ def main():
                 - Early access to new features
                 """)
     
-    with tab8:
+    if active_view == "📚 How It Works":
         st.header("📚 Stock Selection Process Explained")
         
         st.markdown("""
@@ -3441,69 +3172,12 @@ def main():
         Higher scores indicate better investment opportunities.
         """)
         
-        # Create scoring breakdown
-        scoring_factors = [
-            {
-                "Factor": "Momentum (20-day)",
-                "Weight": "0-25 points",
-                "Description": "Measures price momentum over 20 days. Optimal range: 3-12% gain.",
-                "Best Case": "3-12% positive momentum = 25 points"
-            },
-            {
-                "Factor": "RSI (Relative Strength Index)",
-                "Weight": "0-20 points",
-                "Description": "Measures overbought/oversold conditions. Optimal range: 45-65.",
-                "Best Case": "RSI between 45-65 = 20 points"
-            },
-            {
-                "Factor": "Moving Average Trend",
-                "Weight": "0-20 points",
-                "Description": "Evaluates price position relative to moving averages. Prefers uptrends.",
-                "Best Case": "Price > SMA20 > SMA50 (strong uptrend) = 20 points"
-            },
-            {
-                "Factor": "MACD Signal",
-                "Weight": "0-15 points",
-                "Description": "Measures momentum and trend changes. Prefers bullish crossovers.",
-                "Best Case": "MACD > Signal and MACD > 0 = 15 points"
-            },
-            {
-                "Factor": "Volume Confirmation",
-                "Weight": "0-12 points",
-                "Description": "Confirms price movements with trading volume. Higher volume = stronger signal.",
-                "Best Case": "Volume ratio ≥ 1.5x = 12 points"
-            },
-            {
-                "Factor": "Volatility",
-                "Weight": "0-8 points",
-                "Description": "Measures price stability. Prefers moderate volatility (1.5-2.5% daily).",
-                "Best Case": "1.5-2.5% daily volatility = 8 points"
-            },
-            {
-                "Factor": "Momentum Consistency",
-                "Weight": "0-8 points",
-                "Description": "Checks if momentum is consistent across different time periods.",
-                "Best Case": "Consistent positive momentum = 8 points"
-            },
-            {
-                "Factor": "Bollinger Bands Position",
-                "Weight": "0-7 points",
-                "Description": "Evaluates price position within Bollinger Bands. Prefers middle-upper range.",
-                "Best Case": "Price in 30-70% of band range = 7 points"
-            }
-        ]
-        
-        scoring_df = pd.DataFrame(scoring_factors)
+        # Scoring breakdown
         st.dataframe(
-            scoring_df,
+            SCORING_FACTORS_DF,
             use_container_width=True,
             hide_index=True,
-            column_config={
-                "Factor": st.column_config.TextColumn("Factor", width="medium"),
-                "Weight": st.column_config.TextColumn("Max Points", width="small"),
-                "Description": st.column_config.TextColumn("Description", width="large"),
-                "Best Case": st.column_config.TextColumn("Best Case", width="medium")
-            }
+            column_config=SCORING_FACTORS_COLUMNS
         )
         
         st.markdown("---")
@@ -3567,45 +3241,7 @@ def main():
         The app includes several pre-configured strategy presets that adjust filtering criteria:
         """)
         
-        strategy_info = pd.DataFrame([
-            {
-                "Strategy": "Conservative",
-                "Market Cap": "≥ $50B",
-                "Volatility": "≤ 3%",
-                "Volume Ratio": "≥ 0.8x",
-                "Best For": "Risk-averse investors seeking stability"
-            },
-            {
-                "Strategy": "Aggressive",
-                "Market Cap": "≥ $5B",
-                "Volatility": "≤ 8%",
-                "Volume Ratio": "≥ 0.3x",
-                "Best For": "Risk-tolerant investors seeking growth"
-            },
-            {
-                "Strategy": "Momentum",
-                "Market Cap": "≥ $10B",
-                "Volatility": "≤ 6%",
-                "Volume Ratio": "≥ 1.0x",
-                "Best For": "Trend-following traders"
-            },
-            {
-                "Strategy": "Value",
-                "Market Cap": "≥ $20B",
-                "Volatility": "≤ 4%",
-                "Volume Ratio": "≥ 0.5x",
-                "Best For": "Value investors seeking undervalued stocks"
-            },
-            {
-                "Strategy": "Dividend Focus",
-                "Market Cap": "≥ $30B",
-                "Volatility": "≤ 3.5%",
-                "Volume Ratio": "≥ 0.6x",
-                "Best For": "Income-focused investors"
-            }
-        ])
-        
-        st.dataframe(strategy_info, use_container_width=True, hide_index=True)
+        st.dataframe(STRATEGY_PRESETS_DF, use_container_width=True, hide_index=True)
         
         st.markdown("""
         You can also create **custom filters** by enabling "Use custom filters" in the sidebar.
@@ -3643,21 +3279,7 @@ def main():
         
         # Configuration Info
         with st.expander("🔧 View Current Configuration"):
-            st.code(f"""
-# Current Filter Settings
-MIN_MARKET_CAP = ${config.MIN_MARKET_CAP:,}
-MIN_VOLUME = {config.MIN_VOLUME:,}
-MIN_PRICE = ${config.MIN_PRICE}
-MAX_PRICE = ${config.MAX_PRICE}
-MIN_RSI = {config.MIN_RSI}
-MAX_RSI = {config.MAX_RSI}
-MIN_DATA_POINTS = {config.MIN_DATA_POINTS}
-MAX_VOLATILITY = {config.MAX_VOLATILITY*100}%
-MIN_VOLUME_RATIO = {config.MIN_VOLUME_RATIO}x
-
-# Stock Universe Size
-TOTAL_STOCKS = {len(config.STOCK_UNIVERSE)}
-            """, language="python")
+            st.code(CONFIG_SUMMARY, language="python")
     
     # Enhanced Footer
     st.markdown("---")
@@ -3697,7 +3319,7 @@ TOTAL_STOCKS = {len(config.STOCK_UNIVERSE)}
 
 
     
-    with tab9:
+    if active_view == "⚖️ Legal":
         st.markdown("### ⚖️ Legal Information")
         
         legal_tab1, legal_tab2 = st.tabs(["Terms of Service", "Privacy Policy"])
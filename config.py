@@ -7,6 +7,7 @@ Contains all adjustable parameters for data fetching, stock selection, and tradi
 DATA_SOURCE = "yfinance"  # Using Yahoo Finance (free)
 LOOKBACK_PERIOD_DAYS = 252  # 1 year of trading days for analysis
 UPDATE_INTERVAL_HOURS = 1  # How often to refresh data
+PRICE_CACHE_MAX_ENTRIES = 256  # Price histories kept in memory (symbol/period/interval combinations)
 
 # Stock universe settings
 # Start with S&P 500 stocks (can be expanded)
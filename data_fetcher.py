@@ -6,9 +6,11 @@ Uses yfinance (Yahoo Finance) for free data access.
 import yfinance as yf
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import logging
+import threading
 import config
 from utils import retry_on_failure, rate_limit, setup_logging
 
@@ -16,6 +18,27 @@ from utils import retry_on_failure, rate_limit, setup_logging
 logger = setup_logging()
 
 
+def _rolling_windows(values: np.ndarray, window: int) -> np.ndarray:
+    """Full trailing windows of values as a (len - window + 1, window) view (empty if too short)."""
+    if len(values) < window:
+        return np.empty((0, window))
+    return np.lib.stride_tricks.sliding_window_view(values, window)
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling mean; NaN until a full window is available or when it contains a NaN."""
+    out = np.full(len(values), np.nan)
+    out[window - 1:] = _rolling_windows(values, window).mean(axis=1)
+    return out
+
+
+def _rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling sample standard deviation, with the same NaN rules as _rolling_mean."""
+    out = np.full(len(values), np.nan)
+    out[window - 1:] = _rolling_windows(values, window).std(axis=1, ddof=1)
+    return out
+
+
 class DataFetcher:
     """
     Handles fetching and processing stock market data from free sources.
@@ -24,8 +47,11 @@ class DataFetcher:
     
     def __init__(self):
         """Initialize the data fetcher."""
-        self.cache = {}  # Simple cache to avoid redundant API calls
+        # LRU cache of (data, fetched_at) to avoid redundant API calls. One fetcher is shared
+        # by every session and worker thread, so it is bounded and guarded by a lock
+        self.cache: "OrderedDict[str, tuple]" = OrderedDict()
         self.cache_timeout = timedelta(hours=config.UPDATE_INTERVAL_HOURS)
+        self._cache_lock = threading.Lock()
     
     @retry_on_failure(max_attempts=3, delay=1.0, backoff=2.0)
     @rate_limit(max_calls_per_minute=60)
@@ -49,11 +75,17 @@ class DataFetcher:
         try:
             # Check cache first
             cache_key = f"{symbol}_{period}_{interval}"
-            if cache_key in self.cache:
-                cached_data, cached_time = self.cache[cache_key]
-                if datetime.now() - cached_time < self.cache_timeout:
-                    logger.debug(f"Cache hit for {symbol}")
-                    return cached_data.copy()
+            with self._cache_lock:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    if datetime.now() - cached[1] < self.cache_timeout:
+                        self.cache.move_to_end(cache_key)
+                    else:
+                        del self.cache[cache_key]
+                        cached = None
+            if cached is not None:
+                logger.debug(f"Cache hit for {symbol}")
+                return cached[0].copy()
             
             # Fetch data from yfinance
             logger.debug(f"Fetching data for {symbol} ({period}, {interval})")
@@ -65,7 +97,7 @@ class DataFetcher:
                 return None
             
             # Store in cache
-            self.cache[cache_key] = (data.copy(), datetime.now())
+            self._store_in_cache(cache_key, data.copy())
             logger.debug(f"Successfully fetched and cached data for {symbol}")
             
             return data
@@ -74,6 +106,23 @@ class DataFetcher:
             logger.error(f"Error fetching data for {symbol}: {str(e)}", exc_info=True)
             return None
     
+    def _store_in_cache(self, cache_key: str, data: pd.DataFrame):
+        """Add a price history to the cache, dropping expired entries and then the least recently used."""
+        now = datetime.now()
+        with self._cache_lock:
+            self.cache[cache_key] = (data, now)
+            self.cache.move_to_end(cache_key)
+            expired = [key for key, (_, fetched_at) in self.cache.items() if now - fetched_at >= self.cache_timeout]
+            for key in expired:
+                del self.cache[key]
+            while len(self.cache) > config.PRICE_CACHE_MAX_ENTRIES:
+                self.cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Drop every cached price history (e.g. on a user-requested refresh)."""
+        with self._cache_lock:
+            self.cache.clear()
+    
     def get_multiple_stocks(
         self, 
         symbols: List[str], 
@@ -108,42 +157,53 @@ class DataFetcher:
         Returns:
             DataFrame with added technical indicator columns
         """
-        df = data.copy()
+        close = data['Close']
+        close_values = close.to_numpy(dtype=float)
+        volume_values = data['Volume'].to_numpy(dtype=float)
         
-        # Simple Moving Averages
-        df['SMA_20'] = df['Close'].rolling(window=20).mean()
-        df['SMA_50'] = df['Close'].rolling(window=50).mean()
-        df['SMA_200'] = df['Close'].rolling(window=200).mean()
+        # Rolling windows run on the raw arrays; the 20-day mean and std are shared
+        # between SMA 20 and the Bollinger Bands
+        sma_20 = _rolling_mean(close_values, 20)
+        std_20 = _rolling_std(close_values, 20)
         
         # Exponential Moving Averages
-        df['EMA_12'] = df['Close'].ewm(span=12, adjust=False).mean()
-        df['EMA_26'] = df['Close'].ewm(span=26, adjust=False).mean()
+        ema_12 = close.ewm(span=12, adjust=False).mean()
+        ema_26 = close.ewm(span=26, adjust=False).mean()
         
         # MACD (Moving Average Convergence Divergence)
-        df['MACD'] = df['EMA_12'] - df['EMA_26']
-        df['MACD_Signal'] = df['MACD'].ewm(span=9, adjust=False).mean()
-        df['MACD_Histogram'] = df['MACD'] - df['MACD_Signal']
-        
-        # RSI (Relative Strength Index)
-        df['RSI'] = self._calculate_rsi(df['Close'], period=14)
-        
-        # Bollinger Bands
-        df['BB_Middle'] = df['Close'].rolling(window=20).mean()
-        bb_std = df['Close'].rolling(window=20).std()
-        df['BB_Upper'] = df['BB_Middle'] + (bb_std * 2)
-        df['BB_Lower'] = df['BB_Middle'] - (bb_std * 2)
-        
-        # Volume indicators
-        df['Volume_SMA'] = df['Volume'].rolling(window=20).mean()
-        df['Volume_Ratio'] = df['Volume'] / df['Volume_SMA']
-        
-        # Price momentum (rate of change)
-        df['Momentum'] = df['Close'].pct_change(periods=config.MIN_MOMENTUM_DAYS)
+        macd = ema_12 - ema_26
+        macd_signal = macd.ewm(span=9, adjust=False).mean()
         
-        # Volatility (standard deviation of returns)
-        df['Volatility'] = df['Close'].pct_change().rolling(window=20).std()
+        volume_sma = _rolling_mean(volume_values, 20)
+        # Zero-volume windows (halted or illiquid symbols) give NaN/inf quietly, as pandas division does
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volume_ratio = volume_values / volume_sma
         
-        return df
+        # All indicator columns are added in one assign instead of one insert each
+        return data.assign(
+            # Simple Moving Averages
+            SMA_20=sma_20,
+            SMA_50=_rolling_mean(close_values, 50),
+            SMA_200=_rolling_mean(close_values, 200),
+            EMA_12=ema_12,
+            EMA_26=ema_26,
+            MACD=macd,
+            MACD_Signal=macd_signal,
+            MACD_Histogram=macd - macd_signal,
+            # RSI (Relative Strength Index)
+            RSI=self._calculate_rsi(close, period=14),
+            # Bollinger Bands
+            BB_Middle=sma_20,
+            BB_Upper=sma_20 + (std_20 * 2),
+            BB_Lower=sma_20 - (std_20 * 2),
+            # Volume indicators
+            Volume_SMA=volume_sma,
+            Volume_Ratio=volume_ratio,
+            # Price momentum (rate of change)
+            Momentum=close.pct_change(periods=config.MIN_MOMENTUM_DAYS),
+            # Volatility (standard deviation of returns)
+            Volatility=_rolling_std(close.pct_change().to_numpy(dtype=float), 20)
+        )
     
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
         """
@@ -156,14 +216,16 @@ class DataFetcher:
         Returns:
             Series with RSI values
         """
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        # Undefined changes (the first bar, gaps) count as neither gain nor loss
+        delta = np.nan_to_num(prices.diff().to_numpy(dtype=float))
+        gain = _rolling_mean(np.maximum(delta, 0.0), period)
+        loss = _rolling_mean(np.maximum(-delta, 0.0), period)
         
-        rs = gain / loss
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = gain / loss
         rsi = 100 - (100 / (1 + rs))
         
-        return rsi
+        return pd.Series(rsi, index=prices.index)
     
     @retry_on_failure(max_attempts=3, delay=1.0, backoff=2.0)
     @rate_limit(max_calls_per_minute=60)
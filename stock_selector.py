@@ -5,7 +5,7 @@ Applies various criteria to filter and rank stocks for trading.
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional
+from typing import List, Dict, NamedTuple, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from data_fetcher import DataFetcher
 import config
@@ -15,6 +15,47 @@ from utils import setup_logging
 logger = setup_logging()
 
 
+# Indicators whose latest values are kept on each stock dict for display
+TECHNICAL_COLUMNS = ('SMA_20', 'SMA_50', 'MACD', 'MACD_Signal', 'Volatility', 'BB_Upper', 'BB_Lower')
+
+
+def row_technicals(row: Dict, columns: Tuple[str, ...] = TECHNICAL_COLUMNS) -> Dict[str, Optional[float]]:
+    """Values of columns from a last-row dict as plain floats, None where missing or NaN."""
+    values = [row.get(column) for column in columns]
+    return {
+        column: (float(value) if value is not None and value == value else None)
+        for column, value in zip(columns, values)
+    }
+
+
+def latest_technicals(data: pd.DataFrame, columns: Tuple[str, ...] = TECHNICAL_COLUMNS) -> Dict[str, Optional[float]]:
+    """Last-row values of columns as plain floats, None where missing or NaN."""
+    return row_technicals(data.iloc[-1].to_dict(), columns)
+
+
+class StockArrays(NamedTuple):
+    """
+    Column arrays of the fields the stock list is filtered and summarized on.
+    
+    Entry i of every array describes stocks[i], so positions selected with a
+    mask index straight back into the list of full stock dicts.
+    """
+    scores: np.ndarray
+    sectors: np.ndarray
+    momentum: np.ndarray
+    buy_signals: np.ndarray
+
+
+def build_stock_arrays(stocks: List[Dict]) -> StockArrays:
+    """Build the StockArrays view of a stock list."""
+    return StockArrays(
+        scores=np.array([s['score'] for s in stocks], dtype=float),
+        sectors=np.array([s['sector'] for s in stocks], dtype=object),
+        momentum=np.array([s.get('momentum') for s in stocks], dtype=float),
+        buy_signals=np.array([s.get('buy_signal', False) for s in stocks], dtype=bool)
+    )
+
+
 class StockSelector:
     """
     Implements quantitative stock selection criteria.
@@ -143,6 +184,8 @@ class StockSelector:
                 'volume_ratio': float(data['Volume_Ratio'].iloc[-1]) if not pd.isna(data['Volume_Ratio'].iloc[-1]) else None,
                 'market_cap': info.get('market_cap', 0),
                 'sector': info.get('sector', 'Unknown'),
+                'buy_signal': False,  # Set by TradingStrategy; present so consumers can index it directly
+                'latest': data.iloc[-1].to_dict(),  # Last indicator row, shared with AIInsights
                 'data': data  # Store full data for strategy use
             }
             